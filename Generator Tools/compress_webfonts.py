@@ -8,70 +8,436 @@ Example:
         --unicode-range "U+0000-00FF" \
         --text-source test/data/passages.json
 
-The script requires `pyftsubset` (fonttools>=4) to be installed and on PATH.
+    python tools/compress_webfonts.py --jobs 8               # 8 pyftsubset processes
+    python tools/compress_webfonts.py --jobs 8 --in-process  # fontTools.subset in a process pool
+
+    # Slice fonts/ttf into latin/latin-ext/greek/cyrillic WOFF2 files in
+    # fonts/web and regenerate css/easytype.css with unicode-range rules.
+    python tools/compress_webfonts.py --split-subsets --jobs 4
+
+The script requires `pyftsubset` (fonttools>=4) to be installed and on PATH,
+or fontTools importable when --in-process is used.
 """
 from __future__ import annotations
 
 import argparse
+import collections
+import concurrent.futures
+import json
+import os
+import re
 import shutil
 import string
 import subprocess
 import sys
+import unicodedata
+from dataclasses import dataclass, replace
 from pathlib import Path
+from typing import Iterator, TextIO
+
+from output_sizes import collect_output_sizes
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "GoogleFonts" / "scripts"))
+
+from generate_packager_metadata import COMMON_SUBSETS, FAMILY_DATA, FAMILY_STYLES  # noqa: E402
 
 DEFAULT_UNICODE_RANGE = "U+0000-00FF"
 FONT_EXTENSIONS = (".ttf", ".otf", ".woff", ".woff2")
+JSON_EXTENSIONS = (".json", ".jsonl", ".ndjson")
+CORPUS_CHUNK_SIZE = 1 << 16
 
+# unicode-range values for the subsets we ship, as served by the Google
+# Fonts CSS API, so slices line up with what the packaged families declare.
+SUBSET_RANGES = {
+    "latin": (
+        "U+0000-00FF, U+0131, U+0152-0153, U+02BB-02BC, U+02C6, U+02DA, U+02DC, "
+        "U+0304, U+0308, U+0329, U+2000-206F, U+20AC, U+2122, U+2191, U+2193, "
+        "U+2212, U+2215, U+FEFF, U+FFFD"
+    ),
+    "latin-ext": (
+        "U+0100-02BA, U+02BD-02C5, U+02C7-02CC, U+02CE-02D7, U+02DD-02FF, U+0304, "
+        "U+0308, U+0329, U+1D00-1DBF, U+1E00-1E9F, U+1EF2-1EFF, U+2020, "
+        "U+20A0-20AB, U+20AD-20C0, U+2113, U+2C60-2C7F, U+A720-A7FF"
+    ),
+    "greek": "U+0370-0377, U+037A-037F, U+0384-038A, U+038C, U+038E-03A1, U+03A3-03FF",
+    "cyrillic": "U+0301, U+0400-045F, U+0490-0491, U+04B0-04B1, U+2116",
+    "cyrillic-ext": "U+0460-052F, U+1C80-1C8A, U+20B4, U+2DE0-2DFF, U+A640-A69F, U+FE2E-FE2F",
+    "greek-ext": "U+1F00-1FFF",
+    "vietnamese": (
+        "U+0102-0103, U+0110-0111, U+0128-0129, U+0168-0169, U+01A0-01A1, U+01AF-01B0, "
+        "U+0300-0301, U+0303-0304, U+0308-0309, U+0323, U+0329, U+1EA0-1EF9, U+20AB"
+    ),
+}
+# Slices cut by --split-subsets. Whatever the font maps outside all of them
+# goes into a per-style REMAINDER_SUBSET slice, so the slices together
+# always cover the whole cmap.
+SPLIT_SUBSETS = (*COMMON_SUBSETS, "cyrillic-ext", "greek-ext", "vietnamese")
+REMAINDER_SUBSET = "other"
+CSS_HEADER = """/*!
+ * EasyType Fonts
+ * © 2025 Andrzej Marczewski — SIL Open Font License 1.1
+ * Based on Noto Sans. Modifications: optical anchoring + spacing for neuro-inclusive readability.
+ */
+"""
 
-def build_character_set(text_files: list[Path]) -> str:
-    chars = set(string.printable)
+
+_STRING_STOP = re.compile(r'["\\]')
+_NON_SPACE = re.compile(r"\S")
+_STRING_DECODER = json.JSONDecoder(strict=False)
+
+
+def iter_json_strings(stream: TextIO, chunk_size: int = CORPUS_CHUNK_SIZE) -> Iterator[str]:
+    """Yield the string values of the JSON read from stream, skipping object keys.
+
+    Reads chunk_size characters at a time, so a corpus is never held in
+    memory whole. Concatenated documents are fine too, which covers JSONL.
+    """
+    raw: list[str] = []
+    in_string = escape = False
+    pending: str | None = None  # a finished string: a key if ':' comes next
+    while chunk := stream.read(chunk_size):
+        pos = 0
+        while pos < len(chunk):
+            if in_string:
+                if escape:
+                    raw.append(chunk[pos])
+                    escape = False
+                    pos += 1
+                    continue
+                match = _STRING_STOP.search(chunk, pos)
+                if match is None:
+                    raw.append(chunk[pos:])
+                    break
+                raw.append(chunk[pos:match.start()])
+                pos = match.end()
+                if match.group() == "\\":
+                    raw.append("\\")
+                    escape = True
+                    continue
+                pending = _STRING_DECODER.decode('"' + "".join(raw) + '"')
+                raw.clear()
+                in_string = False
+                continue
+            match = _NON_SPACE.search(chunk, pos)
+            if match is None:
+                break
+            char = match.group()
+            if pending is not None:
+                if char != ":":
+                    yield pending
+                pending = None
+            if char == '"':
+                in_string = True
+                pos = match.end()
+            else:
+                quote = chunk.find('"', match.end())
+                if quote < 0:
+                    break
+                pos = quote
+    if pending is not None:
+        yield pending
+
+
+def count_characters(text_files: list[Path]) -> collections.Counter[str]:
+    """Character frequencies across text_files.
+
+    JSON and JSONL files (by extension) contribute only their string
+    values; anything else counts as plain text. Files are streamed.
+    """
+    counts: collections.Counter[str] = collections.Counter()
     for file_path in text_files:
+        file_counts: collections.Counter[str] = collections.Counter()
         try:
-            chars.update(file_path.read_text(encoding="utf-8"))
-        except UnicodeDecodeError as exc:
+            with file_path.open(encoding="utf-8") as stream:
+                if file_path.suffix.lower() in JSON_EXTENSIONS:
+                    for value in iter_json_strings(stream):
+                        file_counts.update(value)
+                else:
+                    while chunk := stream.read(CORPUS_CHUNK_SIZE):
+                        file_counts.update(chunk)
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
             print(f"[warn] Could not read {file_path}: {exc}", file=sys.stderr)
+            continue
+        counts.update(file_counts)
+    return counts
+
+
+def build_character_set(counts: collections.Counter[str], min_count: int = 1) -> str:
+    """Printable ASCII plus every character counted at least min_count times."""
+    chars = set(string.printable)
+    for char, count in counts.items():
+        if count >= min_count and unicodedata.category(char) != "Cc":
+            chars.add(char)
     return "".join(sorted(chars))
 
 
-def subset_font(
-    source: Path,
-    dest: Path,
-    unicode_range: str,
-    chars: str | None,
-    layout_features: str,
-    drop_tables: tuple[str, ...],
-    passthrough_tables: tuple[str, ...],
-    no_hinting: bool,
-    desubroutinize: bool,
-    dry_run: bool,
-) -> None:
-    cmd = [
-        "pyftsubset",
+@dataclass(frozen=True)
+class SubsetOptions:
+    unicode_range: str
+    chars: str | None
+    layout_features: str
+    drop_tables: tuple[str, ...]
+    passthrough_tables: tuple[str, ...]
+    no_hinting: bool
+    desubroutinize: bool
+
+
+def subset_args(source: Path, dest: Path, options: SubsetOptions) -> list[str]:
+    """pyftsubset arguments, shared by the CLI and in-process paths."""
+    args = [
         str(source),
         f"--output-file={dest}",
         "--flavor=woff2",
         "--with-zopfli",
-        f"--layout-features={layout_features}",
+        f"--layout-features={options.layout_features}",
     ]
-    if drop_tables:
-        cmd.append(f"--drop-tables={','.join(drop_tables)}")
-    if passthrough_tables:
-        cmd.append(f"--passthrough-tables={','.join(passthrough_tables)}")
-    if no_hinting:
-        cmd.append("--no-hinting")
-    if desubroutinize:
-        cmd.append("--desubroutinize")
-    if chars:
-        cmd.append(f"--text={chars}")
+    if options.drop_tables:
+        args.append(f"--drop-tables={','.join(options.drop_tables)}")
+    if options.passthrough_tables:
+        args.append(f"--passthrough-tables={','.join(options.passthrough_tables)}")
+    if options.no_hinting:
+        args.append("--no-hinting")
+    if options.desubroutinize:
+        args.append("--desubroutinize")
+    if options.chars:
+        args.append(f"--text={options.chars}")
     else:
-        cmd.append(f"--unicodes={unicode_range}")
+        args.append(f"--unicodes={options.unicode_range}")
+    return args
+
 
-    print(f"[info] {' '.join(cmd)}")
+def parse_unicode_range(value: str) -> set[int]:
+    """Codepoints covered by a CSS unicode-range such as "U+0000-00FF, U+0131"."""
+    codepoints: set[int] = set()
+    for part in value.split(","):
+        part = part.strip().upper().removeprefix("U+")
+        if not part:
+            continue
+        start, _, end = part.partition("-")
+        codepoints.update(range(int(start, 16), int(end or start, 16) + 1))
+    return codepoints
+
+
+def format_unicode_range(codepoints: set[int]) -> str:
+    """The shortest CSS unicode-range listing exactly codepoints."""
+    parts: list[str] = []
+    ordered = sorted(codepoints)
+    start = 0
+    for index, codepoint in enumerate(ordered):
+        if index + 1 < len(ordered) and ordered[index + 1] == codepoint + 1:
+            continue
+        first = ordered[start]
+        parts.append(f"U+{first:04X}" if first == codepoint else f"U+{first:04X}-{codepoint:04X}")
+        start = index + 1
+    return ", ".join(parts)
+
+
+def temp_path(output: Path) -> Path:
+    """A temp file next to output, unique per font and per process."""
+    return output.with_name(f".{output.name}.{os.getpid()}.subset-temp.woff2")
+
+
+def subset_font(
+    source: Path,
+    options: SubsetOptions,
+    in_process: bool = False,
+    output: Path | None = None,
+) -> Path:
+    """Subset source to a temp file, then atomically move it to output.
+
+    output defaults to source, recompressing it in place. Module-level so
+    it can run in a process pool. Corpus subsets log how many glyphs the
+    GSUB closure of their characters kept.
+    """
+    output = output or source
+    dest = temp_path(output)
+    try:
+        if in_process:
+            from fontTools import subset
+
+            status = subset.main(subset_args(source, dest, options))
+            if status:
+                raise RuntimeError(f"fontTools.subset exited with status {status}")
+        else:
+            subprocess.run(["pyftsubset", *subset_args(source, dest, options)], check=True)
+        if options.chars:
+            from fontTools.ttLib import TTFont
+
+            with TTFont(dest, lazy=True) as font:
+                glyphs = font["maxp"].numGlyphs
+            print(
+                f"[info] {output.name}: {len(options.chars)} characters -> "
+                f"{glyphs} glyphs after GSUB closure"
+            )
+        os.replace(dest, output)
+    finally:
+        dest.unlink(missing_ok=True)
+    return output
+
+
+def subset_fonts(
+    tasks: list[tuple[Path, Path, SubsetOptions]],
+    jobs: int = 1,
+    in_process: bool = False,
+    dry_run: bool = False,
+) -> list[tuple[Path, BaseException]]:
+    """Run every (source, output, options) task, up to jobs at a time;
+    returns the failures.
+
+    pyftsubset runs are already separate processes, so threads drive
+    them. In-process subsetting uses a process pool instead, which skips
+    the interpreter startup and fontTools import for every font.
+    """
+    for source, output, options in tasks:
+        cmd = ["pyftsubset", *subset_args(source, temp_path(output), options)]
+        print(f"[info] {' '.join(cmd)}")
     if dry_run:
-        return
+        return []
+
+    executor: concurrent.futures.Executor
+    if in_process and jobs > 1:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=jobs)
+    else:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=jobs)
+    failures: list[tuple[Path, BaseException]] = []
+    with executor:
+        futures = {
+            executor.submit(subset_font, source, options, in_process, output): output
+            for source, output, options in tasks
+        }
+        for future in concurrent.futures.as_completed(futures):
+            output = futures[future]
+            try:
+                future.result()
+                print(f"[ok] {output}")
+            except Exception as exc:
+                print(f"[error] {output}: {exc}", file=sys.stderr)
+                failures.append((output, exc))
+    return failures
+
+
+def split_tasks(
+    ttf_dir: Path, web_dir: Path, options: SubsetOptions
+) -> tuple[list[tuple[Path, Path, SubsetOptions]], list[dict]]:
+    """Plan one slice per family style and SPLIT_SUBSETS entry, plus a
+    REMAINDER_SUBSET slice for the codepoints none of them cover.
+
+    Slices whose range has no codepoint in the font's cmap are skipped so
+    the CSS never points at an empty file. Slices are always unhinted:
+    they only ever reach browsers. Returns the subset tasks and the
+    @font-face rules to write, in family/style/subset order.
+    """
+    from fontTools.ttLib import TTFont
+
+    tasks: list[tuple[Path, Path, SubsetOptions]] = []
+    faces: list[dict] = []
+    for family_name in FAMILY_DATA:
+        base = family_name.replace(" ", "")
+        for spec in FAMILY_STYLES:
+            source = ttf_dir / f"{base}-{spec['suffix']}.ttf"
+            if not source.exists():
+                print(f"[warn] Missing {source}; skipping.", file=sys.stderr)
+                continue
+            with TTFont(source, lazy=True) as font:
+                cmap = set(font.getBestCmap())
+            slices = [(subset, SUBSET_RANGES[subset]) for subset in SPLIT_SUBSETS]
+            remainder = cmap.difference(*(parse_unicode_range(r) for _, r in slices))
+            if remainder:
+                slices.append((REMAINDER_SUBSET, format_unicode_range(remainder)))
+            for subset, unicode_range in slices:
+                if not cmap & parse_unicode_range(unicode_range):
+                    continue
+                output = web_dir / f"{base}-{spec['suffix']}.{subset}.woff2"
+                slice_options = replace(
+                    options, unicode_range=unicode_range, chars=None, no_hinting=True
+                )
+                tasks.append((source, output, slice_options))
+                faces.append(
+                    {
+                        "family": family_name,
+                        "subset": subset,
+                        "woff2": output,
+                        "ttf": source,
+                        "weight": spec["weight"],
+                        "style": spec["style"],
+                        "unicode_range": unicode_range,
+                    }
+                )
+    return tasks, faces
+
 
-    subprocess.run(cmd, check=True)
-    shutil.move(dest, source)
+def uncovered_codepoints(faces: list[dict]) -> dict[Path, set[int]]:
+    """Codepoints of each source TTF that none of its written slices map."""
+    from fontTools.ttLib import TTFont
+
+    sliced: dict[Path, set[int]] = {}
+    for face in faces:
+        with TTFont(face["woff2"], lazy=True) as font:
+            sliced.setdefault(face["ttf"], set()).update(font.getBestCmap())
+    uncovered: dict[Path, set[int]] = {}
+    for source, codepoints in sliced.items():
+        with TTFont(source, lazy=True) as font:
+            missing = set(font.getBestCmap()) - codepoints
+        if missing:
+            uncovered[source] = missing
+    return uncovered
+
+
+def font_face_css(faces: list[dict], css_path: Path) -> str:
+    """The stylesheet for faces, with URLs relative to css_path."""
+
+    def url(path: Path) -> str:
+        return Path(os.path.relpath(path.resolve(), css_path.resolve().parent)).as_posix()
+
+    lines = [CSS_HEADER.rstrip("\n")]
+    family = None
+    for face in faces:
+        if face["family"] != family:
+            family = face["family"]
+            lines.extend(["", f"/* {family} */"])
+        lines.extend(
+            [
+                f"/* {face['subset']} */",
+                "@font-face {",
+                f"  font-family: '{face['family']}';",
+                f"  src: url('{url(face['woff2'])}') format('woff2'),",
+                f"       url('{url(face['ttf'])}') format('truetype');",
+                f"  font-weight: {face['weight']};",
+                f"  font-style: {face['style']};",
+                "  font-display: swap;",
+                f"  unicode-range: {face['unicode_range']};",
+                "}",
+            ]
+        )
+    return "\n".join(lines) + "\n"
+
+
+def write_css(faces: list[dict], css_path: Path) -> None:
+    css_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = css_path.with_name(f".{css_path.name}.{os.getpid()}.tmp")
+    tmp.write_text(font_face_css(faces, css_path), encoding="utf-8")
+    os.replace(tmp, css_path)
+
+
+def record_sizes(report_path: Path, outputs: list[Path]) -> None:
+    """Update the build report's "sizes" entries for outputs.
+
+    Uses the same accounting as font.py, so --compare-report sees subset
+    webfonts the same way it sees freshly built ones.
+    """
+    try:
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        report = {}
+    root = report_path.resolve().parent
+    report.setdefault("sizes", {}).update(
+        collect_output_sizes([str(path.resolve()) for path in outputs], str(root))
+    )
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = report_path.with_name(f".{report_path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, report_path)
 
 
 def main() -> None:
@@ -91,7 +457,19 @@ def main() -> None:
         "--text-source",
         action="append",
         type=Path,
-        help="Optional file whose text should define the glyph set (can be repeated).",
+        help="Optional file whose text should define the glyph set (can be repeated). "
+        "JSON/JSONL files contribute only their string values.",
+    )
+    parser.add_argument(
+        "--min-char-count",
+        type=int,
+        default=1,
+        help="Drop --text-source characters seen fewer times than this (default: 1).",
+    )
+    parser.add_argument(
+        "--char-report",
+        type=Path,
+        help="Write --text-source character frequencies to this JSON file.",
     )
     parser.add_argument(
         "--layout-features",
@@ -118,6 +496,42 @@ def main() -> None:
         action="store_true",
         help="Apply --desubroutinize to normalize CFF outlines before compression.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of fonts to subset concurrently (default: 1).",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Call fontTools.subset in worker processes instead of spawning pyftsubset per font.",
+    )
+    parser.add_argument(
+        "--split-subsets",
+        action="store_true",
+        help="Slice each family style from --ttf-dir into one unhinted WOFF2 per subset "
+        f"({', '.join(SPLIT_SUBSETS)}, plus '{REMAINDER_SUBSET}' for anything else) "
+        "in --fonts-dir and regenerate --css.",
+    )
+    parser.add_argument(
+        "--ttf-dir",
+        default="fonts/ttf",
+        type=Path,
+        help="Directory holding the full TTFs to slice with --split-subsets (default: fonts/ttf).",
+    )
+    parser.add_argument(
+        "--css",
+        default="css/easytype.css",
+        type=Path,
+        help="Stylesheet regenerated by --split-subsets (default: css/easytype.css).",
+    )
+    parser.add_argument(
+        "--report",
+        default="fonts/build_report.json",
+        type=Path,
+        help="Build report whose per-file sizes are updated (default: fonts/build_report.json).",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -125,38 +539,88 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    if shutil.which("pyftsubset") is None:
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1.")
+    if args.min_char_count < 1:
+        parser.error("--min-char-count must be at least 1.")
+    if args.in_process:
+        try:
+            import fontTools.subset  # noqa: F401
+        except ImportError:
+            parser.error("fontTools is not importable. Install fonttools to continue.")
+    elif shutil.which("pyftsubset") is None:
         parser.error("pyftsubset not found on PATH. Install fonttools to continue.")
 
     fonts_dir: Path = args.fonts_dir
-    if not fonts_dir.exists():
+    if args.split_subsets:
+        if args.text_source:
+            parser.error("--text-source cannot be combined with --split-subsets.")
+        if not args.ttf_dir.exists():
+            parser.error(f"TTF directory {args.ttf_dir} does not exist.")
+        fonts_dir.mkdir(parents=True, exist_ok=True)
+    elif not fonts_dir.exists():
         parser.error(f"Fonts directory {fonts_dir} does not exist.")
 
     text_files = args.text_source or []
-    chars = build_character_set(text_files) if text_files else None
-
-    font_files = [
-        path for path in fonts_dir.iterdir() if path.suffix.lower() in FONT_EXTENSIONS
-    ]
-    if not font_files:
-        parser.error(f"No fonts with extensions {FONT_EXTENSIONS} found in {fonts_dir}.")
-
-    temp_output = fonts_dir / ".subset-temp.woff2"
-    for font_path in font_files:
-        subset_font(
-            source=font_path,
-            dest=temp_output,
-            unicode_range=args.unicode_range,
-            chars=chars,
-            layout_features=args.layout_features,
-            drop_tables=tuple(part.strip() for part in args.drop_tables.split(",") if part.strip()),
-            passthrough_tables=tuple(
-                part.strip() for part in args.passthrough_tables.split(",") if part.strip()
-            ),
-            no_hinting=args.no_hinting,
-            desubroutinize=args.desubroutinize,
-            dry_run=args.dry_run,
+    counts = count_characters(text_files)
+    chars = build_character_set(counts, args.min_char_count) if text_files else None
+    if args.char_report and text_files:
+        args.char_report.write_text(
+            json.dumps(dict(counts.most_common()), ensure_ascii=False, indent=2) + "\n",
+            encoding="utf-8",
         )
+        print(f"[ok] {args.char_report}")
+
+    options = SubsetOptions(
+        unicode_range=args.unicode_range,
+        chars=chars,
+        layout_features=args.layout_features,
+        drop_tables=tuple(part.strip() for part in args.drop_tables.split(",") if part.strip()),
+        passthrough_tables=tuple(
+            part.strip() for part in args.passthrough_tables.split(",") if part.strip()
+        ),
+        no_hinting=args.no_hinting,
+        desubroutinize=args.desubroutinize,
+    )
+
+    if args.split_subsets:
+        tasks, faces = split_tasks(args.ttf_dir, fonts_dir, options)
+        if not tasks:
+            parser.error(f"No EasyType TTFs found in {args.ttf_dir}.")
+    else:
+        font_files = [
+            path for path in fonts_dir.iterdir() if path.suffix.lower() in FONT_EXTENSIONS
+        ]
+        if not font_files:
+            parser.error(f"No fonts with extensions {FONT_EXTENSIONS} found in {fonts_dir}.")
+        tasks = [(path, path, options) for path in sorted(font_files)]
+
+    failures = subset_fonts(
+        tasks, jobs=args.jobs, in_process=args.in_process, dry_run=args.dry_run,
+    )
+    if failures:
+        sys.exit(f"[error] {len(failures)} of {len(tasks)} fonts failed to subset.")
+    if not args.dry_run:
+        record_sizes(args.report, [output for _, output, _ in tasks])
+        print(f"[ok] {args.report}")
+    if args.split_subsets:
+        if args.dry_run:
+            print(f"[info] Would write {len(faces)} @font-face rules to {args.css}")
+            return
+        uncovered = uncovered_codepoints(faces)
+        for source, missing in uncovered.items():
+            print(
+                f"[error] {source.name}: {len(missing)} codepoints are in no slice: "
+                f"{format_unicode_range(missing)}",
+                file=sys.stderr,
+            )
+        if uncovered:
+            sys.exit(f"[error] {len(uncovered)} fonts are not fully covered by their slices.")
+        # Only rewrite the stylesheet once every slice it names exists.
+        write_css(faces, args.css)
+        print(f"[ok] {args.css}")
+        print(f"[done] Wrote {len(tasks)} subset slices.")
+        return
     print("[done] Fonts have been subset and recompressed.")
 
 
@@ -17,37 +17,102 @@ Requires:
   pip install fonttools requests
 Optional:
   brew install woff2 ttfautohint
+  pip install numpy                        # vectorized glyph transforms
+  pip install brotli                       # in-process WOFF2 encoding
 
 Usage:
   python3 font.py                          # build all families
   python3 font.py --family "EasyType Sans" # one family only
   python3 font.py --dry-run               # validate, no output
   python3 font.py --no-hint               # skip ttfautohint
+  python3 font.py --jobs 16               # one process per style build
+  python3 font.py --no-cache              # ignore .build_cache/, rebuild all
+  python3 font.py --fused-glyph-pass      # anchor, stem-shift and x-height in one pass
+  python3 font.py --hint-jobs 4           # concurrent ttfautohint processes
+  python3 font.py --woff2-jobs 4          # WOFF2 encoder workers (default 2)
+  python3 font.py --trace trace.json      # per-stage timeline (Perfetto / chrome://tracing)
   python3 font.py --version
 """
 
 from __future__ import annotations
 
 import argparse
+import array
 import concurrent.futures
+import contextlib
 import datetime as dt
 import enum
 import fractions
+import functools
+import hashlib
+import importlib
+import io
 import json
 import logging
 import os
+import pickle
 import shutil
+import struct
 import subprocess
+import sys
+import tempfile
+import threading
+import time
 import unicodedata
+import urllib.parse
 import zipfile
-from dataclasses import dataclass
-from typing import Any
+import zlib
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Iterable
+
+from output_sizes import SIZE_BUDGET_PCT, collect_output_sizes, size_regressions
+
+# fontTools, requests and numpy are imported where they are used, so
+# `--version`, `--help` and importing this module (tests, CI checks) do
+# not pay for them. `ft.TTFont` and `ft.requests` still resolve through
+# the module __getattr__ below.
+_LAZY_ATTRS = {
+    "TTFont":   ("fontTools.ttLib", "TTFont"),
+    "requests": ("requests", None),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = importlib.import_module(module)
+    if attr:
+        value = getattr(value, attr)
+    globals()[name] = value
+    return value
+
+
+_UNRESOLVED = object()
+np: Any = _UNRESOLVED  # numpy, or None when not installed; see _numpy()
+
+
+def _numpy() -> Any:
+    """numpy, imported on first use; None when it is not installed.
+
+    The vectorized glyph transforms use the module global np, which this
+    resolves; glyph transforms fall back to pure Python without it.
+    """
+    global np
+    if np is _UNRESOLVED:
+        try:
+            import numpy
+            np = numpy
+        except ImportError:
+            np = None
+    return np
 
-import requests
-from fontTools.pens.transformPen import TransformPen
-from fontTools.pens.ttGlyphPen import TTGlyphPen
-from fontTools.ttLib import TTFont
-from fontTools.ttLib.tables._g_l_y_f import GlyphCoordinates
+
+try:
+    import resource
+except ImportError:  # Windows — peak RSS is reported as None
+    resource = None
 
 # ─── Logging ──────────────────────────────────────────────────────────────────
 
@@ -62,9 +127,10 @@ BASECACHE         = os.path.join(REPO_ROOT, "base_fonts")
 OUT_TTF           = os.path.join(REPO_ROOT, "fonts", "ttf")
 OUT_WEB           = os.path.join(REPO_ROOT, "fonts", "web")
 BUILD_REPORT_PATH = os.path.join(REPO_ROOT, "fonts", "build_report.json")
-
-for _d in (BASECACHE, OUT_TTF, OUT_WEB):
-    os.makedirs(_d, exist_ok=True)
+PREV_REPORT_PATH  = os.path.join(REPO_ROOT, "fonts", "build_report.prev.json")
+BUILD_CACHE       = os.path.join(REPO_ROOT, ".build_cache")
+STAGE_CACHE       = os.path.join(BUILD_CACHE, "stages")
+HINT_CACHE        = os.path.join(BUILD_CACHE, "hints")
 
 # ─── Inter source ─────────────────────────────────────────────────────────────
 
@@ -72,6 +138,10 @@ INTER_RELEASE_URL = (
     "https://github.com/rsms/inter/releases/download/v4.1/Inter-4.1.zip"
 )
 INTER_ZIP_CACHE = os.path.join(BASECACHE, "Inter-4.1.zip")
+# SHA-256 of the release zip. Set it (or the INTER_SHA256 environment
+# variable) to pin the download; while it is None the first download that
+# passes a full CRC check is trusted and its hash recorded.
+INTER_ZIP_SHA256: str | None = None
 BASES = {
     "Regular":    "Inter-Regular.ttf",
     "Italic":     "Inter-Italic.ttf",
@@ -85,6 +155,10 @@ VERSION_DISPLAY = "1.1.0"
 VERSION_DECIMAL = "1.100"
 VERSION_STR     = f"EasyType v{VERSION_DISPLAY}"
 
+# Bump whenever the build pipeline itself changes output, so cached
+# artifacts from older builder code are never reused.
+BUILDER_REVISION = 2
+
 # ─── Families ─────────────────────────────────────────────────────────────────
 
 FAMILY_DISPLAY = {
@@ -250,30 +324,149 @@ ANCHOR_BASE_MAP: dict[str, str] = {
     "р":"p","с":"c","т":"t","у":"y","х":"x",
 }
 
-# ─── Runtime state ────────────────────────────────────────────────────────────
+# ─── Inter download ───────────────────────────────────────────────────────────
 
-FAMILY_METRICS: dict[str, dict[str, dict[str, int]]] = {}
+def _inter_pinned_sha256() -> str | None:
+    pinned = os.environ.get("INTER_SHA256") or INTER_ZIP_SHA256
+    return pinned.lower() if pinned else None
 
-# ─── Inter download ───────────────────────────────────────────────────────────
 
-def _inter_zip_is_valid() -> bool:
-    """Return True only if the cached zip exists and is a valid ZIP file."""
-    if not os.path.exists(INTER_ZIP_CACHE):
-        return False
+def _inter_sidecar_path() -> str:
+    return INTER_ZIP_CACHE + ".sha256"
+
+
+def _verify_inter_zip(path: str) -> str | None:
+    """Return the zip's SHA-256 if it passes verification, else None.
+
+    With a pinned hash only the hash is checked. Without one the archive
+    is CRC-tested entry by entry instead.
+    """
+    try:
+        digest = file_sha256(path)
+    except OSError:
+        return None
+    pinned = _inter_pinned_sha256()
+    if pinned:
+        if digest != pinned:
+            log.warning("Inter zip SHA-256 mismatch: got %s, expected %s", digest, pinned)
+            return None
+        return digest
     try:
-        with zipfile.ZipFile(INTER_ZIP_CACHE) as zf:
+        with zipfile.ZipFile(path) as zf:
             bad = zf.testzip()
             if bad:
-                log.warning("Cached Inter zip is corrupt (first bad file: %s)", bad)
-                return False
-        return True
+                log.warning("Inter zip is corrupt (first bad file: %s)", bad)
+                return None
     except zipfile.BadZipFile:
-        log.warning("Cached Inter zip is not a valid ZIP file")
+        log.warning("Inter zip is not a valid ZIP file")
+        return None
+    return digest
+
+
+def _record_inter_zip(digest: str) -> None:
+    """Remember that the cached zip, as it is now on disk, was verified."""
+    st = os.stat(INTER_ZIP_CACHE)
+    with open(_inter_sidecar_path(), "w", encoding="utf-8") as fh:
+        json.dump(
+            {"sha256": digest, "size": st.st_size, "mtime_ns": st.st_mtime_ns}, fh
+        )
+
+
+def _inter_zip_is_valid() -> bool:
+    """Return True only if the cached zip exists and passes verification.
+
+    A zip verified on an earlier run is recognised from its sidecar by
+    size and mtime alone; anything else is re-verified.
+    """
+    try:
+        st = os.stat(INTER_ZIP_CACHE)
+    except FileNotFoundError:
         return False
+    try:
+        with open(_inter_sidecar_path(), encoding="utf-8") as fh:
+            seen = json.load(fh)
+        pinned = _inter_pinned_sha256()
+        if (
+            (seen["size"], seen["mtime_ns"]) == (st.st_size, st.st_mtime_ns)
+            and (pinned is None or seen["sha256"] == pinned)
+        ):
+            return True
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    digest = _verify_inter_zip(INTER_ZIP_CACHE)
+    if digest is None:
+        return False
+    _record_inter_zip(digest)
+    return True
+
+
+def _inter_mirror_source() -> str | None:
+    """Local path of the Inter zip in INTER_MIRROR, if one is configured.
+
+    INTER_MIRROR may be a directory, a file:// URL of a directory or of
+    the zip itself, or an http(s) base URL (handled by the downloader).
+    """
+    mirror = os.environ.get("INTER_MIRROR")
+    if not mirror:
+        return None
+    from urllib.request import url2pathname
+
+    parsed = urllib.parse.urlparse(mirror)
+    if parsed.scheme in ("http", "https"):
+        return None
+    path = url2pathname(parsed.path) if parsed.scheme == "file" else mirror
+    if os.path.isdir(path):
+        path = os.path.join(path, os.path.basename(INTER_ZIP_CACHE))
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"INTER_MIRROR has no Inter zip: {path}")
+    return path
+
+
+def _inter_download_url() -> str:
+    mirror = os.environ.get("INTER_MIRROR", "")
+    if mirror.startswith(("http://", "https://")):
+        return mirror.rstrip("/") + "/" + os.path.basename(INTER_ZIP_CACHE)
+    return INTER_RELEASE_URL
+
+
+def _fetch_with_resume(url: str, part: str, attempts: int = 5) -> None:
+    """Download url into part, resuming from its current size.
+
+    Connection drops and timeouts resume with an HTTP Range request. A
+    server that ignores the range gets the file restarted from scratch.
+    """
+    import requests
+
+    for attempt in range(1, attempts + 1):
+        have    = os.path.getsize(part) if os.path.exists(part) else 0
+        headers = {"Range": f"bytes={have}-"} if have else {}
+        try:
+            with requests.get(url, stream=True, headers=headers, timeout=(10, 60)) as r:
+                if r.status_code == 416:
+                    return  # the part file already holds every byte
+                r.raise_for_status()
+                mode = "ab" if have and r.status_code == 206 else "wb"
+                if mode == "ab":
+                    log.info("Resuming Inter download at %d bytes", have)
+                elif have:
+                    log.info("Server ignored Range; restarting Inter download")
+                with open(part, mode) as fh:
+                    for chunk in r.iter_content(chunk_size=1 << 20):
+                        fh.write(chunk)
+            return
+        except (requests.ConnectionError, requests.Timeout) as exc:
+            if attempt == attempts:
+                raise
+            log.warning("Inter download interrupted (%s); retrying", exc)
+            time.sleep(min(2 ** attempt, 30))
 
 
 def download_inter_zip() -> str:
-    """Download Inter v4.1 release zip to BASECACHE if not already present and valid."""
+    """Fetch the Inter v4.1 release zip into BASECACHE unless already verified.
+
+    Sources, in order: INTER_MIRROR as a local directory or file:// URL,
+    then INTER_MIRROR as an http(s) base URL, then the GitHub release.
+    """
     if _inter_zip_is_valid():
         log.info("✓ Found cached Inter zip")
         return INTER_ZIP_CACHE
@@ -282,48 +475,167 @@ def download_inter_zip() -> str:
         log.warning("Removing corrupt/partial Inter zip cache")
         os.remove(INTER_ZIP_CACHE)
 
-    log.info("Downloading Inter v4.1…")
-    tmp = INTER_ZIP_CACHE + ".part"
+    tmp    = INTER_ZIP_CACHE + ".part"
+    source = _inter_mirror_source()
+    if source:
+        log.info("Copying Inter v4.1 from mirror %s…", source)
+        shutil.copyfile(source, tmp)
+    else:
+        log.info("Downloading Inter v4.1…")
+        _fetch_with_resume(_inter_download_url(), tmp)
+    # Verify before promoting to the final path
+    digest = _verify_inter_zip(tmp)
+    if digest is None:
+        os.remove(tmp)
+        raise RuntimeError("Downloaded Inter zip failed verification")
+    os.replace(tmp, INTER_ZIP_CACHE)
+    _record_inter_zip(digest)
+    if _inter_pinned_sha256() is None:
+        log.warning("Inter zip is not pinned; set INTER_ZIP_SHA256 = %r", digest)
+    log.info("✓ Downloaded → %s", INTER_ZIP_CACHE)
+    return INTER_ZIP_CACHE
+
+
+def _extracted_is_current(dest: str, info: zipfile.ZipInfo) -> bool:
+    """True if dest already holds exactly the bytes of the zip member."""
     try:
-        r = requests.get(INTER_RELEASE_URL, stream=True)
-        r.raise_for_status()
-        with open(tmp, "wb") as fh:
-            for chunk in r.iter_content(chunk_size=8192):
-                fh.write(chunk)
-        # Validate before promoting to final path
-        if not zipfile.is_zipfile(tmp):
-            raise RuntimeError("Downloaded file is not a valid ZIP")
-        os.replace(tmp, INTER_ZIP_CACHE)
-    except Exception:
+        if os.path.getsize(dest) != info.file_size:
+            return False
+        crc = 0
+        with open(dest, "rb") as fh:
+            for chunk in iter(lambda: fh.read(1 << 20), b""):
+                crc = zlib.crc32(chunk, crc)
+        return crc == info.CRC
+    except OSError:
+        return False
+
+
+def _extract_member(zf: zipfile.ZipFile, info: zipfile.ZipInfo, dest: str) -> None:
+    """Stream one member to dest. zipfile checks the CRC at end of stream."""
+    tmp = f"{dest}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with zf.open(info) as src, open(tmp, "wb") as out:
+            shutil.copyfileobj(src, out, 1 << 20)
+        os.replace(tmp, dest)
+    except BaseException:
         if os.path.exists(tmp):
             os.remove(tmp)
         raise
-    log.info("✓ Downloaded → %s", INTER_ZIP_CACHE)
-    return INTER_ZIP_CACHE
 
 
-def extract_base(style_filename: str) -> str:
-    """Extract one static Inter TTF from the release zip."""
-    dest = os.path.join(BASECACHE, style_filename)
-    if os.path.exists(dest):
-        log.info("✓ Found %s", style_filename)
-        return dest
+def extract_bases(style_filenames: Iterable[str]) -> dict[str, str]:
+    """Extract static Inter TTFs from the release zip in a single pass.
+
+    Opens the archive once and resolves every file from one index of
+    member basenames. Files already in BASECACHE are kept only if their
+    size and CRC match the zip; the rest are streamed out in parallel.
+    Returns {filename: path}.
+    """
+    wanted = list(dict.fromkeys(style_filenames))
+    dests  = {name: os.path.join(BASECACHE, name) for name in wanted}
+    if not os.path.exists(INTER_ZIP_CACHE) and all(map(os.path.exists, dests.values())):
+        # Nothing to check them against; keep offline rebuilds working.
+        log.info("✓ Found %s (Inter zip not cached, not re-checked)", ", ".join(wanted))
+        return dests
+
     with zipfile.ZipFile(download_inter_zip()) as zf:
-        match = next(
-            (e for e in zf.namelist()
-             if e.endswith(f"/{style_filename}") or e == style_filename),
-            None,
-        )
-        if match is None:
+        index: dict[str, zipfile.ZipInfo] = {}
+        for info in zf.infolist():
+            index.setdefault(info.filename.rsplit("/", 1)[-1], info)
+        missing = [name for name in wanted if name not in index]
+        if missing:
             available = [e for e in zf.namelist() if e.endswith(".ttf")]
             raise FileNotFoundError(
-                f"{style_filename} not found in Inter zip. "
+                f"{', '.join(missing)} not found in Inter zip. "
                 f"Available TTFs: {available}"
             )
-        with zf.open(match) as src, open(dest, "wb") as out:
-            out.write(src.read())
-    log.info("✓ Extracted %s", style_filename)
-    return dest
+        stale = []
+        for name in wanted:
+            if _extracted_is_current(dests[name], index[name]):
+                log.info("✓ Found %s", name)
+            else:
+                stale.append(name)
+        # ZipFile serialises reads of the shared handle; inflating the
+        # members (zlib releases the GIL) and writing them overlap.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(stale) or 1) as ex:
+            for name, _ in zip(stale, ex.map(
+                lambda n: _extract_member(zf, index[n], dests[n]), stale
+            )):
+                log.info("✓ Extracted %s", name)
+    return dests
+
+
+def extract_base(style_filename: str) -> str:
+    """Extract one static Inter TTF from the release zip."""
+    return extract_bases([style_filename])[style_filename]
+
+# ─── Base font pool ───────────────────────────────────────────────────────────
+
+# Tables build_one reads or rewrites. Only these are decompiled up front:
+# loading anything else would recompile it on save instead of passing the
+# original bytes through.
+POOL_TABLES = (
+    "GSUB", "GDEF", "STAT", "OS/2", "cmap", "glyf", "head", "hhea", "hmtx",
+    "loca", "maxp", "name", "post",
+)
+
+
+class BaseFontPool:
+    """Parse each base TTF once and hand out independent in-memory copies.
+
+    The first request for a path decompiles POOL_TABLES and pickles the
+    result; every copy is an unpickle of that blob, a deep copy that is
+    several times cheaper than re-parsing. Glyphs stay in their compact
+    binary form until a build touches them. Untouched tables are read
+    from an in-memory copy of the file.
+    """
+
+    def __init__(self) -> None:
+        self._lock    = threading.Lock()
+        self._entries: dict[str, tuple[tuple[int, int], bytes, bytes]] = {}
+
+    def _entry(self, path: str) -> tuple[bytes, bytes]:
+        st  = os.stat(path)
+        sig = (st.st_size, st.st_mtime_ns)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry[0] != sig:
+                from fontTools.ttLib import TTFont
+
+                with open(path, "rb") as fh:
+                    data = fh.read()
+                tt = TTFont(io.BytesIO(data))
+                for tag in POOL_TABLES:
+                    if tag in tt:
+                        tt[tag]
+                tt.reader = None
+                entry = (sig, data, pickle.dumps(tt, pickle.HIGHEST_PROTOCOL))
+                self._entries[path] = entry
+        return entry[1], entry[2]
+
+    def preload(self, paths: Any) -> None:
+        """Parse paths now, e.g. before forking worker processes."""
+        for path in paths:
+            self._entry(path)
+
+    def reader_for(self, path: str) -> Any:
+        """A fresh SFNT reader over the cached file bytes."""
+        from fontTools.ttLib import TTFont
+
+        data, _ = self._entry(path)
+        return TTFont(io.BytesIO(data)).reader
+
+    def get(self, path: str) -> TTFont:
+        """Return a private, mutable copy of the font at path."""
+        from fontTools.ttLib import TTFont
+
+        data, blob = self._entry(path)
+        tt = pickle.loads(blob)
+        tt.reader = TTFont(io.BytesIO(data)).reader
+        return tt
+
+
+BASE_FONTS = BaseFontPool()
 
 # ─── Low-level helpers ────────────────────────────────────────────────────────
 
@@ -342,6 +654,8 @@ def set_coords(
     flags: list[int],
 ) -> None:
     """Write coordinate data back to a glyph in place."""
+    from fontTools.ttLib.tables._g_l_y_f import GlyphCoordinates
+
     if len(coords) != len(flags):
         flags = list(flags) + [flags[-1]] * abs(len(coords) - len(flags))
     glyph.coordinates      = GlyphCoordinates(coords)
@@ -349,14 +663,121 @@ def set_coords(
     glyph.flags            = flags
 
 
+def transform_rounds(
+    glyf: Any, entries: list[tuple[str, Any]]
+) -> list[list[tuple[Any, Any]]]:
+    """Group (glyph name, parameter) work items into independent batches.
+
+    Only simple glyphs are kept: composite outlines are rebuilt from their
+    components by flatten_composites, so coordinates written to them are
+    never used. A glyph reached through several codepoints lands in
+    several rounds, so it is still transformed once per codepoint, in cmap
+    order, while each round touches any glyph at most once.
+    """
+    rounds: list[list[tuple[Any, Any]]] = []
+    visits: dict[str, int] = {}
+    for gname, param in entries:
+        g = glyf[gname]
+        if g.numberOfContours <= 0:
+            continue
+        n = visits.get(gname, 0)
+        visits[gname] = n + 1
+        if n == len(rounds):
+            rounds.append([])
+        rounds[n].append((g, param))
+    return rounds
+
+
+def coordinate_batch(glyphs: list[Any]) -> tuple[Any, Any]:
+    """Concatenate glyph coordinates into one (n, 2) float64 array.
+
+    Returns the batch and each glyph's point count. Coordinates are read
+    through GlyphCoordinates.array and converted, whatever its typecode.
+    """
+    arrays  = [np.asarray(g.coordinates.array, dtype=np.float64) for g in glyphs]
+    lengths = np.fromiter((len(a) // 2 for a in arrays), dtype=np.intp, count=len(arrays))
+    return np.concatenate(arrays).reshape(-1, 2), lengths
+
+
+def write_coordinate_batch(glyphs: list[Any], batch: Any, lengths: Any) -> None:
+    """Copy a transformed batch back into each glyph's coordinates."""
+    for glyph, chunk in zip(glyphs, np.split(batch, np.cumsum(lengths)[:-1])):
+        coords    = glyph.coordinates.array
+        coords[:] = array.array(coords.typecode, chunk.astype(coords.typecode).tobytes())
+
+
 def ensure_program(glyph: Any) -> None:
     """Attach an empty hinting program if the attribute is absent."""
     from fontTools.ttLib.tables.ttProgram import Program
     if not hasattr(glyph, "program") or glyph.program is None:
         glyph.program = Program()
 
+# ─── Codepoint classification ─────────────────────────────────────────────────
+
+ANCHOR_BLOCKS: tuple[tuple[int, int, str], ...] = (
+    (0x0000, 0x024F, "latin"),
+    (0x1E00, 0x1EFF, "latin"),
+    (0x0370, 0x03FF, "greek"),
+    (0x0400, 0x04FF, "cyrillic"),
+)
+
+
+@dataclass(frozen=True)
+class CodepointInfo:
+    """What the glyph passes need to know about one cmap codepoint."""
+    block:           str | None    # anchored script block, None outside them
+    base:            str           # base letter with diacritics stripped
+    lower:           bool
+    anchor_strength: float | None  # per-character strength, before family scale
+    micro_spacing:   float | None  # em delta from FONT_PARAMS["micro_spacing_em"]
+
+
+@functools.lru_cache(maxsize=None)
+def _unicode_facts(code: int) -> tuple[str | None, str, bool]:
+    ch    = chr(code)
+    block = next((name for lo, hi, name in ANCHOR_BLOCKS if lo <= code <= hi), None)
+    return block, get_base_letter(ch), ch.islower()
+
+
+@functools.lru_cache(maxsize=8)
+def _codepoint_index(
+    codes: frozenset[int], anchor_lc: tuple, anchor_uc: tuple, micro: tuple,
+) -> dict[int, CodepointInfo]:
+    anchor_lc, anchor_uc, micro = dict(anchor_lc), dict(anchor_uc), dict(micro)
+    index = {}
+    for code in codes:
+        ch                 = chr(code)
+        block, base, lower = _unicode_facts(code)
+        strength           = None
+        if block:
+            anchor_base = ANCHOR_BASE_MAP.get(ch, base)
+            strength    = anchor_lc.get(anchor_base) or anchor_uc.get(anchor_base)
+        index[code] = CodepointInfo(
+            block, base, lower, strength, micro.get(ch) or micro.get(base),
+        )
+    return index
+
+
+def codepoint_index(cmap: dict[int, str]) -> dict[int, CodepointInfo]:
+    """Classify every codepoint in a cmap, once per build process.
+
+    All styles share Inter's cmap, so the Unicode work is done for the
+    first style and the rest reuse it. The index is keyed on the current
+    anchor and micro-spacing tables as well, so edits to FONT_PARAMS are
+    picked up. Treat the result as read-only.
+    """
+    return _codepoint_index(
+        frozenset(cmap),
+        tuple(sorted(FONT_PARAMS["anchor_lc"].items())),
+        tuple(sorted(FONT_PARAMS["anchor_uc"].items())),
+        tuple(sorted(FONT_PARAMS["micro_spacing_em"].items())),
+    )
+
 # ─── GSUB disambiguation baking ──────────────────────────────────────────────
 
+BAKE_FEATURES = frozenset({"ss02", "cv05"})
+
+
 def verify_inter_gsub(tt: TTFont) -> None:
     """Confirm the base font is Inter and has expected GSUB features."""
     gsub = tt.get("GSUB")
@@ -376,24 +797,17 @@ def verify_inter_gsub(tt: TTFont) -> None:
         )
 
 
-def bake_disambiguation_defaults(
-    tt: TTFont,
-    feature_tags: frozenset[str] = frozenset({"ss02", "cv05"}),
-) -> None:
-    """Copy Inter's disambiguation alternates into the default glyph slots.
-
-    Inter's ss02 set has professionally drawn alternates for I (with serifs),
-    l (with foot curve), slashed zero, and other confusable glyphs. cv05
-    provides a distinct lowercase l. Baking them into the defaults means
-    every reader gets the benefit without needing CSS font-feature-settings.
-    """
+def bake_substitutions(
+    tt: TTFont, feature_tags: frozenset[str] = BAKE_FEATURES,
+) -> dict[str, str] | None:
+    """{default glyph: alternate} from the single substitutions of
+    feature_tags, in lookup order; None without a usable GSUB."""
     gsub = tt.get("GSUB")
     if not gsub:
-        log.warning("No GSUB — skipping disambiguation baking")
-        return
+        return None
     table = gsub.table
     if not table.FeatureList or not table.LookupList:
-        return
+        return None
 
     target_lookups: set[int] = set()
     for fr in table.FeatureList.FeatureRecord:
@@ -405,7 +819,28 @@ def bake_disambiguation_defaults(
         for sub in table.LookupList.Lookup[idx].SubTable:
             if hasattr(sub, "mapping"):
                 substitutions.update(sub.mapping)
+    return substitutions
+
+
+def bake_disambiguation_defaults(
+    tt: TTFont,
+    feature_tags: frozenset[str] = BAKE_FEATURES,
+) -> None:
+    """Copy Inter's disambiguation alternates into the default glyph slots.
 
+    Inter's ss02 set has professionally drawn alternates for I (with serifs),
+    l (with foot curve), slashed zero, and other confusable glyphs. cv05
+    provides a distinct lowercase l. Baking them into the defaults means
+    every reader gets the benefit without needing CSS font-feature-settings.
+    """
+    from fontTools.ttLib.tables._g_l_y_f import GlyphCoordinates
+
+    if not tt.get("GSUB"):
+        log.warning("No GSUB — skipping disambiguation baking")
+        return
+    substitutions = bake_substitutions(tt, feature_tags)
+    if substitutions is None:
+        return
     if not substitutions:
         log.warning("No SingleSubst mappings found in target GSUB lookups")
         return
@@ -455,8 +890,210 @@ def bake_disambiguation_defaults(
 
     log.info("✓ GSUB baking: %d promoted, %d skipped", baked, skipped)
 
+# ─── Layout pruning ───────────────────────────────────────────────────────────
+
+def layout_feature_tags(tt: TTFont) -> set[str]:
+    """Every feature tag in the font's GSUB and GPOS."""
+    tags: set[str] = set()
+    for tag in ("GSUB", "GPOS"):
+        if tag in tt and tt[tag].table.FeatureList:
+            tags.update(fr.FeatureTag for fr in tt[tag].table.FeatureList.FeatureRecord)
+    return tags
+
+
+def _unicodes(tt: TTFont) -> set[int]:
+    return set().union(*(t.cmap for t in tt["cmap"].tables if t.isUnicode()))
+
+
+def layout_prune_options(tt: TTFont, feature_tags: frozenset[str]) -> Any:
+    """fontTools.subset options keeping everything but feature_tags and
+    the glyphs only they reach."""
+    from fontTools import subset
+
+    options = subset.Options()
+    options.layout_features       = sorted(layout_feature_tags(tt) - feature_tags)
+    options.layout_scripts        = ["*"]
+    options.glyph_names           = True
+    options.notdef_outline        = True
+    options.legacy_kern           = True
+    options.symbol_cmap           = True
+    options.passthrough_tables    = True
+    options.drop_tables           = []
+    options.prune_unicode_ranges  = False
+    options.prune_codepage_ranges = False
+    options.recalc_average_width  = False
+    return options
+
+
+def subset_in_place(tt: TTFont, options: Any) -> None:
+    """Subset tt to the glyphs its Unicode cmaps reach under options.
+
+    Names are all kept, so the name table is set aside while subsetting:
+    name pruning walks every table in the font looking for name IDs, and
+    costs more than the rest of the subset.
+    """
+    from fontTools import subset
+
+    logging.getLogger("fontTools.subset").setLevel(logging.WARNING)
+    name = tt["name"]
+    del tt["name"]
+    try:
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(unicodes=_unicodes(tt))
+        subsetter.subset(tt)
+    finally:
+        tt["name"] = name
+
+
+def drop_baked_substitutions(tt: TTFont, baked: dict[str, str]) -> int:
+    """Remove what baking made redundant; returns the entries removed.
+
+    Substitutions from a baked default to the alternate it was baked from
+    are no-ops now, whichever feature they belong to, and cmap entries
+    for the alternate (Inter maps them into the PUA) get the default
+    instead, so nothing but other alternates keeps the old glyph alive.
+    """
+    removed = 0
+    for lookup in tt["GSUB"].table.LookupList.Lookup:
+        for sub in lookup.SubTable:
+            sub = getattr(sub, "ExtSubTable", sub)
+            mapping = getattr(sub, "mapping", None) or {}
+            for name in [n for n, alt in mapping.items() if baked.get(n) == alt]:
+                del mapping[name]
+                removed += 1
+            alternates = getattr(sub, "alternates", None) or {}
+            for name, alts in list(alternates.items()):
+                if baked.get(name) in alts:
+                    alts.remove(baked[name])
+                    removed += 1
+                    if not alts:
+                        del alternates[name]
+
+    defaults: dict[str, str] = {}
+    for default, alt in baked.items():
+        defaults.setdefault(alt, default)
+    for table in tt["cmap"].tables:
+        if table.isUnicode():
+            for code, name in list(table.cmap.items()):
+                if name in defaults:
+                    table.cmap[code] = defaults[name]
+                    removed += 1
+    return removed
+
+
+def prune_baked_layout(
+    tt: TTFont, feature_tags: frozenset[str] = BAKE_FEATURES,
+) -> None:
+    """Strip the baked features from the layout and compact it.
+
+    Runs after the glyph stages: drops feature_tags and the lookups only
+    they used, the no-op substitutions left behind (drop_baked_substitutions),
+    and every glyph the cmap no longer reaches through GSUB, then lets
+    fontTools.subset renumber and prune GSUB, GPOS and GDEF to match.
+    Hinting, names and metrics are untouched.
+    """
+    if "GSUB" not in tt:
+        return
+    baked = bake_substitutions(tt, feature_tags)
+    if not baked:
+        return
+    lookups = len(tt["GSUB"].table.LookupList.Lookup)
+    removed = drop_baked_substitutions(tt, baked)
+    before  = len(tt.getGlyphOrder())
+    subset_in_place(tt, layout_prune_options(tt, feature_tags))
+    log.info(
+        "✓ Layout: %s dropped, %d redundant entries, %d → %d lookups, %d → %d glyphs",
+        "/".join(sorted(feature_tags)), removed,
+        lookups, len(tt["GSUB"].table.LookupList.Lookup),
+        before, len(tt.getGlyphOrder()),
+    )
+
+
+# Tables that decide which glyphs prune_baked_layout keeps.
+LAYOUT_CLOSURE_TABLES = frozenset({"GlyphOrder", "head", "maxp", "cmap", "GSUB"})
+
+
+def layout_retained_glyphs(
+    tt: TTFont, feature_tags: frozenset[str] = BAKE_FEATURES,
+) -> frozenset[str] | None:
+    """The glyphs prune_baked_layout keeps, by subsetting tt's layout only.
+
+    Every table but LAYOUT_CLOSURE_TABLES is dropped first, so no outline
+    is decompiled and components are not followed; the layout stage runs
+    after flatten_composites, so they no longer keep anything alive.
+    Consumes tt; returns None when there is nothing to prune.
+    """
+    from fontTools import subset
+
+    if "GSUB" not in tt:
+        return None
+    baked = bake_substitutions(tt, feature_tags)
+    if not baked:
+        return None
+    drop_baked_substitutions(tt, baked)
+    logging.getLogger("fontTools.subset").setLevel(logging.WARNING)
+    subsetter = subset.Subsetter(layout_prune_options(tt, feature_tags))
+    subsetter.populate(unicodes=_unicodes(tt))
+    tt.getGlyphOrder()  # read from post before post goes
+    for tag in set(tt.keys()) - LAYOUT_CLOSURE_TABLES:
+        del tt[tag]
+    subsetter.subset(tt)
+    return frozenset(tt.getGlyphOrder())
+
 # ─── Optical entry anchoring ──────────────────────────────────────────────────
 
+def _anchor_entries(tt: TTFont) -> list[tuple[str, float]]:
+    """(glyph name, per-character strength) for each cmap entry to anchor."""
+    cmap  = tt.getBestCmap() or {}
+    index = codepoint_index(cmap)
+    return [
+        (gname, index[code].anchor_strength)
+        for code, gname in cmap.items() if index[code].anchor_strength
+    ]
+
+
+def _anchor_points(
+    coords: Any, s: float, entry_band: float
+) -> list[tuple[int, int]]:
+    """Tapered leftward shift of the points inside the entry band."""
+    xs    = [x for x, _ in coords]
+    x_min = min(xs)
+    width = max(1, max(xs) - x_min)
+    return [
+        (
+            int(x - s * (1.0 - (x - x_min) / width / entry_band) * width)
+            if (x - x_min) / width <= entry_band
+            else x,
+            y,
+        )
+        for x, y in coords
+    ]
+
+
+def _anchor_vectorized(
+    glyf: Any, entries: list[tuple[str, float]],
+    entry_band: float, global_strength: float,
+) -> int:
+    """NumPy version of the anchoring loop; same float ops, same truncation."""
+    affected = 0
+    for batch in transform_rounds(glyf, entries):
+        glyphs       = [g for g, _ in batch]
+        pts, lengths = coordinate_batch(glyphs)
+        starts = np.cumsum(lengths) - lengths
+        xs     = pts[:, 0]
+        x_min  = np.minimum.reduceat(xs, starts)
+        width  = np.maximum(1, np.maximum.reduceat(xs, starts) - x_min)
+        s      = np.array([strength for _, strength in batch]) * global_strength
+        x_min, width, s = (np.repeat(a, lengths) for a in (x_min, width, s))
+        rel    = (xs - x_min) / width
+        # + 0.0 turns trunc's -0.0 into the 0 that int() produces
+        shifted = np.trunc(xs - s * (1.0 - rel / entry_band) * width) + 0.0
+        pts[:, 0] = np.where(rel <= entry_band, shifted, xs)
+        write_coordinate_batch(glyphs, pts, lengths)
+        affected += len(batch)
+    return affected
+
+
 def apply_optical_anchor(
     tt: TTFont, entry_band: float, global_strength: float
 ) -> None:
@@ -465,27 +1102,17 @@ def apply_optical_anchor(
     Covers Latin, Latin-Extended, Greek, and Cyrillic. Each glyph is
     given a tapered leftward shift across the entry_band fraction of its
     width, scaled by the per-character strength from FONT_PARAMS.
+    Uses the NumPy batch path when numpy is installed.
     """
     glyf     = tt["glyf"]
-    cmap     = tt.getBestCmap() or {}
-    affected = 0
+    entries  = _anchor_entries(tt)
+    if _numpy() is not None:
+        affected = _anchor_vectorized(glyf, entries, entry_band, global_strength)
+        log.info("✓ Anchoring: %d glyphs (strength=%.2f)", affected, global_strength)
+        return
 
-    for code, gname in cmap.items():
-        ch = chr(code)
-        if not (
-            ("\u0000" <= ch <= "\u024F")
-            or ("\u1E00" <= ch <= "\u1EFF")
-            or ("\u0370" <= ch <= "\u03FF")
-            or ("\u0400" <= ch <= "\u04FF")
-        ):
-            continue
-        base     = ANCHOR_BASE_MAP.get(ch, get_base_letter(ch))
-        strength = (
-            FONT_PARAMS["anchor_lc"].get(base)
-            or FONT_PARAMS["anchor_uc"].get(base)
-        )
-        if not strength:
-            continue
+    affected = 0
+    for gname, strength in entries:
         g = glyf[gname]
         if not hasattr(g, "getCoordinates"):
             continue
@@ -493,19 +1120,7 @@ def apply_optical_anchor(
         if not coords:
             continue
 
-        s     = strength * global_strength
-        xs    = [x for x, _ in coords]
-        x_min = min(xs)
-        width = max(1, max(xs) - x_min)
-        new_coords = [
-            (
-                int(x - s * (1.0 - (x - x_min) / width / entry_band) * width)
-                if (x - x_min) / width <= entry_band
-                else x,
-                y,
-            )
-            for x, y in coords
-        ]
+        new_coords = _anchor_points(coords, strength * global_strength, entry_band)
         set_coords(g, new_coords, list(end_pts), list(flags))
         affected += 1
 
@@ -513,6 +1128,35 @@ def apply_optical_anchor(
 
 # ─── X-height scaling ─────────────────────────────────────────────────────────
 
+def _xheight_points(
+    coords: Any, factor: float, xheight_y: int, delta_y: int
+) -> list[tuple[int, int]]:
+    """Scale y inside (0, xheight_y]; translate everything above it."""
+    return [
+        (x, int(round(y * factor)) if 0 < y <= xheight_y
+         else y + delta_y if y > xheight_y
+         else y)
+        for x, y in coords
+    ]
+
+
+def _xheight_vectorized(
+    glyf: Any, entries: list[tuple[str, None]],
+    factor: float, xheight_y: int, delta_y: int,
+) -> None:
+    """NumPy version of the x-height mapping; np.round rounds half to even
+    exactly like round()."""
+    for batch in transform_rounds(glyf, entries):
+        glyphs       = [g for g, _ in batch]
+        pts, lengths = coordinate_batch(glyphs)
+        ys = pts[:, 1]
+        pts[:, 1] = np.where(
+            (ys > 0) & (ys <= xheight_y), np.round(ys * factor),
+            np.where(ys > xheight_y, ys + delta_y, ys),
+        )
+        write_coordinate_batch(glyphs, pts, lengths)
+
+
 def raise_xheight(tt: TTFont, factor: float) -> None:
     """Scale only the x-height zone; translate ascenders by the same delta.
 
@@ -530,34 +1174,168 @@ def raise_xheight(tt: TTFont, factor: float) -> None:
     new_xh  = int(round(xheight_y * factor))
     delta_y = new_xh - xheight_y
     glyf    = tt["glyf"]
+    cmap    = tt.getBestCmap() or {}
+    index   = codepoint_index(cmap)
+    entries = [(gname, None) for code, gname in cmap.items() if index[code].lower]
 
-    for code, gname in (tt.getBestCmap() or {}).items():
-        if not chr(code).islower():
-            continue
-        g = glyf[gname]
-        if not hasattr(g, "getCoordinates"):
-            continue
-        coords, end_pts, flags = g.getCoordinates(glyf)
-        if not coords:
-            continue
-        updated = [
-            (x, int(round(y * factor)) if 0 < y <= xheight_y
-             else y + delta_y if y > xheight_y
-             else y)
-            for x, y in coords
-        ]
-        set_coords(g, updated, list(end_pts), list(flags))
+    if _numpy() is not None:
+        _xheight_vectorized(glyf, entries, factor, xheight_y, delta_y)
+    else:
+        for gname, _ in entries:
+            g = glyf[gname]
+            if not hasattr(g, "getCoordinates"):
+                continue
+            coords, end_pts, flags = g.getCoordinates(glyf)
+            if not coords:
+                continue
+            updated = _xheight_points(coords, factor, xheight_y, delta_y)
+            set_coords(g, updated, list(end_pts), list(flags))
 
     os2.sxHeight = new_xh
     log.info("✓ x-height ×%.2f (ascenders translated, not scaled)", factor)
 
 
+def _outline_pass_vectorized(
+    glyphs: list[Any], anchors: list[list[float]], stems: list[list[tuple]],
+    raises: list[int], entry_band: float, stem_units: tuple[int, int, int],
+    xheight: tuple[float, int, int] | None,
+) -> None:
+    """NumPy kernel for apply_outline_transforms over one coordinate batch.
+
+    Per-glyph lists are applied in rounds over the whole batch: round k
+    only changes the glyphs that have a k-th operation of that kind.
+    """
+    from fontTools.ttLib.tables.ttProgram import Program
+
+    pts, lengths = coordinate_batch(glyphs)
+    starts = np.cumsum(lengths) - lengths
+
+    for k in range(max(map(len, anchors), default=0)):
+        active = np.array([len(a) > k for a in anchors])
+        s      = np.array([a[k] if len(a) > k else 0.0 for a in anchors])
+        xs     = pts[:, 0]
+        x_min  = np.minimum.reduceat(xs, starts)
+        width  = np.maximum(1, np.maximum.reduceat(xs, starts) - x_min)
+        x_min, width, s, active = (
+            np.repeat(a, lengths) for a in (x_min, width, s, active)
+        )
+        rel     = (xs - x_min) / width
+        shifted = np.trunc(xs - s * (1.0 - rel / entry_band) * width) + 0.0
+        pts[:, 0] = np.where(active & (rel <= entry_band), shifted, xs)
+
+    for i, glyph_stems in enumerate(stems):
+        if not glyph_stems:
+            continue
+        seg    = pts[starts[i]:starts[i] + lengths[i]]
+        coords = [tuple(p) for p in seg.tolist()]
+        for codepoint, position in glyph_stems:
+            if _stem_shift_point(coords, codepoint, position, *stem_units):
+                glyphs[i].program = Program()
+        seg[:] = coords
+
+    if xheight:
+        factor, xheight_y, delta_y = xheight
+        for k in range(max(raises, default=0)):
+            active = np.repeat(np.array([n > k for n in raises]), lengths)
+            ys     = pts[:, 1]
+            pts[:, 1] = np.where(
+                active & (ys > 0) & (ys <= xheight_y), np.round(ys * factor),
+                np.where(active & (ys > xheight_y), ys + delta_y, ys),
+            )
+
+    write_coordinate_batch(glyphs, pts, lengths)
+
+
+def apply_outline_transforms(
+    tt: TTFont, entry_band: float, anchor_strength: float, xheight_factor: float,
+) -> None:
+    """Anchor, stem-shift and raise the x-height in one pass over the glyphs.
+
+    Equivalent to apply_optical_anchor → apply_stem_shift_disambiguation →
+    raise_xheight. Each glyph's operations are collected first, in that
+    order, then run as a single kernel: one coordinate read and one write
+    per glyph instead of one per pass. With numpy the kernel runs over a
+    single batch of every affected glyph. Composite glyphs are skipped, as
+    flatten_composites rebuilds them from their transformed components.
+    """
+    from fontTools.ttLib.tables.ttProgram import Program
+
+    glyf    = tt["glyf"]
+    cmap    = tt.getBestCmap() or {}
+    anchors: dict[str, list[float]] = {}
+    stems:   dict[str, list[tuple[int, StemPosition]]] = {}
+    raises:  dict[str, int] = {}
+
+    for gname, strength in _anchor_entries(tt):
+        anchors.setdefault(gname, []).append(strength * anchor_strength)
+
+    stem_units = _stem_shift_units(tt)
+    if FONT_PARAMS["stem_shift"]["enabled"]:
+        for codepoint, position in STEM_SHIFT_MAP.items():
+            if codepoint not in cmap:
+                log.warning("StemShift: U+%04X not in cmap — skipped", codepoint)
+                continue
+            stems.setdefault(cmap[codepoint], []).append((codepoint, position))
+
+    xheight = None
+    if abs(xheight_factor - 1.0) >= 1e-3:
+        os2       = tt["OS/2"]
+        xheight_y = int(getattr(os2, "sxHeight", 0))
+        if xheight_y <= 0:
+            raise ValueError("OS/2.sxHeight must be positive before raise_xheight")
+        new_xh  = int(round(xheight_y * xheight_factor))
+        xheight = (xheight_factor, xheight_y, new_xh - xheight_y)
+        index = codepoint_index(cmap)
+        for code, gname in cmap.items():
+            if index[code].lower:
+                raises[gname] = raises.get(gname, 0) + 1
+        os2.sxHeight = new_xh
+
+    names = [
+        gname for gname in dict.fromkeys([*anchors, *stems, *raises])
+        if glyf[gname].numberOfContours > 0
+    ]
+    if _numpy() is not None and names:
+        _outline_pass_vectorized(
+            [glyf[n] for n in names],
+            [anchors.get(n, []) for n in names],
+            [stems.get(n, []) for n in names],
+            [raises.get(n, 0) for n in names],
+            entry_band, stem_units, xheight,
+        )
+    else:
+        for gname in names:
+            g   = glyf[gname]
+            pts = list(g.coordinates)
+            for s in anchors.get(gname, ()):
+                pts = _anchor_points(pts, s, entry_band)
+            for codepoint, position in stems.get(gname, ()):
+                if _stem_shift_point(pts, codepoint, position, *stem_units):
+                    g.program = Program()
+            for _ in range(raises.get(gname, 0)):
+                pts = _xheight_points(pts, *xheight)
+            set_coords(g, pts, list(g.endPtsOfContours), list(g.flags))
+
+    log.info(
+        "✓ Fused outline pass: %d glyphs (anchor=%.2f, x-height ×%.2f)",
+        len(names), anchor_strength, xheight_factor,
+    )
+
+
 def validate_proportions(tt: TTFont, family: str, style: str) -> None:
     """Halt the build if x-height scaling has broken ascender/descender ratios."""
-    os2  = tt["OS/2"]
-    xh   = int(os2.sxHeight)
-    asc  = int(os2.sTypoAscender)
-    desc = abs(int(os2.sTypoDescender))
+    os2 = tt["OS/2"]
+    check_proportions(
+        int(os2.sxHeight), int(os2.sTypoAscender), int(os2.sTypoDescender),
+        family, style,
+    )
+
+
+def check_proportions(
+    xh: int, asc: int, descender: int, family: str, style: str
+) -> None:
+    """Raise ValueError unless asc and |descender| clear the x-height ratios."""
+    desc = abs(descender)
     p    = FONT_PARAMS["proportions"]
     if asc < xh * p["ascender_xheight_ratio"]:
         raise ValueError(
@@ -574,6 +1352,53 @@ def validate_proportions(tt: TTFont, family: str, style: str) -> None:
 
 # ─── Stem-shift disambiguation ────────────────────────────────────────────────
 
+def _stem_shift_units(tt: TTFont) -> tuple[int, int, int]:
+    """(full shift, reduced shift, y tolerance) in font units."""
+    cfg = FONT_PARAMS["stem_shift"]
+    upm = tt["head"].unitsPerEm
+    return (
+        int(upm * cfg["shoulder_width"]),
+        int(upm * cfg["shoulder_width_reduced"]),
+        int(upm * cfg["y_tolerance"]),
+    )
+
+
+def _stem_shift_point(
+    coords: list[tuple[int, int]], codepoint: int, position: StemPosition,
+    shift_full: int, shift_reduced: int, tol: int,
+) -> bool:
+    """Move the extreme terminus point of one stem in coords, in place."""
+    ys = [y for _, y in coords]
+
+    # Find the cluster of points near the extreme y
+    extreme = max(ys) if position in (StemPosition.top_left, StemPosition.top_right) else min(ys)
+    cluster = [
+        (i, x, y) for i, (x, y) in enumerate(coords)
+        if abs(y - extreme) <= tol
+    ]
+    if not cluster:
+        log.warning("StemShift: no cluster found for U+%04X", codepoint)
+        return False
+
+    # b/p (bowl-side stems) get a reduced shift to compensate for the
+    # optical mass the bowl junction adds. q gets the full shift.
+    s = shift_reduced if position in (StemPosition.top_left, StemPosition.bottom_left) else shift_full
+
+    if position in (StemPosition.top_left, StemPosition.bottom_left):
+        ti, sx, sy = min(cluster, key=lambda t: t[1])
+        coords[ti] = (sx - s, sy)
+    else:
+        ti, sx, sy = max(cluster, key=lambda t: t[1])
+        coords[ti] = (sx + s, sy)
+
+    log.info(
+        "  ✓ StemShift [%s] U+%04X (%s) pt%d (%d,%d) → (%d,%d)  shift=%d",
+        position.value, codepoint, chr(codepoint),
+        ti, sx, sy, coords[ti][0], coords[ti][1], s,
+    )
+    return True
+
+
 def apply_stem_shift_disambiguation(tt: TTFont) -> None:
     """Shift the extreme terminus point of specific stems outward.
 
@@ -595,15 +1420,13 @@ def apply_stem_shift_disambiguation(tt: TTFont) -> None:
     if not cfg["enabled"]:
         return
 
+    from fontTools.ttLib.tables._g_l_y_f import GlyphCoordinates
     from fontTools.ttLib.tables.ttProgram import Program
 
-    cmap           = tt.getBestCmap() or {}
-    glyf           = tt["glyf"]
-    upm            = tt["head"].unitsPerEm
-    shift_full     = int(upm * cfg["shoulder_width"])
-    shift_reduced  = int(upm * cfg["shoulder_width_reduced"])
-    tol            = int(upm * cfg["y_tolerance"])
-    applied        = 0
+    cmap    = tt.getBestCmap() or {}
+    glyf    = tt["glyf"]
+    shift_full, shift_reduced, tol = _stem_shift_units(tt)
+    applied = 0
 
     for codepoint, position in STEM_SHIFT_MAP.items():
         glyph_name = cmap.get(codepoint)
@@ -619,37 +1442,12 @@ def apply_stem_shift_disambiguation(tt: TTFont) -> None:
 
         coords, end_pts, flags = glyph.getCoordinates(glyf)
         coords = list(coords)
-        ys     = [y for _, y in coords]
-
-        # Find the cluster of points near the extreme y
-        extreme = max(ys) if position in (StemPosition.top_left, StemPosition.top_right) else min(ys)
-        cluster = [
-            (i, x, y) for i, (x, y) in enumerate(coords)
-            if abs(y - extreme) <= tol
-        ]
-        if not cluster:
-            log.warning("StemShift: no cluster found for U+%04X", codepoint)
+        if not _stem_shift_point(
+            coords, codepoint, position, shift_full, shift_reduced, tol
+        ):
             continue
-
-        # b/p (bowl-side stems) get a reduced shift to compensate for the
-        # optical mass the bowl junction adds. q gets the full shift.
-        s = shift_reduced if position in (StemPosition.top_left, StemPosition.bottom_left) else shift_full
-
-        if position in (StemPosition.top_left, StemPosition.bottom_left):
-            ti, sx, sy = min(cluster, key=lambda t: t[1])
-            coords[ti] = (sx - s, sy)
-        else:
-            ti, sx, sy = max(cluster, key=lambda t: t[1])
-            coords[ti] = (sx + s, sy)
-
         glyph.coordinates = GlyphCoordinates(coords)
         glyph.program     = Program()
-
-        log.info(
-            "  ✓ StemShift [%s] U+%04X (%s) pt%d (%d,%d) → (%d,%d)  shift=%d",
-            position.value, codepoint, chr(codepoint),
-            ti, sx, sy, coords[ti][0], coords[ti][1], s,
-        )
         applied += 1
 
     log.info(
@@ -682,11 +1480,10 @@ def apply_micro_spacing(tt: TTFont, level: float) -> None:
     upm   = tt["head"].unitsPerEm
     cmap  = tt.getBestCmap() or {}
     hmtx  = tt["hmtx"].metrics
-    table = FONT_PARAMS["micro_spacing_em"]
+    index = codepoint_index(cmap)
     n     = 0
     for code, gname in cmap.items():
-        ch  = chr(code)
-        key = table.get(ch) or table.get(get_base_letter(ch))
+        key = index[code].micro_spacing
         if not key or gname not in hmtx:
             continue
         adv, lsb = hmtx[gname]
@@ -750,13 +1547,15 @@ def recompute_xavg(tt: TTFont) -> None:
         tt["OS/2"].xAvgCharWidth = int(round(sum(vals) / len(vals)))
 
 
-def post_hint_fixup(font_path: str) -> None:
-    """Apply final metric fixups after hinting."""
-    tt = TTFont(font_path)
+def post_hint_fixup(tt: TTFont) -> None:
+    """Apply final metric fixups after hinting.
+
+    tt must be parsed from compiled font data, so head's bounding box
+    reflects the final outlines.
+    """
     ensure_win_metrics(tt)
     recompute_xavg(tt)
     tt["head"].flags |= 1 << 3  # force ppem to integer
-    tt.save(font_path)
 
 # ─── Glyph utilities ──────────────────────────────────────────────────────────
 
@@ -775,35 +1574,14 @@ def ensure_minus_glyph(tt: TTFont) -> None:
     cmap = tt.getBestCmap() or {}
     if 0x2212 in cmap:
         return
-    order    = list(tt.getGlyphOrder())
+    glyf     = tt["glyf"]
     src_name = next(
-        (c for c in ("minus", "uni2212", "hyphen", "uni2010") if c in order),
+        (c for c in ("minus", "uni2212", "hyphen", "uni2010") if c in glyf),
         None,
     )
     if not src_name:
         return
-    glyf = tt["glyf"]
-    src  = glyf[src_name]
-    new  = src.__class__()
-    new.numberOfContours = src.numberOfContours
-    if src.numberOfContours >= 0:
-        coords, end_pts, flags = src.getCoordinates(glyf)
-        new.coordinates      = GlyphCoordinates(coords)
-        new.endPtsOfContours = list(end_pts)
-        new.flags            = list(flags)
-        ensure_program(new)
-        if hasattr(src, "program") and src.program is not None:
-            new.program = src.program
-    else:
-        new.components = list(src.components)
-    glyf["uni2212"] = new
-    order.append("uni2212")
-    tt.setGlyphOrder(order)
-    if src_name in tt["hmtx"].metrics:
-        tt["hmtx"].metrics["uni2212"] = tt["hmtx"].metrics[src_name]
-    for table in tt["cmap"].tables:
-        if table.isUnicode():
-            table.cmap[0x2212] = "uni2212"
+    clone_glyphs(tt, [(src_name, "uni2212", 0x2212)])
 
 
 def sync_space_nbspace(tt: TTFont) -> None:
@@ -849,14 +1627,9 @@ def sanitize_stat_table(tt: TTFont) -> None:
         log.info("✓ STAT: removed %d duplicates", len(values) - len(filtered))
 
 
-def clone_glyph(
-    tt: TTFont, src_name: str, dst_name: str, target_code: int
-) -> None:
-    """Clone a glyph outline to a new Unicode codepoint."""
-    glyf  = tt["glyf"]
-    order = list(tt.getGlyphOrder())
-    if dst_name in glyf or src_name not in glyf:
-        return
+def _copy_glyph(glyf: Any, src_name: str) -> Any:
+    from fontTools.ttLib.tables._g_l_y_f import GlyphCoordinates
+
     src = glyf[src_name]
     new = src.__class__()
     new.numberOfContours = src.numberOfContours
@@ -872,20 +1645,59 @@ def clone_glyph(
         new.components = list(src.components)
         if hasattr(src, "program"):
             new.program = src.program
-    glyf[dst_name] = new
-    order.append(dst_name)
-    tt.setGlyphOrder(order)
-    if src_name in tt["hmtx"].metrics:
-        tt["hmtx"].metrics[dst_name] = tt["hmtx"].metrics[src_name]
+    return new
+
+
+def clone_glyphs(
+    tt: TTFont, clones: Iterable[tuple[str, str, int]]
+) -> int:
+    """Clone glyph outlines to new Unicode codepoints in one batch.
+
+    `clones` holds (source glyph, new glyph name, target codepoint). Clones
+    whose new name already exists or whose source is missing are skipped,
+    and the first clone for a codepoint wins. The glyph order, hmtx and
+    every Unicode cmap subtable are updated once for the whole batch.
+    """
+    glyf    = tt["glyf"]
+    pending: dict[int, tuple[str, str]] = {}
+    names:   set[str] = set()
+    for src_name, dst_name, target_code in clones:
+        if (
+            target_code in pending or dst_name in names
+            or dst_name in glyf or src_name not in glyf
+        ):
+            continue
+        pending[target_code] = (src_name, dst_name)
+        names.add(dst_name)
+    if not pending:
+        return 0
+
+    new_glyphs = {dst: _copy_glyph(glyf, src) for src, dst in pending.values()}
+    tt.setGlyphOrder(list(tt.getGlyphOrder()) + list(new_glyphs))
+    glyf.glyphs.update(new_glyphs)
+    metrics = tt["hmtx"].metrics
+    for src_name, dst_name in pending.values():
+        if src_name in metrics:
+            metrics[dst_name] = metrics[src_name]
+    targets = {code: dst for code, (_, dst) in pending.items()}
     for table in tt["cmap"].tables:
         if table.isUnicode():
-            table.cmap[target_code] = dst_name
+            table.cmap.update(targets)
+    return len(pending)
+
+
+def clone_glyph(
+    tt: TTFont, src_name: str, dst_name: str, target_code: int
+) -> None:
+    """Clone a glyph outline to a new Unicode codepoint."""
+    clone_glyphs(tt, [(src_name, dst_name, target_code)])
 
 
 def ensure_case_pairs(tt: TTFont) -> None:
     """Clone missing upper/lowercase pairs for cmap completeness."""
-    cmap = tt.getBestCmap() or {}
-    for cp, gname in list(cmap.items()):
+    cmap   = tt.getBestCmap() or {}
+    clones = []
+    for cp, gname in cmap.items():
         ch  = chr(cp)
         upr = unicodedata.normalize("NFC", ch).upper()
         lwr = unicodedata.normalize("NFC", ch).lower()
@@ -893,7 +1705,8 @@ def ensure_case_pairs(tt: TTFont) -> None:
             continue
         for target in (ord(upr), ord(lwr)):
             if target != cp and target not in cmap:
-                clone_glyph(tt, gname, f"uni{target:04X}", target)
+                clones.append((gname, f"uni{target:04X}", target))
+    clone_glyphs(tt, clones)
 
 # ─── Composite flattening ─────────────────────────────────────────────────────
 
@@ -913,32 +1726,98 @@ def _compose_transforms(
     )
 
 
-def _draw_as_contours(
-    tt: TTFont, glyph_name: str, pen: TTGlyphPen,
-    transform: tuple[float, ...] = IDENTITY_TRANSFORM,
-) -> None:
-    glyph = tt["glyf"][glyph_name]
-    if glyph.isComposite():
-        for comp in glyph.components:
-            cname, ctrans = comp.getComponentInfo()
-            _draw_as_contours(
-                tt, cname, pen, _compose_transforms(transform, ctrans)
+class ComponentOutlineCache:
+    """Pen-normalised outlines of simple glyphs, drawn once per font.
+
+    Each entry is (points, flags, contours, integral): the points and flags
+    TTGlyphPen records for the glyph, a (start, end) range per contour,
+    and whether every coordinate is a whole number. The implied closing
+    point is kept, as whether it duplicates the contour start has to be
+    decided after the component transform, exactly as TTGlyphPen does.
+    """
+
+    def __init__(self, glyf: Any) -> None:
+        self.glyf     = glyf
+        self._entries: dict[str, tuple] = {}
+
+    def get(self, glyph_name: str) -> tuple:
+        entry = self._entries.get(glyph_name)
+        if entry is None:
+            from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+            pen = TTGlyphPen(None, outputImpliedClosingLine=True)
+            self.glyf[glyph_name].draw(pen, self.glyf)
+            starts   = [0] + [e + 1 for e in pen.endPts[:-1]]
+            integral = all(float(v).is_integer() for pt in pen.points for v in pt)
+            entry    = (pen.points, pen.types, list(zip(starts, pen.endPts)), integral)
+            self._entries[glyph_name] = entry
+        return entry
+
+    def flatten(self, glyph_name: str) -> Any:
+        """Draw a composite as a simple glyph, like TTGlyphPen would."""
+        from fontTools.misc.roundTools import otRound
+        from fontTools.ttLib.tables._g_l_y_f import Glyph, GlyphCoordinates
+        from fontTools.ttLib.tables.ttProgram import Program
+
+        points: list[tuple[float, float]] = []
+        types:  list[int] = []
+        ends:   list[int] = []
+        stack = [(glyph_name, IDENTITY_TRANSFORM)]
+        while stack:
+            name, transform = stack.pop()
+            glyph = self.glyf[name]
+            if glyph.isComposite():
+                stack.extend(
+                    (cname, _compose_transforms(transform, ctrans))
+                    for cname, ctrans in (
+                        comp.getComponentInfo()
+                        for comp in reversed(glyph.components)
+                    )
+                )
+                continue
+            src, flags, contours, integral = self.get(name)
+            xx, xy, yx, yy, dx, dy = transform
+            exact = (
+                integral and (xx, xy, yx, yy) == (1, 0, 0, 1)
+                and float(dx).is_integer() and float(dy).is_integer()
             )
-        return
-    used = pen if transform == IDENTITY_TRANSFORM else TransformPen(pen, transform)
-    glyph.draw(used, tt["glyf"])
+            if exact:
+                src = [(x + dx, y + dy) for x, y in src]
+            else:
+                src = [(xx*x + yx*y + dx, xy*x + yy*y + dy) for x, y in src]
+            for start, end in contours:
+                if src[start] == src[end]:
+                    end -= 1
+                contour = src[start:end + 1]
+                if not exact:
+                    contour = [(otRound(x), otRound(y)) for x, y in contour]
+                points.extend(contour)
+                types.extend(flags[start:end + 1])
+                ends.append(len(points) - 1)
+
+        new = Glyph()
+        new.coordinates      = GlyphCoordinates(points)
+        new.endPtsOfContours = ends
+        new.flags            = array.array("B", types)
+        new.numberOfContours = len(ends)
+        new.program          = Program()
+        new.program.fromBytecode(b"")
+        return new
 
 
 def flatten_composites(tt: TTFont) -> None:
-    """Replace all composite glyphs with simple contours before saving."""
-    glyf = tt["glyf"]
+    """Replace all composite glyphs with simple contours before saving.
+
+    Composites are flattened in glyph order, so a composite used as a
+    component by a later one has already been replaced by its contours.
+    """
+    glyf  = tt["glyf"]
+    cache = ComponentOutlineCache(glyf)
     for gname in tt.getGlyphOrder():
         g = glyf[gname]
         if not g.isComposite():
             continue
-        pen = TTGlyphPen(glyf)
-        _draw_as_contours(tt, gname, pen)
-        new = pen.glyph()
+        new = cache.flatten(gname)
         if hasattr(g, "program") and g.program is not None:
             new.program = g.program
         else:
@@ -966,9 +1845,10 @@ def capture_metrics_snapshot(tt: TTFont) -> dict[str, dict[str, int]]:
     return snap
 
 
-def apply_metrics_snapshot(tt: TTFont, family: str) -> None:
+def apply_metrics_snapshot(
+    tt: TTFont, snap: dict[str, dict[str, int]] | None
+) -> None:
     """Re-apply the Regular style's metrics to italic/bold variants."""
-    snap = FAMILY_METRICS.get(family)
     if not snap:
         return
     if "hhea" in tt and "hhea" in snap:
@@ -986,113 +1866,801 @@ def apply_metrics_snapshot(tt: TTFont, family: str) -> None:
 
 # ─── Hinting ──────────────────────────────────────────────────────────────────
 
-def auto_hint(in_path: str, out_path: str, enabled: bool = True) -> bool:
-    """Run ttfautohint when available and not disabled."""
+TTFAUTOHINT_ARGS = ("--windows-compatibility", "--symbol", "--no-info")
+
+# Tables ttfautohint reads, hashed whole for the hint cache key. Naming,
+# version and vertical-metric tables are left out so editing them reuses
+# the cached hints.
+HINT_INPUT_TABLES = ("glyf", "loca", "maxp", "hmtx", "cmap", "GSUB",
+                     "fpgm", "prep", "cvt ", "gasp")
+
+# Tables ttfautohint writes; these are taken from its output.
+HINT_OUTPUT_TABLES = ("glyf", "loca", "maxp", "fpgm", "prep", "cvt ", "gasp",
+                      "hdmx", "LTSH", "VDMX")
+
+
+def auto_hint(
+    font_data: bytes, label: str, enabled: bool = True
+) -> bytes | None:
+    """Run ttfautohint over a pipe when available and not disabled.
+
+    Returns the hinted font bytes, or None when hinting was skipped.
+    """
     if not enabled:
         log.info("→ Hinting skipped (--no-hint)")
-        return False
+        return None
     bin_path = shutil.which("ttfautohint")
     if not bin_path:
         log.warning("ttfautohint not found; skipping")
-        return False
+        return None
+    # With no file arguments ttfautohint reads stdin and writes stdout.
+    # HintQueue runs this from threads, which is only safe while nothing
+    # forks: a child forked with the stdin pipe open keeps its write end,
+    # and ttfautohint waits for EOF forever. Process pools must have all
+    # their workers before the first hint job (see start_pool_workers).
     result = subprocess.run(
-        [bin_path, "--windows-compatibility", "--symbol", "--no-info",
-         in_path, out_path],
-        capture_output=True, text=True, check=False,
+        [bin_path, *TTFAUTOHINT_ARGS],
+        input=font_data, capture_output=True, check=False,
     )
     if result.returncode != 0:
-        log.warning("ttfautohint failed: %s", result.stderr.strip())
-        return False
-    log.info("✓ Hinted → %s", os.path.basename(out_path))
-    return True
+        log.warning(
+            "ttfautohint failed: %s", result.stderr.decode(errors="replace").strip()
+        )
+        return None
+    log.info("✓ Hinted → %s", label)
+    return result.stdout
+
+
+def hint_cache_key(font_data: bytes) -> str:
+    """Hash of everything ttfautohint's output depends on for this font."""
+    from fontTools.ttLib import TTFont
+
+    tt = TTFont(io.BytesIO(font_data))
+    h  = hashlib.sha256()
+    for part in (
+        _tool_version("ttfautohint", "--version") or "",
+        " ".join(TTFAUTOHINT_ARGS),
+        f"upm={tt['head'].unitsPerEm} flags={tt['head'].flags}",
+        f"win={tt['OS/2'].usWinAscent},{tt['OS/2'].usWinDescent}",
+    ):
+        h.update(part.encode("utf-8") + b"\0")
+    for tag in HINT_INPUT_TABLES:
+        data = tt.reader[tag] if tag in tt.reader else b""
+        h.update(tag.encode("ascii") + len(data).to_bytes(8, "big") + data)
+    return h.hexdigest()
+
+
+def graft_hint_tables(tt: TTFont, hinted: bytes) -> None:
+    """Replace tt's hinting tables with ttfautohint's, from hinted.
+
+    Every other table keeps tt's contents, so hints cached from an earlier
+    build can be reused after naming or metric edits. Tables tt has not
+    loaded are copied as raw bytes; loaded ones (maxp, which post reads)
+    are replaced by their parsed counterparts.
+    """
+    from fontTools.ttLib import TTFont
+    from fontTools.ttLib.tables.DefaultTable import DefaultTable
+
+    src = TTFont(io.BytesIO(hinted), lazy=True)
+    for tag in HINT_OUTPUT_TABLES:
+        if tag in src.reader and tt.isLoaded(tag):
+            tt[tag] = src[tag]
+        elif tag in src.reader:
+            table      = DefaultTable(tag)
+            table.data = src.reader[tag]
+            tt[tag]    = table
+        elif tag in tt:
+            del tt[tag]
+    tt["head"].indexToLocFormat = src["head"].indexToLocFormat
+    # ttfautohint leaves the outlines alone, so the bounds already compiled
+    # into tt still hold; recalculating them would have to parse raw glyf.
+    tt.recalcBBoxes = False
+
+
+def hint_font_data(
+    font_data: bytes, label: str, cache_dir: str | None = None
+) -> bytes | None:
+    """ttfautohint's output for compiled font data, reusing cached output.
+
+    Returns None when hinting was skipped. Callers take only the hinting
+    tables from it (graft_hint_tables), so the result does not depend on
+    the state of the cache.
+    """
+    path = None
+    if cache_dir:
+        path = os.path.join(cache_dir, f"{hint_cache_key(font_data)}.ttf")
+    if path and os.path.exists(path):
+        with open(path, "rb") as fh:
+            hinted = fh.read()
+        log.info("✓ Hints cached → %s", label)
+        return hinted
+    hinted = auto_hint(font_data, label)
+    if hinted is not None and path:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as fh:
+            fh.write(hinted)
+        os.replace(tmp, path)
+    return hinted
 
 # ─── WOFF2 compression ────────────────────────────────────────────────────────
 
-def compress_to_woff2(ttf_path: str) -> None:
-    """Compress a TTF to WOFF2 when woff2_compress is available."""
+def _woff2_backend() -> str | None:
+    """Pick the WOFF2 encoder: "fonttools" (in-process) or "binary".
+
+    An explicit WOFF2_BIN always selects the binary. Otherwise fontTools is
+    used when brotli is importable, falling back to woff2_compress on PATH.
+    """
+    if os.environ.get("WOFF2_BIN"):
+        return "binary"
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        return "binary" if shutil.which("woff2_compress") else None
+    return "fonttools"
+
+
+def woff2_encoder_version() -> str | None:
+    """Version string of the active WOFF2 encoder, for cache keys."""
+    backend = _woff2_backend()
+    if backend == "fonttools":
+        import brotli
+        import fontTools
+        return f"fonttools {fontTools.version}, brotli {brotli.__version__}"
+    if backend == "binary":
+        return _tool_version(os.environ.get("WOFF2_BIN") or "woff2_compress")
+    return None
+
+
+def encode_woff2(font_data: bytes, out_woff: str) -> None:
+    """Encode TTF bytes to WOFF2 in-process with fontTools and brotli."""
+    from fontTools.ttLib import woff2
+
+    # woff2 logs every stream pair it processes at INFO.
+    logging.getLogger("fontTools.ttLib.woff2").setLevel(logging.WARNING)
+    buf = io.BytesIO()
+    woff2.compress(io.BytesIO(font_data), buf)
+    tmp = f"{out_woff}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(buf.getvalue())
+    os.replace(tmp, out_woff)
+
+
+def compress_to_woff2(ttf_path: str, font_data: bytes | None = None) -> None:
+    """Compress a TTF to WOFF2 in-process, or with woff2_compress.
+
+    `font_data` is the TTF as written to ttf_path; passing it lets the
+    in-process encoder skip reading the file back.
+    """
+    backend = _woff2_backend()
+    if backend is None:
+        log.warning("No WOFF2 encoder (pip install brotli, or woff2_compress); skipping")
+        return
+
+    ttf_base = os.path.basename(ttf_path)
+    out_woff = os.path.join(OUT_WEB, ttf_base.replace(".ttf", ".woff2"))
+
+    if backend == "fonttools":
+        if font_data is None:
+            with open(ttf_path, "rb") as fh:
+                font_data = fh.read()
+        encode_woff2(font_data, out_woff)
+        log.info("✓ WOFF2: %s", os.path.basename(out_woff))
+        return
+
+    # woff2_compress writes next to its input, so it runs on a private copy
+    # of the bytes to encode; these may be the web profile, not ttf_path.
     woff2_bin = os.environ.get("WOFF2_BIN") or shutil.which("woff2_compress")
-    if not woff2_bin:
-        log.warning("woff2_compress not found; skipping")
+    with tempfile.TemporaryDirectory(prefix="easytype-woff2-") as work_dir:
+        src       = os.path.join(work_dir, ttf_base)
+        generated = os.path.join(work_dir, ttf_base.replace(".ttf", ".woff2"))
+        try:
+            if font_data is None:
+                shutil.copyfile(ttf_path, src)
+            else:
+                with open(src, "wb") as fh:
+                    fh.write(font_data)
+            subprocess.run(
+                [woff2_bin, ttf_base], cwd=work_dir, check=True, capture_output=True
+            )
+            shutil.move(generated, out_woff)
+            log.info("✓ WOFF2: %s", os.path.basename(out_woff))
+        except subprocess.CalledProcessError as exc:
+            stderr = exc.stderr.decode() if isinstance(exc.stderr, bytes) else str(exc.stderr)
+            log.warning("woff2_compress failed: %s", stderr)
+        except FileNotFoundError:
+            log.warning("Generated .woff2 not found for %s", ttf_base)
+
+# ─── Web profile ──────────────────────────────────────────────────────────────
+
+# Features left out of webfonts: the baked ones now reproduce the defaults,
+# and browsers never apply aalt, which lists every alternate in the font.
+WEB_DROP_FEATURES = BAKE_FEATURES | {"aalt"}
+
+
+def web_font_data(font_data: bytes) -> bytes:
+    """The webfont variant of a finished, unhinted style.
+
+    TrueType instructions and glyph names are stripped, WEB_DROP_FEATURES
+    are left out, and only glyphs reachable from the cmap through the
+    remaining GSUB features are kept, so alternates that only a dropped
+    feature substituted are pruned. Metrics, names and every other
+    feature are unchanged.
+    """
+    from fontTools.ttLib import TTFont
+
+    tt      = TTFont(io.BytesIO(font_data))
+    # The layout stage's options, so both agree on which glyphs survive.
+    options = layout_prune_options(tt, WEB_DROP_FEATURES)
+    options.hinting     = False
+    options.glyph_names = False
+    before = len(tt.getGlyphOrder())
+    subset_in_place(tt, options)
+
+    buf = io.BytesIO()
+    tt.save(buf)
+    log.info(
+        "✓ Web profile: %d → %d glyphs, hinting stripped",
+        before, len(tt.getGlyphOrder()),
+    )
+    return buf.getvalue()
+
+# ─── Instrumentation ──────────────────────────────────────────────────────────
+
+def _peak_rss_mb() -> float | None:
+    """Peak resident set size of this process so far, in MiB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere.
+    return round(peak / (2**20 if sys.platform == "darwin" else 2**10), 1)
+
+
+@contextlib.contextmanager
+def measure_stage(samples: list[dict[str, Any]] | None, stage: str):
+    """Append wall time, thread CPU time and peak RSS of the block to samples.
+
+    CPU time is the calling thread's, so it stays per-style under a thread
+    pool; child processes such as ttfautohint are not included. Peak RSS
+    is the process-wide high-water mark when the stage ends.
+    """
+    if samples is None:
+        yield
         return
+    start, wall, cpu = time.time(), time.perf_counter(), time.thread_time()
+    try:
+        yield
+    finally:
+        samples.append({
+            "stage":       stage,
+            "start":       start,
+            "wall_s":      round(time.perf_counter() - wall, 4),
+            "cpu_s":       round(time.thread_time() - cpu, 4),
+            "peak_rss_mb": _peak_rss_mb(),
+            "pid":         os.getpid(),
+            "tid":         threading.get_ident(),
+        })
+
+
+def summarize_timings(samples: list[dict[str, Any]]) -> dict[str, Any]:
+    """Roll tagged stage samples up per stage, per style and per family."""
+    def add(total: dict[str, Any], sample: dict[str, Any]) -> None:
+        total["wall_s"] = round(total.get("wall_s", 0.0) + sample["wall_s"], 4)
+        total["cpu_s"]  = round(total.get("cpu_s", 0.0) + sample["cpu_s"], 4)
+        rss = [v for v in (total.get("peak_rss_mb"), sample["peak_rss_mb"]) if v is not None]
+        total["peak_rss_mb"] = max(rss) if rss else None
+
+    summary: dict[str, Any] = {}
+    for sample in samples:
+        fam   = summary.setdefault(sample["family"], {"styles": {}})
+        style = fam["styles"].setdefault(sample["style"], {"stages": {}})
+        add(style["stages"].setdefault(sample["stage"], {}), sample)
+        add(style, sample)
+        add(fam, sample)
+    for fam in summary.values():
+        fam["styles"] = {
+            s: fam["styles"][s] for s in STYLE_WEIGHTS if s in fam["styles"]
+        }
+    return summary
+
+
+def write_chrome_trace(samples: list[dict[str, Any]], path: str) -> None:
+    """Write stage samples as Chrome trace events (chrome://tracing, Perfetto)."""
+    origin = min((s["start"] for s in samples), default=0.0)
+    events: list[dict[str, Any]] = [
+        {"name": "process_name", "ph": "M", "pid": os.getpid(),
+         "args": {"name": "main"}},
+    ]
+    for s in samples:
+        events.append({
+            "name": s["stage"],
+            "cat":  s["family"],
+            "ph":   "X",
+            "ts":   round((s["start"] - origin) * 1e6),
+            "dur":  round(s["wall_s"] * 1e6),
+            "pid":  s["pid"],
+            "tid":  s["tid"],
+            "args": {
+                "family": s["family"], "style": s["style"],
+                "cpu_ms": round(s["cpu_s"] * 1e3, 1),
+                "peak_rss_mb": s["peak_rss_mb"],
+            },
+        })
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, fh)
+    log.info("✓ Trace → %s", path)
+
+# ─── Output sizes ─────────────────────────────────────────────────────────────
+
+def compare_reports(old_path: str, new_path: str, budget_pct: float) -> int:
+    """Log size changes between two build reports; 1 if any file is over budget."""
+    sizes = []
+    for path in (old_path, new_path):
+        try:
+            with open(path, encoding="utf-8") as fh:
+                sizes.append(json.load(fh).get("sizes", {}))
+        except (OSError, ValueError) as exc:
+            log.error("Cannot read build report %s: %s", path, exc)
+            return 1
+    old, new = sizes
+    for name in sorted(new.keys() & old.keys()):
+        before, after = old[name]["bytes"], new[name]["bytes"]
+        log.info("  %-44s %9d → %9d  (%+d)", name, before, after, after - before)
+    failures = size_regressions(old, new, budget_pct)
+    for failure in failures:
+        log.error("Size budget exceeded — %s", failure)
+    if not failures:
+        log.info("✓ %d files within the %g%% size budget",
+                 len(new.keys() & old.keys()), budget_pct)
+    return 1 if failures else 0
+
+def write_build_report(report: dict[str, Any], rotate: bool) -> None:
+    """Write BUILD_REPORT_PATH, first moving the old one to PREV_REPORT_PATH
+    when rotate is set so --compare-report has a baseline."""
+    os.makedirs(os.path.dirname(BUILD_REPORT_PATH), exist_ok=True)
+    if rotate and os.path.exists(BUILD_REPORT_PATH):
+        os.replace(BUILD_REPORT_PATH, PREV_REPORT_PATH)
+    with open(BUILD_REPORT_PATH, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+        fh.write("\n")
+    log.info("✓ Build report → %s", BUILD_REPORT_PATH)
+
+# ─── Build cache ──────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class BuildOptions:
+    hinting_enabled:  bool = True
+    use_cache:        bool = True
+    fused_glyph_pass: bool = False
+    # WOFF2s from the unhinted font via web_font_data, not the desktop TTF
+    web_profile:      bool = True
+
+
+@functools.lru_cache(maxsize=None)
+def _file_sha256(path: str, size: int, mtime_ns: int) -> str:
+    """Hash a file; size and mtime are part of the memo key, not the hash."""
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def file_sha256(path: str) -> str:
+    st = os.stat(path)
+    return _file_sha256(path, st.st_size, st.st_mtime_ns)
 
-    ttf_dir   = os.path.dirname(ttf_path)
-    ttf_base  = os.path.basename(ttf_path)
-    out_woff  = os.path.join(OUT_WEB, ttf_base.replace(".ttf", ".woff2"))
-    generated = os.path.join(ttf_dir, ttf_base.replace(".ttf", ".woff2"))
 
+@functools.lru_cache(maxsize=None)
+def _tool_version(name: str, version_flag: str | None = None) -> str | None:
+    """Identify an external tool so a tool upgrade invalidates the cache.
+
+    Uses `tool --version` where supported, otherwise the binary's path,
+    size and mtime. Returns None when the tool is not installed.
+    """
+    bin_path = shutil.which(name)
+    if not bin_path:
+        return None
+    if version_flag:
+        r = subprocess.run(
+            [bin_path, version_flag], capture_output=True, text=True, check=False
+        )
+        first = r.stdout.strip().splitlines()[:1]
+        if r.returncode == 0 and first:
+            return first[0]
+    st = os.stat(bin_path)
+    return f"{bin_path}:{st.st_size}:{st.st_mtime_ns}"
+
+
+def _stem_shift_map_inputs() -> dict[str, str]:
+    return {f"{cp:04X}": pos.value for cp, pos in STEM_SHIFT_MAP.items()}
+
+
+def build_cache_key(
+    src_path: str, family: str, style: str, cfg: FamilyConfig,
+    opts: BuildOptions,
+    metrics_snapshot: dict[str, dict[str, int]] | None,
+) -> str:
+    """Content hash of everything that determines one style's outputs."""
+    inputs = {
+        "builder":   BUILDER_REVISION,
+        "base":      file_sha256(src_path),
+        "family":    family,
+        "display":   FAMILY_DISPLAY.get(family, family),
+        "style":     style,
+        "weight":    STYLE_WEIGHTS[style],
+        "version":   VERSION_DECIMAL,
+        "config":    asdict(cfg),
+        "params":    FONT_PARAMS,
+        "stem_map":  _stem_shift_map_inputs(),
+        "anchor_map": ANCHOR_BASE_MAP,
+        "metrics":   metrics_snapshot,
+        "hint":      (_tool_version("ttfautohint", "--version")
+                      if opts.hinting_enabled else None),
+        "woff2":     woff2_encoder_version(),
+        "web":       sorted(WEB_DROP_FEATURES) if opts.web_profile else None,
+    }
+    blob = json.dumps(inputs, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def restore_cached_outputs(
+    key: str, out_ttf: str
+) -> tuple[dict[str, Any], dict[str, dict[str, int]] | None] | None:
+    """Copy a cached TTF/WOFF2 into place. Returns (report, snapshot) on a hit."""
+    entry = os.path.join(BUILD_CACHE, key)
+    meta_path = os.path.join(entry, "meta.json")
+    if not os.path.exists(meta_path):
+        return None
+    with open(meta_path, encoding="utf-8") as fh:
+        meta = json.load(fh)
+    ttf_name  = os.path.basename(out_ttf)
+    woff_name = ttf_name.replace(".ttf", ".woff2")
+    shutil.copyfile(os.path.join(entry, ttf_name), out_ttf)
+    if os.path.exists(os.path.join(entry, woff_name)):
+        shutil.copyfile(
+            os.path.join(entry, woff_name), os.path.join(OUT_WEB, woff_name)
+        )
+    log.info("✓ Cached → %s", ttf_name)
+    return meta["report"], meta["snapshot"]
+
+
+def store_cached_outputs(
+    key: str, out_ttf: str, report: dict[str, Any],
+    snapshot: dict[str, dict[str, int]] | None,
+) -> None:
+    """Save one style's outputs under its key; the entry appears atomically."""
+    entry = os.path.join(BUILD_CACHE, key)
+    if os.path.exists(entry):
+        return
+    tmp = f"{entry}.{os.getpid()}.tmp"
+    os.makedirs(tmp, exist_ok=True)
+    ttf_name  = os.path.basename(out_ttf)
+    woff_path = os.path.join(OUT_WEB, ttf_name.replace(".ttf", ".woff2"))
+    shutil.copyfile(out_ttf, os.path.join(tmp, ttf_name))
+    if os.path.exists(woff_path):
+        shutil.copyfile(woff_path, os.path.join(tmp, os.path.basename(woff_path)))
+    with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as fh:
+        json.dump({"report": report, "snapshot": snapshot}, fh, indent=2)
     try:
-        subprocess.run(
-            [woff2_bin, ttf_base], cwd=ttf_dir, check=True, capture_output=True
+        os.replace(tmp, entry)
+    except OSError:
+        # Another worker stored the same key first.
+        shutil.rmtree(tmp, ignore_errors=True)
+
+# ─── Build stages ─────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class StyleJob:
+    """Everything one style build reads besides its base font."""
+    family:           str
+    style_key:        str
+    style_label:      str
+    weight:           int
+    cfg:              FamilyConfig
+    metrics_snapshot: dict[str, dict[str, int]] | None = None
+    # Output-neutral, so deliberately absent from every stage's inputs
+    fused_glyph_pass: bool = False
+
+
+@dataclass(frozen=True)
+class BuildStage:
+    """One step of build_one.
+
+    inputs returns every parameter the stage reads; chained with the
+    previous stage's key it addresses the stage's output in the stage
+    cache. Only checkpoint stages snapshot their output, since each
+    snapshot costs a pickle and ~1 MB of disk per style.
+    """
+    name:       str
+    run:        Callable[[TTFont, StyleJob], None]
+    inputs:     Callable[[StyleJob], Any]
+    checkpoint: bool = False
+
+
+def _stage_anchor(tt: TTFont, job: StyleJob) -> None:
+    if job.fused_glyph_pass:
+        # One kernel per glyph covering anchor, stem-shift and x-height;
+        # the next two stages then have nothing left to do.
+        apply_outline_transforms(
+            tt, FONT_PARAMS["entry_band"],
+            job.cfg.anchor_strength, job.cfg.xheight_factor,
         )
-        shutil.move(generated, out_woff)
-        log.info("✓ WOFF2: %s", os.path.basename(out_woff))
-    except subprocess.CalledProcessError as exc:
-        stderr = exc.stderr.decode() if isinstance(exc.stderr, bytes) else str(exc.stderr)
-        log.warning("woff2_compress failed: %s", stderr)
-    except FileNotFoundError:
-        log.warning("Generated .woff2 not found for %s", ttf_base)
+    else:
+        apply_optical_anchor(tt, FONT_PARAMS["entry_band"], job.cfg.anchor_strength)
 
-# ─── Core build ───────────────────────────────────────────────────────────────
 
-def build_one(
-    src_path: str, out_path: str,
-    family: str, style_key: str, style_label: str, weight: int,
-    cfg: FamilyConfig, hinting_enabled: bool = True,
-) -> dict[str, Any]:
-    """Build one font style. Returns metrics for the build report."""
-    tt = TTFont(src_path)
+def _stage_stem_shift(tt: TTFont, job: StyleJob) -> None:
+    if job.fused_glyph_pass:
+        return  # done by _stage_anchor
+    apply_stem_shift_disambiguation(tt)
 
-    # 1. Bake Inter's built-in alternates (slashed zero, l-foot, I-serifs…)
-    bake_disambiguation_defaults(tt)
 
-    # 2. Optical entry anchoring (must run before stem-shift so the
-    #    shifted point is not treated as the new leftmost anchor target)
-    apply_optical_anchor(tt, FONT_PARAMS["entry_band"], cfg.anchor_strength)
+def _stage_xheight(tt: TTFont, job: StyleJob) -> None:
+    if job.fused_glyph_pass:
+        return  # done by _stage_anchor
+    raise_xheight(tt, job.cfg.xheight_factor)
 
-    # 3. Stem-shift disambiguation — move one point per glyph, no insertion
-    apply_stem_shift_disambiguation(tt)
 
-    # 4. X-height scaling (zone-only; ascenders translated, not scaled)
-    raise_xheight(tt, cfg.xheight_factor)
+def _stage_spacing(tt: TTFont, job: StyleJob) -> None:
+    apply_comfort_spacing(tt, job.cfg.letter_spacing, job.cfg.word_spacing)
+    apply_micro_spacing(tt, job.cfg.micro_level)
 
-    # 5. Spacing
-    apply_comfort_spacing(tt, cfg.letter_spacing, cfg.word_spacing)
-    apply_micro_spacing(tt, cfg.micro_level)
 
-    # 6. Metadata and cmap completeness
-    set_naming(tt, family, style_key, style_label, weight)
+def _stage_naming(tt: TTFont, job: StyleJob) -> None:
+    set_naming(tt, job.family, job.style_key, job.style_label, job.weight)
     ensure_minus_glyph(tt)
     remove_soft_hyphen(tt)
     sync_space_nbspace(tt)
     ensure_case_pairs(tt)
 
-    # 7. Structural cleanup
+
+def _stage_cleanup(tt: TTFont, job: StyleJob) -> None:
     flatten_composites(tt)
     sanitize_gdef_marks(tt)
     sanitize_stat_table(tt)
 
-    # 8. Lock in family-wide vertical metrics (Regular style sets the snapshot)
-    if FAMILY_METRICS.get(family):
-        apply_metrics_snapshot(tt, family)
 
-    # 9. Guard against proportion regressions
-    validate_proportions(tt, family, style_label)
+BUILD_STAGES: tuple[BuildStage, ...] = (
+    # 1. Bake Inter's built-in alternates (slashed zero, l-foot, I-serifs…)
+    BuildStage(
+        "bake",
+        lambda tt, job: bake_disambiguation_defaults(tt),
+        lambda job: sorted(BAKE_FEATURES),
+        checkpoint=True,
+    ),
+    # 2. Optical entry anchoring (must run before stem-shift so the
+    #    shifted point is not treated as the new leftmost anchor target)
+    BuildStage(
+        "anchor",
+        _stage_anchor,
+        lambda job: {
+            "entry_band": FONT_PARAMS["entry_band"],
+            "strength":   job.cfg.anchor_strength,
+            "lc":         FONT_PARAMS["anchor_lc"],
+            "uc":         FONT_PARAMS["anchor_uc"],
+            "base_map":   ANCHOR_BASE_MAP,
+        },
+    ),
+    # 3. Stem-shift disambiguation — move one point per glyph, no insertion
+    BuildStage(
+        "stem-shift",
+        _stage_stem_shift,
+        lambda job: {
+            "params": FONT_PARAMS["stem_shift"],
+            "map":    _stem_shift_map_inputs(),
+        },
+    ),
+    # 4. X-height scaling (zone-only; ascenders translated, not scaled)
+    BuildStage(
+        "x-height",
+        _stage_xheight,
+        lambda job: job.cfg.xheight_factor,
+        checkpoint=True,
+    ),
+    # 5. Spacing
+    BuildStage(
+        "spacing",
+        _stage_spacing,
+        lambda job: {
+            "letter": job.cfg.letter_spacing,
+            "word":   job.cfg.word_spacing,
+            "level":  job.cfg.micro_level,
+            "micro":  FONT_PARAMS["micro_spacing_em"],
+        },
+    ),
+    # 6. Metadata and cmap completeness
+    BuildStage(
+        "naming",
+        _stage_naming,
+        lambda job: {
+            "family":  job.family,
+            "display": FAMILY_DISPLAY.get(job.family, job.family),
+            "style":   [job.style_key, job.style_label, job.weight],
+            "version": VERSION_DECIMAL,
+        },
+    ),
+    # 7. Structural cleanup
+    BuildStage("cleanup", _stage_cleanup, lambda job: None, checkpoint=True),
+    # 8. Drop the baked features, their lookups and now-unreachable glyphs
+    BuildStage(
+        "layout",
+        lambda tt, job: prune_baked_layout(tt),
+        lambda job: sorted(BAKE_FEATURES),
+    ),
+    # 9. Lock in family-wide vertical metrics (Regular style sets the snapshot)
+    BuildStage(
+        "metrics",
+        lambda tt, job: apply_metrics_snapshot(tt, job.metrics_snapshot),
+        lambda job: job.metrics_snapshot,
+    ),
+    # 10. Guard against proportion regressions
+    BuildStage(
+        "validate",
+        lambda tt, job: validate_proportions(tt, job.family, job.style_label),
+        lambda job: FONT_PARAMS["proportions"],
+    ),
+)
+
+# ─── Stage cache ──────────────────────────────────────────────────────────────
+
+def stage_keys(src_path: str, job: StyleJob) -> list[str]:
+    """Chained key per stage: a stage's key covers every earlier stage too."""
+    key  = hashlib.sha256(
+        f"{BUILDER_REVISION}:{file_sha256(src_path)}".encode()
+    ).hexdigest()
+    keys = []
+    for stage in BUILD_STAGES:
+        blob = json.dumps(
+            [key, stage.name, stage.inputs(job)], sort_keys=True, ensure_ascii=False
+        )
+        key = hashlib.sha256(blob.encode("utf-8")).hexdigest()
+        keys.append(key)
+    return keys
+
+
+def _stage_snapshot_path(cache_dir: str, job: StyleJob, index: int, key: str) -> str:
+    style_dir = f"{job.family.replace(' ', '')}-{job.style_key}"
+    return os.path.join(
+        cache_dir, style_dir, f"{index:02d}-{BUILD_STAGES[index].name}-{key}.pkl.z"
+    )
+
+
+def save_stage_snapshot(tt: TTFont, path: str) -> None:
+    """Pickle the loaded tables; untouched tables stay in the base font."""
+    reader, tt.reader = tt.reader, None
+    try:
+        blob = zlib.compress(pickle.dumps(tt, pickle.HIGHEST_PROTOCOL), 1)
+    finally:
+        tt.reader = reader
+    folder = os.path.dirname(path)
+    os.makedirs(folder, exist_ok=True)
+    # One snapshot per stage and style: drop the ones for older inputs.
+    prefix = os.path.basename(path).rsplit("-", 1)[0] + "-"
+    for name in os.listdir(folder):
+        if name.startswith(prefix) and name != os.path.basename(path):
+            os.remove(os.path.join(folder, name))
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(blob)
+    os.replace(tmp, path)
+
+
+def load_stage_snapshot(path: str, src_path: str) -> TTFont:
+    with open(path, "rb") as fh:
+        tt = pickle.loads(zlib.decompress(fh.read()))
+    # Tables no stage touched were never loaded; serve them from the base.
+    tt.reader = BASE_FONTS.reader_for(src_path)
+    return tt
+
+
+def resume_from_stage_cache(
+    src_path: str, job: StyleJob, keys: list[str], cache_dir: str
+) -> tuple[TTFont, int]:
+    """Return the font after the last cached checkpoint and the next stage index."""
+    for index in reversed(range(len(BUILD_STAGES))):
+        if not BUILD_STAGES[index].checkpoint:
+            continue
+        path = _stage_snapshot_path(cache_dir, job, index, keys[index])
+        if os.path.exists(path):
+            log.info(
+                "✓ Resuming %s %s after stage '%s'",
+                job.family, job.style_label, BUILD_STAGES[index].name,
+            )
+            return load_stage_snapshot(path, src_path), index + 1
+    return BASE_FONTS.get(src_path), 0
 
-    # 10. Save → hint → post-fixup
-    tmp = out_path.replace(".ttf", "-tmp.ttf")
-    tt.save(tmp)
-    if not auto_hint(tmp, out_path, enabled=hinting_enabled):
-        shutil.move(tmp, out_path)
+# ─── Core build ───────────────────────────────────────────────────────────────
+
+def build_font(
+    src_path: str, job: StyleJob, stage_cache: str | None = None,
+    samples: list[dict[str, Any]] | None = None,
+) -> TTFont:
+    """Run BUILD_STAGES on a copy of the base font and return it unsaved.
+
+    With a stage_cache directory, the build resumes after the last
+    checkpoint whose inputs are unchanged. With a samples list, each
+    stage's timing is appended to it (see measure_stage).
+    """
+    with measure_stage(samples, "load"):
+        if stage_cache:
+            keys      = stage_keys(src_path, job)
+            tt, start = resume_from_stage_cache(src_path, job, keys, stage_cache)
+        else:
+            tt, start = BASE_FONTS.get(src_path), 0
+    for index in range(start, len(BUILD_STAGES)):
+        stage = BUILD_STAGES[index]
+        with measure_stage(samples, stage.name):
+            stage.run(tt, job)
+            if stage_cache and stage.checkpoint:
+                save_stage_snapshot(
+                    tt, _stage_snapshot_path(stage_cache, job, index, keys[index])
+                )
+    return tt
+
+
+def compile_font(tt: TTFont) -> bytes:
+    """Serialise a built font in memory, ready for hinting."""
+    buf = io.BytesIO()
+    tt.save(buf)
+    return buf.getvalue()
+
+
+def fixed_up_font(data: bytes) -> TTFont:
+    """Parse compiled font data and apply the post-hint fixups."""
+    from fontTools.ttLib import TTFont
+
+    final = TTFont(io.BytesIO(data))
+    post_hint_fixup(final)
+    return final
+
+
+def finish_font_data(
+    data: bytes, hinted: bytes | None = None
+) -> tuple[TTFont, bytes]:
+    """Fix up compiled data, graft in hinted's tables, and compile once.
+
+    The fixups only touch head, OS/2 and metrics, none of which ttfautohint
+    writes, so they can run on the unhinted data. Returns the final font
+    and its serialised bytes.
+    """
+    final = fixed_up_font(data)
+    if hinted is not None:
+        graft_hint_tables(final, hinted)
+    return final, compile_font(final)
+
+
+def finalize_font(
+    tt: TTFont, label: str, hinting_enabled: bool = True
+) -> tuple[TTFont, bytes]:
+    """Compile → hint → post-fixup in memory.
+
+    Returns the final font and its serialised bytes, so callers can write
+    and encode without reopening the file.
+    """
+    data   = compile_font(tt)
+    hinted = None
+    if hinting_enabled:
+        hinted = hint_font_data(data, label)
     else:
-        os.remove(tmp)
-    post_hint_fixup(out_path)
+        log.info("→ Hinting skipped (--no-hint)")
+    return finish_font_data(data, hinted)
+
+
+def write_font(tt: TTFont, out_path: str, hinting_enabled: bool = True) -> TTFont:
+    """Finalize tt and write it to out_path once; returns the final font."""
+    final, data = finalize_font(tt, os.path.basename(out_path), hinting_enabled)
+    with open(out_path, "wb") as fh:
+        fh.write(data)
     log.info("→ %s", os.path.basename(out_path))
+    return final
 
-    # 11. Collect report metrics
-    saved = TTFont(out_path)
-    os2   = saved["OS/2"]
+
+def style_report(tt: TTFont, cfg: FamilyConfig) -> dict[str, Any]:
+    """Collect build report metrics from a finished font."""
+    os2 = tt["OS/2"]
     return {
-        "glyph_count": len(saved.getGlyphOrder()),
+        "glyph_count": len(tt.getGlyphOrder()),
         "os2": {
             "xHeight":   int(os2.sxHeight),
             "ascender":  int(os2.sTypoAscender),
@@ -1106,6 +2674,217 @@ def build_one(
         },
     }
 
+
+def build_one(
+    src_path: str, out_path: str,
+    family: str, style_key: str, style_label: str, weight: int,
+    cfg: FamilyConfig, hinting_enabled: bool = True,
+    metrics_snapshot: dict[str, dict[str, int]] | None = None,
+    stage_cache: str | None = None,
+) -> dict[str, Any]:
+    """Build one font style. Returns metrics for the build report.
+
+    metrics_snapshot is the family's Regular vertical metrics; it is None
+    when building Regular itself.
+    """
+    job = StyleJob(family, style_key, style_label, weight, cfg, metrics_snapshot)
+    # 1–10. Glyph and table transforms, see BUILD_STAGES
+    tt  = build_font(src_path, job, stage_cache)
+    # 11. Save → hint → post-fixup
+    tt  = write_font(tt, out_path, hinting_enabled)
+    # 12. Collect report metrics
+    return style_report(tt, cfg)
+
+# ─── Dry run ──────────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class BaseFacts:
+    """What dry-run validation reads from one base font.
+
+    simple maps each non-empty simple glyph to its (yMin, yMax) from the
+    glyf header; composites maps each composite to its components as
+    (name, yy scale, y offset). sources maps baked default glyphs to the
+    alternate whose outline they receive, and raises counts how many
+    lowercase codepoints reach each glyph (raise_xheight transforms a
+    glyph once per codepoint). kept holds the glyphs the layout stage
+    keeps, or None when it prunes nothing.
+    """
+    os2:        dict[str, int]
+    hhea:       dict[str, int]
+    codepoints: frozenset[int]
+    simple:     dict[str, tuple[int, int]]
+    composites: dict[str, list[tuple[str, float, float]]]
+    sources:    dict[str, str]
+    raises:     dict[str, int]
+    kept:       frozenset[str] | None
+
+
+def read_base_facts(path: str) -> BaseFacts:
+    """Read BaseFacts without decompiling outlines.
+
+    Bounding boxes come straight from the raw glyf headers; only
+    composite glyphs and GSUB are decompiled.
+    """
+    from fontTools.ttLib import TTFont
+
+    with TTFont(path, lazy=True) as tt:
+        os2, hhea = tt["OS/2"], tt["hhea"]
+        cmap      = tt.getBestCmap() or {}
+        index     = codepoint_index(cmap)
+        raw       = tt.reader["glyf"]
+        locations = tt["loca"].locations
+        simple: dict[str, tuple[int, int]] = {}
+        composites: dict[str, list[tuple[str, float, float]]] = {}
+        glyf = None
+        for gid, name in enumerate(tt.getGlyphOrder()):
+            start, end = locations[gid], locations[gid + 1]
+            if end - start < 10:
+                continue  # empty glyph
+            contours, _, y_min, _, y_max = struct.unpack_from(">hhhhh", raw, start)
+            if contours >= 0:
+                simple[name] = (y_min, y_max)
+                continue
+            if glyf is None:
+                glyf = tt["glyf"]
+            composites[name] = [
+                (c.glyphName, c.transform[1][1] if hasattr(c, "transform") else 1,
+                 getattr(c, "y", 0))
+                for c in glyf[name].components
+            ]
+        raises: dict[str, int] = {}
+        for code, gname in cmap.items():
+            if index[code].lower:
+                raises[gname] = raises.get(gname, 0) + 1
+        sources = {
+            default: alt for default, alt in (bake_substitutions(tt) or {}).items()
+            if alt in simple or alt in composites
+        }
+        return BaseFacts(
+            os2={
+                attr: int(getattr(os2, attr)) for attr in (
+                    "sxHeight", "sTypoAscender", "sTypoDescender",
+                    "sTypoLineGap", "usWinAscent", "usWinDescent",
+                )
+            },
+            hhea={"ascent": hhea.ascent, "descent": hhea.descent, "lineGap": hhea.lineGap},
+            codepoints=frozenset(cmap),
+            simple=simple,
+            composites=composites,
+            sources=sources,
+            raises=raises,
+            kept=layout_retained_glyphs(tt),
+        )
+
+
+def predict_y_bounds(facts: BaseFacts, factor: float) -> tuple[int, int]:
+    """head (yMin, yMax) after baking, x-height scaling and flattening.
+
+    Exact for simple glyphs and translated components, which raise_xheight
+    moves monotonically in y; scaled components are an estimate. Glyphs
+    the layout stage prunes, such as alternates only the baked features
+    reached, are left out.
+    """
+    from fontTools.misc.roundTools import otRound
+
+    xheight_y = facts.os2["sxHeight"]
+    delta_y   = int(round(xheight_y * factor)) - xheight_y
+    raise_y   = abs(factor - 1.0) >= 1e-3
+
+    def y_map(y: float, times: int) -> float:
+        for _ in range(times if raise_y else 0):
+            y = _xheight_points([(0, y)], factor, xheight_y, delta_y)[0][1]
+        return y
+
+    @functools.lru_cache(maxsize=None)
+    def bounds(name: str) -> tuple[float, float] | None:
+        src = facts.sources.get(name, name)
+        if src in facts.simple:
+            y_min, y_max = facts.simple[src]
+            times = facts.raises.get(name, 0)
+            return y_map(y_min, times), y_map(y_max, times)
+        parts = [
+            (b[0] * yy + dy, b[1] * yy + dy)
+            for cname, yy, dy in facts.composites.get(src, ())
+            if (b := bounds(cname)) is not None
+        ]
+        if not parts:
+            return None
+        lo = min(min(p) for p in parts)
+        hi = max(max(p) for p in parts)
+        return otRound(lo), otRound(hi)
+
+    names   = [*facts.simple, *facts.composites]
+    if facts.kept is not None:
+        names = [name for name in names if name in facts.kept]
+    extents = [b for b in map(bounds, names) if b]
+    return min(b[0] for b in extents), max(b[1] for b in extents)
+
+
+def predict_metrics_snapshot(facts: BaseFacts, cfg: FamilyConfig) -> dict[str, dict[str, int]]:
+    """capture_metrics_snapshot of a family's built Regular, from its base."""
+    y_min, y_max = predict_y_bounds(facts, cfg.xheight_factor)
+    os2 = facts.os2
+    return {
+        "hhea": dict(facts.hhea),
+        "OS/2": {
+            "sTypoAscender":  os2["sTypoAscender"],
+            "sTypoDescender": os2["sTypoDescender"],
+            "sTypoLineGap":   os2["sTypoLineGap"],
+            # ensure_win_metrics, applied to the compiled font
+            "usWinAscent":  max(os2["usWinAscent"], y_max, FONT_PARAMS["win_ascent_min"]),
+            "usWinDescent": max(os2["usWinDescent"], abs(y_min), FONT_PARAMS["win_descent_min"]),
+        },
+    }
+
+
+def dry_run(
+    families: dict[str, FamilyConfig], bases: dict[str, str]
+) -> dict[str, dict[str, Any]]:
+    """Validate every family × style from base font metrics alone.
+
+    Predicts each style's x-height and its family's Regular metrics
+    snapshot, runs the proportion checks the build runs (after the
+    snapshot is applied, as in BUILD_STAGES) and reports STEM_SHIFT_MAP
+    codepoints missing from each base. The base fonts are read in
+    parallel; no outlines are transformed. Raises ValueError on the
+    first proportion failure.
+    """
+    with concurrent.futures.ThreadPoolExecutor() as ex:
+        facts = dict(zip(bases, ex.map(read_base_facts, bases.values())))
+
+    for style, base in facts.items():
+        missing = sorted(set(STEM_SHIFT_MAP) - base.codepoints)
+        for code in missing:
+            log.warning("StemShift: U+%04X not in %s cmap", code, BASES.get(style, style))
+
+    results: dict[str, dict[str, Any]] = {}
+    for family, cfg in families.items():
+        snapshot = predict_metrics_snapshot(facts["Regular"], cfg)
+        styles: dict[str, Any] = {}
+        for style, (_, style_label) in STYLE_WEIGHTS.items():
+            base = facts[style]
+            xh   = base.os2["sxHeight"]
+            if abs(cfg.xheight_factor - 1.0) >= 1e-3:
+                xh = int(round(xh * cfg.xheight_factor))
+            os2 = snapshot["OS/2"]
+            check_proportions(
+                xh, os2["sTypoAscender"], os2["sTypoDescender"], family, style_label
+            )
+            styles[style] = {
+                "xHeight":    xh,
+                "ascender":   os2["sTypoAscender"],
+                "descender":  os2["sTypoDescender"],
+                "stem_shift_missing": [
+                    f"U+{code:04X}" for code in sorted(set(STEM_SHIFT_MAP) - base.codepoints)
+                ],
+            }
+        results[family] = {"metrics_snapshot": snapshot, "styles": styles}
+        log.info(
+            "  dry-run OK: %s (win %d/%d)", family,
+            snapshot["OS/2"]["usWinAscent"], snapshot["OS/2"]["usWinDescent"],
+        )
+    return results
+
 # ─── CLI ──────────────────────────────────────────────────────────────────────
 
 def resolve_family_filter(name: str | None) -> dict[str, FamilyConfig]:
@@ -1136,60 +2915,341 @@ def parse_args() -> argparse.Namespace:
                    help='Build one family, e.g. --family "EasyType Steady".')
     p.add_argument("--no-hint", action="store_true",
                    help="Skip ttfautohint.")
+    p.add_argument("--no-cache", action="store_true",
+                   help="Rebuild every style instead of reusing cached outputs.")
+    p.add_argument("--fused-glyph-pass", action="store_true",
+                   help="Run anchoring, stem-shift and x-height as one "
+                        "pass per glyph.")
+    p.add_argument("--jobs", type=int, metavar="N",
+                   help="Build styles in a pool of N processes "
+                        "(default: threads in this process).")
+    p.add_argument("--hint-jobs", type=int, metavar="N",
+                   default=max(1, os.cpu_count() or 1),
+                   help="Concurrent ttfautohint processes (default: CPU count).")
+    p.add_argument("--woff2-jobs", type=int, metavar="N", default=2,
+                   help="WOFF2 encoder workers running alongside the style "
+                        "builds (default: 2).")
+    p.add_argument("--hinted-webfonts", action="store_true",
+                   help="Encode WOFF2s from the hinted desktop TTFs instead "
+                        "of the unhinted, pruned web profile.")
+    p.add_argument("--trace", metavar="PATH",
+                   help="Also write per-stage timings as a Chrome trace "
+                        "(open in Perfetto or chrome://tracing).")
+    p.add_argument("--compare-report", metavar="OLD", nargs="?",
+                   const=PREV_REPORT_PATH,
+                   help="Compare output sizes in the build report against OLD "
+                        "(default: the report the last full build replaced) and "
+                        "exit non-zero if a file grew past the budget.")
+    p.add_argument("--size-budget", type=float, metavar="PCT",
+                   default=SIZE_BUDGET_PCT,
+                   help="Allowed growth per file for --compare-report "
+                        f"(default: {SIZE_BUDGET_PCT:g}%%).")
     p.add_argument("--version", action="version", version=VERSION_STR)
-    return p.parse_args()
+    args = p.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        p.error("--jobs must be at least 1")
+    if args.hint_jobs < 1:
+        p.error("--hint-jobs must be at least 1")
+    if args.woff2_jobs < 1:
+        p.error("--woff2-jobs must be at least 1")
+    return args
 
 # ─── Main ─────────────────────────────────────────────────────────────────────
 
-def _build_family(
-    family: str, cfg: FamilyConfig, bases: dict[str, str],
-    hinting_enabled: bool,
-) -> tuple[str, dict[str, Any]]:
-    """Build all 4 styles for one family and return (family_name, family_report).
+@dataclass(frozen=True)
+class Woff2Job:
+    """A finished TTF waiting for WOFF2 encoding and its cache entry.
 
-    Regular is built first (to capture the metrics snapshot), then the
-    remaining 3 styles are built in parallel.
+    web_data is the unhinted font for the web profile; without it the
+    WOFF2 is encoded from font_data as written to out_ttf.
     """
-    log.info("=== Building %s ===", family)
-    family_report: dict[str, Any] = {}
-
-    # Regular must come first — its metrics snapshot is applied to other styles.
-    reg_style, (reg_weight, reg_label) = "Regular", STYLE_WEIGHTS["Regular"]
-    out_ttf_reg = os.path.join(OUT_TTF, f"{family.replace(' ', '')}-{reg_style}.ttf")
-    family_report[reg_style] = build_one(
-        bases[reg_style], out_ttf_reg, family, reg_style, reg_label, reg_weight,
-        cfg, hinting_enabled=hinting_enabled,
+    out_ttf:   str
+    font_data: bytes
+    cache_key: str | None
+    report:    dict[str, Any]
+    snapshot:  dict[str, dict[str, int]] | None
+    web_data:  bytes | None = None
+
+
+def finish_woff2_job(job: Woff2Job) -> list[dict[str, Any]]:
+    """Encode a style's WOFF2, then store its outputs in the build cache.
+
+    Module-level so it can be pickled into a process pool. Returns the
+    stage timing samples.
+    """
+    samples: list[dict[str, Any]] = []
+    data = job.font_data
+    if job.web_data is not None:
+        with measure_stage(samples, "web-profile"):
+            data = web_font_data(job.web_data)
+    with measure_stage(samples, "woff2"):
+        compress_to_woff2(job.out_ttf, data)
+    if job.cache_key:
+        with measure_stage(samples, "cache-store"):
+            store_cached_outputs(job.cache_key, job.out_ttf, job.report, job.snapshot)
+    return samples
+
+
+@dataclass(frozen=True)
+class HintJob:
+    """A compiled, unhinted TTF waiting for ttfautohint."""
+    out_ttf:    str
+    font_data:  bytes
+    cache_key:  str | None
+    report:     dict[str, Any]
+    snapshot:   dict[str, dict[str, int]] | None
+    hint_cache: str | None = None
+    web_data:   bytes | None = None
+
+
+def run_hint_job(
+    job: HintJob, samples: list[dict[str, Any]] | None = None
+) -> Woff2Job:
+    """Hint, fix up and write one TTF; returns its WOFF2 job."""
+    label = os.path.basename(job.out_ttf)
+    with measure_stage(samples, "hint"):
+        hinted = hint_font_data(job.font_data, label, job.hint_cache)
+    with measure_stage(samples, "post-hint"):
+        _, data = finish_font_data(job.font_data, hinted)
+    with measure_stage(samples, "write"):
+        with open(job.out_ttf, "wb") as fh:
+            fh.write(data)
+    log.info("→ %s", label)
+    return Woff2Job(
+        job.out_ttf, data, job.cache_key, job.report, job.snapshot, job.web_data
     )
-    FAMILY_METRICS[family] = capture_metrics_snapshot(TTFont(out_ttf_reg))
-    compress_to_woff2(out_ttf_reg)
 
-    # Remaining styles share no state — build in parallel.
-    other_styles = [(s, w, l) for s, (w, l) in STYLE_WEIGHTS.items() if s != "Regular"]
 
-    def _build_style(style: str, weight: int, style_label: str) -> tuple[str, dict[str, Any]]:
-        out_ttf = os.path.join(OUT_TTF, f"{family.replace(' ', '')}-{style}.ttf")
-        report  = build_one(
-            bases[style], out_ttf, family, style, style_label, weight,
-            cfg, hinting_enabled=hinting_enabled,
+class HintQueue:
+    """Bounded pool of ttfautohint workers with per-job timings.
+
+    Each worker pipes unhinted bytes through its own ttfautohint process,
+    so threads are enough: they spend their time waiting on the child.
+    No process may fork while the queue has jobs running (see auto_hint).
+    `timings` maps each TTF name to the seconds it waited in the queue and
+    spent hinting.
+    """
+
+    def __init__(self, workers: int) -> None:
+        self.workers = workers
+        self.timings: dict[str, dict[str, float]] = {}
+        self._pool   = concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="hint"
+        )
+
+    def submit(self, job: HintJob) -> concurrent.futures.Future:
+        """Queue job; the future resolves to (woff2_job, timing samples)."""
+        return self._pool.submit(self._run, job, time.perf_counter())
+
+    def _run(
+        self, job: HintJob, queued_at: float
+    ) -> tuple[Woff2Job, list[dict[str, Any]]]:
+        samples: list[dict[str, Any]] = []
+        started   = time.perf_counter()
+        woff2_job = run_hint_job(job, samples)
+        name      = os.path.basename(job.out_ttf)
+        self.timings[name] = {
+            "wait_s": round(started - queued_at, 3),
+            "hint_s": round(time.perf_counter() - started, 3),
+        }
+        log.info(
+            "  hint queue: %s waited %.1fs, hinted in %.1fs",
+            name, self.timings[name]["wait_s"], self.timings[name]["hint_s"],
+        )
+        return woff2_job, samples
+
+    def __enter__(self) -> HintQueue:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._pool.shutdown(wait=True)
+
+
+def start_pool_workers(pool: concurrent.futures.Executor) -> None:
+    """Start every worker process of pool now rather than on first use.
+
+    A forked worker inherits every pipe open at the time of the fork. If
+    that includes the stdin of a ttfautohint run by HintQueue, ttfautohint
+    never sees EOF and the build hangs. ProcessPoolExecutor forks all its
+    workers on the first submit (fork start method; other start methods
+    fork from a clean server process), so one round trip is enough.
+    Thread pools are left alone.
+    """
+    if isinstance(pool, concurrent.futures.ProcessPoolExecutor):
+        pool.submit(os.getpid).result()
+
+
+def _build_style_task(
+    family: str, style: str, cfg: FamilyConfig, src_path: str,
+    opts: BuildOptions,
+    metrics_snapshot: dict[str, dict[str, int]] | None,
+) -> tuple[
+    str, str, dict[str, Any], dict[str, dict[str, int]] | None,
+    HintJob | Woff2Job | None, list[dict[str, Any]],
+]:
+    """Build one (family, style) pair up to its unhinted TTF.
+
+    Module-level so it can be pickled into a process pool. Returns
+    (family, style, report, snapshot, next_job, samples); snapshot is only captured
+    for Regular, whose metrics the other styles of the family depend on.
+    Hinting and WOFF2 encoding are left to the caller as next_job (a
+    HintJob, or a Woff2Job when hinting is off), so they can overlap with
+    the next build. Outputs whose inputs hash to a cached entry are
+    copied, not rebuilt, and need no next_job. samples holds the timing
+    of each stage run here (see measure_stage).
+    """
+    weight, style_label = STYLE_WEIGHTS[style]
+    out_ttf = os.path.join(OUT_TTF, f"{family.replace(' ', '')}-{style}.ttf")
+    samples: list[dict[str, Any]] = []
+
+    key = None
+    if opts.use_cache:
+        with measure_stage(samples, "cache-restore"):
+            key    = build_cache_key(src_path, family, style, cfg, opts, metrics_snapshot)
+            cached = restore_cached_outputs(key, out_ttf)
+        if cached:
+            report, snapshot = cached
+            return family, style, report, snapshot, None, samples
+
+    job = StyleJob(
+        family, style, style_label, weight, cfg, metrics_snapshot,
+        fused_glyph_pass=opts.fused_glyph_pass,
+    )
+    tt  = build_font(
+        src_path, job, stage_cache=STAGE_CACHE if opts.use_cache else None,
+        samples=samples,
+    )
+    label = os.path.basename(out_ttf)
+    with measure_stage(samples, "save"):
+        raw = compile_font(tt)
+    # ttfautohint only adds instructions, so the report and the metrics
+    # snapshot are taken from the fixed-up unhinted font and Regular can
+    # release its family's other styles before it is hinted.
+    with measure_stage(samples, "fixup"):
+        tt       = fixed_up_font(raw)
+        report   = style_report(tt, cfg)
+        snapshot = capture_metrics_snapshot(tt) if style == "Regular" else None
+        # Serialised only when something consumes the unhinted bytes.
+        data     = compile_font(tt) if opts.web_profile or not opts.hinting_enabled else None
+    web_data = data if opts.web_profile else None
+    if opts.hinting_enabled:
+        hint_job = HintJob(
+            out_ttf, raw, key, report, snapshot,
+            hint_cache=HINT_CACHE if opts.use_cache else None, web_data=web_data,
         )
-        compress_to_woff2(out_ttf)
-        return style, report
+        return family, style, report, snapshot, hint_job, samples
+    log.info("→ Hinting skipped (--no-hint)")
+    with measure_stage(samples, "write"):
+        with open(out_ttf, "wb") as fh:
+            fh.write(data)
+    log.info("→ %s", label)
+    return (
+        family, style, report, snapshot,
+        Woff2Job(out_ttf, data, key, report, snapshot, web_data), samples,
+    )
+
 
-    with concurrent.futures.ThreadPoolExecutor() as pool:
-        futures = {pool.submit(_build_style, s, w, l): s for s, w, l in other_styles}
-        for fut in concurrent.futures.as_completed(futures):
-            style, style_report = fut.result()
-            family_report[style] = style_report
+def run_build_tasks(
+    families: dict[str, FamilyConfig], bases: dict[str, str],
+    opts: BuildOptions, pool: concurrent.futures.Executor,
+    woff2_pool: concurrent.futures.Executor | None = None,
+    hint_queue: HintQueue | None = None,
+    samples: list[dict[str, Any]] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Schedule every (family, style) build on pool and return the reports.
+
+    Each family's Regular is submitted first; its metrics snapshot is an
+    explicit input to the remaining styles, which are submitted as soon as
+    it completes. Families never wait on each other. Finished builds flow
+    on to hint_queue and then woff2_pool (each stage runs inline when its
+    executor is None), so hinting and compression overlap with the builds
+    still running. Stage timings from every step, tagged with family and
+    style, are appended to samples when it is given. Process pools get
+    all their workers before the first hint job runs (start_pool_workers).
+    """
+    for executor in (pool, woff2_pool):
+        if executor is not None:
+            start_pool_workers(executor)
+    # future → (kind, family, style)
+    pending: dict[concurrent.futures.Future, tuple[str, str, str]] = {
+        pool.submit(
+            _build_style_task, family, "Regular", cfg, bases["Regular"],
+            opts, None,
+        ): ("build", family, "Regular")
+        for family, cfg in families.items()
+    }
+    results: dict[str, dict[str, Any]] = {family: {} for family in families}
+    encodes: dict[concurrent.futures.Future, tuple[str, str]] = {}
+
+    def collect(family: str, style: str, new: list[dict[str, Any]] | None) -> None:
+        if samples is not None and new:
+            samples.extend({**s, "family": family, "style": style} for s in new)
+
+    def encode(family: str, style: str, woff2_job: Woff2Job) -> None:
+        if woff2_pool is None:
+            collect(family, style, finish_woff2_job(woff2_job))
+        else:
+            encodes[woff2_pool.submit(finish_woff2_job, woff2_job)] = (family, style)
 
-    return family, family_report
+    while pending:
+        done, _ = concurrent.futures.wait(
+            pending, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        for fut in done:
+            kind, family, style = pending.pop(fut)
+            if kind == "hint":
+                woff2_job, hint_samples = fut.result()
+                collect(family, style, hint_samples)
+                encode(family, style, woff2_job)
+                continue
+            _, _, style_report, snapshot, next_job, build_samples = fut.result()
+            results[family][style] = style_report
+            collect(family, style, build_samples)
+            if style == "Regular":
+                log.info("=== %s Regular done — scheduling remaining styles ===", family)
+                pending.update(
+                    (pool.submit(
+                        _build_style_task, family, other, families[family],
+                        bases[other], opts, snapshot,
+                    ), ("build", family, other))
+                    for other in STYLE_WEIGHTS if other != "Regular"
+                )
+            if isinstance(next_job, HintJob):
+                if hint_queue is None:
+                    hint_samples: list[dict[str, Any]] = []
+                    woff2_job = run_hint_job(next_job, hint_samples)
+                    collect(family, style, hint_samples)
+                    encode(family, style, woff2_job)
+                else:
+                    pending[hint_queue.submit(next_job)] = ("hint", family, style)
+            elif next_job is not None:
+                encode(family, style, next_job)
+
+    for fut in concurrent.futures.as_completed(encodes):
+        collect(*encodes[fut], fut.result())
+
+    # Report styles in canonical order regardless of completion order.
+    return {
+        family: {s: styles[s] for s in STYLE_WEIGHTS if s in styles}
+        for family, styles in results.items()
+    }
 
 
 def main() -> int:
+    from fontTools.ttLib import TTFont
+
     args     = parse_args()
+    if args.compare_report:
+        return compare_reports(args.compare_report, BUILD_REPORT_PATH, args.size_budget)
     families = resolve_family_filter(args.family)
-    bases    = {sty: extract_base(fname) for sty, fname in BASES.items()}
+    for d in (BASECACHE, OUT_TTF, OUT_WEB):
+        os.makedirs(d, exist_ok=True)
+    paths    = extract_bases(BASES.values())
+    bases    = {sty: paths[fname] for sty, fname in BASES.items()}
 
-    verify_inter_gsub(TTFont(bases["Regular"]))
+    # lazy=True: only the GSUB header and feature list are decompiled.
+    with TTFont(bases["Regular"], lazy=True) as regular:
+        verify_inter_gsub(regular)
 
     report: dict[str, Any] = {
         "version":    VERSION_DISPLAY,
@@ -1199,35 +3259,61 @@ def main() -> int:
     }
 
     if args.dry_run:
-        for family, cfg in families.items():
-            log.info("=== Dry-run %s ===", family)
-            for style, (_, style_label) in STYLE_WEIGHTS.items():
-                tt = TTFont(bases[style])
-                bake_disambiguation_defaults(tt)
-                apply_optical_anchor(tt, FONT_PARAMS["entry_band"], cfg.anchor_strength)
-                apply_stem_shift_disambiguation(tt)
-                raise_xheight(tt, cfg.xheight_factor)
-                validate_proportions(tt, family, style_label)
-                log.info("  dry-run OK: %s %s", family, style_label)
+        dry_run(families, bases)
         log.info("✓ Dry run complete")
         return 0
 
-    # Build all families in parallel (each family builds Regular first, then
-    # its remaining 3 styles in parallel, so the total work is fully pipelined).
-    with concurrent.futures.ThreadPoolExecutor() as pool:
-        futures = {
-            pool.submit(_build_family, family, cfg, bases, not args.no_hint): family
-            for family, cfg in families.items()
-        }
-        for fut in concurrent.futures.as_completed(futures):
-            family, family_report = fut.result()
-            report["families"][family] = family_report
+    # Decompile each base once; forked worker processes inherit the pool.
+    BASE_FONTS.preload(bases.values())
+
+    # Every (family, style) is an independent task; only a family's Regular
+    # gates its other styles. Threads share the GIL, so --jobs N switches to
+    # a process pool to spread the pure-Python glyph work across cores.
+    # Hinting runs in its own bounded queue of ttfautohint processes, and
+    # WOFF2 encoding (table transforms in Python, then brotli) gets its own
+    # pool of the same kind as the builds, so both run alongside them.
+    # run_build_tasks forks every worker up front, before the hint queue
+    # opens a ttfautohint pipe that a late fork would inherit.
+    if args.jobs:
+        pool: concurrent.futures.Executor = (
+            concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs)
+        )
+        woff2_pool: concurrent.futures.Executor = (
+            concurrent.futures.ProcessPoolExecutor(max_workers=args.woff2_jobs)
+        )
+        log.info("Building with %d worker processes", args.jobs)
+    else:
+        pool       = concurrent.futures.ThreadPoolExecutor()
+        woff2_pool = concurrent.futures.ThreadPoolExecutor(max_workers=args.woff2_jobs)
+    opts = BuildOptions(
+        hinting_enabled=not args.no_hint, use_cache=not args.no_cache,
+        fused_glyph_pass=args.fused_glyph_pass, web_profile=not args.hinted_webfonts,
+    )
+    samples: list[dict[str, Any]] = []
+    with pool, woff2_pool, HintQueue(args.hint_jobs) as hint_queue:
+        report["families"] = run_build_tasks(
+            families, bases, opts, pool, woff2_pool, hint_queue, samples
+        )
+    report["timings"] = summarize_timings(samples)
+    if args.trace:
+        write_chrome_trace(samples, args.trace)
+    if hint_queue.timings:
+        log.info(
+            "✓ Hint queue: %d fonts on %d workers, %.1fs hinting, longest wait %.1fs",
+            len(hint_queue.timings), hint_queue.workers,
+            sum(t["hint_s"] for t in hint_queue.timings.values()),
+            max(t["wait_s"] for t in hint_queue.timings.values()),
+        )
 
-    os.makedirs(os.path.dirname(BUILD_REPORT_PATH), exist_ok=True)
-    with open(BUILD_REPORT_PATH, "w", encoding="utf-8") as fh:
-        json.dump(report, fh, indent=2)
-        fh.write("\n")
-    log.info("✓ Build report → %s", BUILD_REPORT_PATH)
+    outputs = [
+        os.path.join(out_dir, f"{family.replace(' ', '')}-{style}{ext}")
+        for family, styles in report["families"].items() for style in styles
+        for out_dir, ext in ((OUT_TTF, ".ttf"), (OUT_WEB, ".woff2"))
+    ]
+    report["sizes"] = collect_output_sizes(outputs, os.path.dirname(BUILD_REPORT_PATH))
+
+    # A --family run only covers some files, so it keeps the baseline.
+    write_build_report(report, rotate=not args.family)
     log.info(
         "✅ Done — version %s; families: %s",
         VERSION_DISPLAY, ", ".join(report["families"]),
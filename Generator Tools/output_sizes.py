@@ -0,0 +1,70 @@
+"""
+Per-file size accounting shared by font.py and compress_webfonts.py.
+
+Both scripts record their outputs in the build report's "sizes" map with
+these helpers, so --compare-report sees subset webfonts the same way it
+sees freshly built ones.
+"""
+from __future__ import annotations
+
+import os
+from typing import Any
+
+# Tables broken out in the report; the rest are summed as "other".
+SIZE_TABLES = ("glyf", "loca", "GPOS", "GSUB", "fpgm", "prep", "cvt ", "hmtx")
+
+# A file fails --compare-report when it grows by more than this percentage
+# of its previous size and by more than SIZE_BUDGET_MIN_BYTES.
+SIZE_BUDGET_PCT       = 2.0
+SIZE_BUDGET_MIN_BYTES = 256
+
+
+def output_size_entry(path: str) -> dict[str, Any]:
+    """File size plus the stored size of each SIZE_TABLES table.
+
+    Table sizes come from the sfnt directory without decompiling anything.
+    For WOFF2 they are the transformed sizes before Brotli, which is what
+    the compressed stream is made of.
+    """
+    from fontTools.ttLib import TTFont
+
+    with TTFont(path, lazy=True) as font:
+        stored = {tag: font.reader.tables[tag].length for tag in font.reader.keys()}
+    tables = {tag.strip(): stored[tag] for tag in SIZE_TABLES if tag in stored}
+    tables["other"] = sum(n for tag, n in stored.items() if tag not in SIZE_TABLES)
+    return {"bytes": os.path.getsize(path), "tables": tables}
+
+
+def collect_output_sizes(paths: list[str], root: str) -> dict[str, dict[str, Any]]:
+    """output_size_entry for each existing path, keyed by its path under root."""
+    return {
+        os.path.relpath(path, root).replace(os.sep, "/"): output_size_entry(path)
+        for path in paths if os.path.exists(path)
+    }
+
+
+def size_regressions(
+    old: dict[str, dict[str, Any]],
+    new: dict[str, dict[str, Any]],
+    budget_pct: float = SIZE_BUDGET_PCT,
+) -> list[str]:
+    """Describe every file in both size maps that grew past the budget."""
+    failures = []
+    for name, entry in sorted(new.items()):
+        prev = old.get(name)
+        if prev is None:
+            continue
+        growth = entry["bytes"] - prev["bytes"]
+        if growth <= SIZE_BUDGET_MIN_BYTES or growth <= prev["bytes"] * budget_pct / 100:
+            continue
+        grown = ", ".join(
+            f"{tag} +{n - prev['tables'].get(tag, 0)}"
+            for tag, n in entry["tables"].items()
+            if n > prev["tables"].get(tag, 0)
+        )
+        failures.append(
+            f"{name}: {prev['bytes']} → {entry['bytes']} bytes "
+            f"(+{100 * growth / prev['bytes']:.1f}%, budget {budget_pct:g}%)"
+            + (f"; grew: {grown}" if grown else "")
+        )
+    return failures
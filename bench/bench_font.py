@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+EasyType font builder benchmarks.
+
+Times the glyph transforms and a full build_one on synthetic fonts, so no
+network access or Inter download is needed. Each font has real
+Latin/Greek/Cyrillic codepoints (so anchoring, stem-shift and case-pair
+code paths do real work), an ss02 lookup for the bake stage, unmapped
+filler glyphs up to the requested size, and composites nested to the
+requested depth.
+
+Usage:
+  python3 bench/bench_font.py                            # 1k/5k/20k glyphs, depth 2
+  python3 bench/bench_font.py --sizes 1000 --depth 3     # one size, deeper composites
+  python3 bench/bench_font.py --only flatten_composites  # one benchmark
+  python3 bench/bench_font.py --save bench/baseline.json
+  python3 bench/bench_font.py --compare bench/baseline.json --threshold 0.2
+
+--compare exits 1 when a benchmark's median is more than `threshold`
+slower than the baseline. Without --threshold, the threshold saved with
+the baseline applies. A baseline may carry per-benchmark overrides in
+its "thresholds" map. Baselines are machine-specific; record one on
+the machine that compares against it.
+
+Requirements:
+  pip install fonttools
+  pip install numpy                 # optional, benchmarks the vectorized paths
+"""
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import functools
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import unicodedata
+from typing import Any, Callable
+
+from fontTools.agl import UV2AGL
+from fontTools.fontBuilder import FontBuilder
+from fontTools.misc.timeTools import timestampFromString
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Generator Tools"))
+import font as ft  # noqa: E402 — must come after sys.path manipulation
+
+# ─── Config ───────────────────────────────────────────────────────────────────
+
+DEFAULT_SIZES     = (1_000, 5_000, 20_000)
+DEFAULT_DEPTH     = 2
+DEFAULT_REPEAT    = 5
+DEFAULT_THRESHOLD = 0.20
+# Medians closer than this to the baseline are timer noise, not regressions.
+MIN_DELTA_S       = 0.005
+
+# Inter's vertical metrics, so validate_proportions passes after x-height.
+UPM, XHEIGHT, CAP_HEIGHT, ASCENDER, DESCENDER = 2048, 1152, 1490, 1984, -494
+
+CODEPOINT_RANGES = (
+    (0x0020, 0x007E),  # Basic Latin
+    (0x00A0, 0x00FF),  # Latin-1 Supplement
+    (0x0100, 0x024F),  # Latin Extended-A/B
+    (0x0250, 0x02AF),  # IPA Extensions
+    (0x0370, 0x03FF),  # Greek
+    (0x0400, 0x04FF),  # Cyrillic
+    (0x0500, 0x052F),  # Cyrillic Supplement
+    (0x1E00, 0x1EFF),  # Latin Extended Additional
+    (0x1F00, 0x1FFF),  # Greek Extended
+    (0x2C60, 0x2C7F),  # Latin Extended-C
+    (0xA640, 0xA69F),  # Cyrillic Extended-B
+    (0xA720, 0xA7FF),  # Latin Extended-D
+)
+CREATED = timestampFromString("Mon Jan  1 00:00:00 2024")
+MARKS   = ("gravecomb", "acutecomb", "circumflexcomb", "tildecomb", "dieresiscomb")
+
+# ─── Synthetic fonts ──────────────────────────────────────────────────────────
+
+def _glyph_name(code: int) -> str:
+    return UV2AGL.get(code) or f"uni{code:04X}"
+
+
+def _outline(rng: random.Random, top: int) -> Any:
+    """Two closed quadratic contours, about Inter's average point count."""
+    pen   = TTGlyphPen(None)
+    left  = rng.randint(40, 120)
+    right = left + rng.randint(500, 1100)
+    for inset in (0, rng.randint(80, 160)):
+        x0, x1 = left + inset, right - inset
+        y0, y1 = inset + rng.choice((0, DESCENDER + 40)), top - inset
+        mid_y  = (y0 + y1) // 2
+        pen.moveTo((x0, y0))
+        pen.lineTo((x0, y1))
+        pen.qCurveTo((x0 + 40, y1 + 30), ((x0 + x1) // 2, y1 + 40), (x1, y1))
+        pen.lineTo((x1, mid_y))
+        pen.qCurveTo((x1 - 20, (mid_y + y0) // 2), (x1 - 60, y0 + 10), (x1 - 120, y0))
+        pen.closePath()
+    return pen.glyph()
+
+
+def _composite(glyphs: dict[str, Any], base: str, mark: str, rng: random.Random) -> Any:
+    pen = TTGlyphPen(glyphs)
+    pen.addComponent(base, (1, 0, 0, 1, 0, 0))
+    # Most accents are plain offsets; a few are scaled like Inter's
+    # stacked marks, which takes flatten_composites' rounding path.
+    scale = 1 if rng.random() < 0.9 else 0.75
+    pen.addComponent(mark, (scale, 0, 0, scale, rng.randint(100, 400), XHEIGHT + 60))
+    return pen.glyph()
+
+
+def make_synthetic_font(
+    path: str, glyph_count: int, composite_depth: int = DEFAULT_DEPTH, seed: int = 0
+) -> str:
+    """Write a synthetic TTF with about glyph_count glyphs to path.
+
+    Accented codepoints and part of the filler are composites; each one
+    references a glyph one level shallower plus a mark, so the deepest
+    composites nest composite_depth levels. Every tenth uppercase letter
+    is left unencoded for ensure_case_pairs to clone.
+    """
+    rng   = random.Random(seed)
+    codes = [
+        code for lo, hi in CODEPOINT_RANGES for code in range(lo, hi + 1)
+        if unicodedata.category(chr(code))[0] in "LNPS"
+    ]
+    codes = codes[:max(0, glyph_count - len(MARKS) - 5)]
+    upper = [c for c in codes if chr(c).isupper() and chr(c).lower() != chr(c)]
+    codes = [c for c in codes if c not in set(upper[::10])]
+
+    cmap: dict[int, str] = {code: _glyph_name(code) for code in codes}
+    cmap[0x2D] = "hyphen"
+    glyphs: dict[str, Any] = {".notdef": _outline(rng, CAP_HEIGHT)}
+    levels: list[list[str]] = [[]]
+    for mark in MARKS:
+        pen = TTGlyphPen(None)
+        pen.moveTo((0, 0)); pen.lineTo((120, 180)); pen.lineTo((200, 0)); pen.closePath()
+        glyphs[mark] = pen.glyph()
+
+    def add(name: str, accented: bool, top: int = CAP_HEIGHT) -> None:
+        level = rng.randint(1, composite_depth) if accented and composite_depth else 0
+        level = min(level, len(levels))
+        while level and not levels[level - 1]:
+            level -= 1
+        if level:
+            glyphs[name] = _composite(
+                glyphs, rng.choice(levels[level - 1]), rng.choice(MARKS), rng
+            )
+        else:
+            glyphs[name] = _outline(rng, top)
+        while len(levels) <= level:
+            levels.append([])
+        levels[level].append(name)
+
+    for code, name in cmap.items():
+        decomposition = unicodedata.decomposition(chr(code))
+        add(
+            name, bool(decomposition) and not decomposition.startswith("<"),
+            XHEIGHT if chr(code).islower() else CAP_HEIGHT,
+        )
+    for alt in ("I.ss02", "l.ss02", "zero.ss02"):
+        add(alt, False)
+    for i in range(len(glyphs), glyph_count):
+        add(f"g{i:05d}", rng.random() < 0.3)
+
+    names = list(glyphs)
+    fb    = FontBuilder(UPM, isTTF=True)
+    fb.setupGlyphOrder(names)
+    fb.setupCharacterMap(cmap)
+    fb.setupGlyf(glyphs)
+    fb.setupHorizontalMetrics({
+        name: (rng.randint(900, 1400), 60) for name in names
+    })
+    fb.setupHorizontalHeader(ascent=ASCENDER, descent=DESCENDER)
+    fb.setupNameTable({"familyName": "Synthetic", "styleName": "Regular"})
+    fb.setupOS2(
+        version=4, sTypoAscender=ASCENDER, sTypoDescender=DESCENDER, sTypoLineGap=0,
+        usWinAscent=2269, usWinDescent=660,
+        sxHeight=XHEIGHT, sCapHeight=CAP_HEIGHT, fsType=0,
+    )
+    fb.setupPost()
+    fb.setupHead(unitsPerEm=UPM, created=CREATED, modified=CREATED)
+    fb.addOpenTypeFeatures(
+        "feature ss02 { sub I by I.ss02; sub l by l.ss02; sub zero by zero.ss02; } ss02;"
+    )
+    fb.font.save(path)
+    return path
+
+# ─── Benchmarks ───────────────────────────────────────────────────────────────
+
+SANS = ft.FAMILIES["EasyType Sans"]
+
+
+def _on_copy(
+    transform: Callable[[ft.TTFont], Any]
+) -> Callable[[str, str], Callable[[], Any]]:
+    """Setup that hands transform a fresh pool copy of the font."""
+    return lambda path, tmp: functools.partial(transform, ft.BASE_FONTS.get(path))
+
+
+def _build_one(path: str, tmp: str) -> Callable[[], Any]:
+    out = os.path.join(tmp, "bench-build.ttf")
+    return lambda: ft.build_one(
+        path, out, "EasyType Sans", "Regular", "Regular", 400, SANS,
+        hinting_enabled=False,
+    )
+
+
+# name → setup(font_path, tmp_dir) returning the timed callable. Setup
+# (copying the base font out of the pool) is not part of the timing.
+BENCHMARKS: dict[str, Callable[[str, str], Callable[[], Any]]] = {
+    "apply_optical_anchor": _on_copy(
+        lambda tt: ft.apply_optical_anchor(
+            tt, ft.FONT_PARAMS["entry_band"], SANS.anchor_strength
+        )
+    ),
+    "raise_xheight": _on_copy(lambda tt: ft.raise_xheight(tt, SANS.xheight_factor)),
+    "apply_stem_shift_disambiguation": _on_copy(ft.apply_stem_shift_disambiguation),
+    "ensure_case_pairs":  _on_copy(ft.ensure_case_pairs),
+    "flatten_composites": _on_copy(ft.flatten_composites),
+    "build_one":          _build_one,
+}
+
+
+def time_benchmark(
+    setup: Callable[[str, str], Callable[[], Any]], path: str, tmp: str, repeat: int
+) -> dict[str, Any]:
+    """Run one benchmark repeat times, each on a fresh font copy."""
+    runs = []
+    for _ in range(repeat):
+        fn    = setup(path, tmp)
+        start = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - start)
+    return {
+        "median_s": round(statistics.median(runs), 5),
+        "min_s":    round(min(runs), 5),
+        "runs":     repeat,
+    }
+
+
+def run_benchmarks(
+    sizes: list[int], depth: int, repeat: int, only: list[str] | None = None
+) -> dict[str, dict[str, Any]]:
+    """Time every benchmark on each synthetic font size."""
+    results: dict[str, dict[str, Any]] = {}
+    names = [n for n in BENCHMARKS if not only or n in only]
+    with tempfile.TemporaryDirectory(prefix="easytype-bench-") as tmp:
+        for size in sizes:
+            label = f"{size}g-d{depth}"
+            path  = make_synthetic_font(os.path.join(tmp, f"{label}.ttf"), size, depth)
+            ft.BASE_FONTS.preload([path])
+            results[label] = {}
+            for name in names:
+                results[label][name] = time_benchmark(BENCHMARKS[name], path, tmp, repeat)
+                print(f"{label:>10}  {name:<34} {results[label][name]['median_s']:9.4f}s")
+    return results
+
+# ─── Baselines ────────────────────────────────────────────────────────────────
+
+def environment() -> dict[str, Any]:
+    import fontTools
+    return {
+        "created":   dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds"),
+        "python":    platform.python_version(),
+        "platform":  platform.platform(),
+        "fonttools": fontTools.version,
+        "numpy":     ft._numpy().__version__ if ft._numpy() is not None else None,
+        "builder":   ft.BUILDER_REVISION,
+    }
+
+
+def compare_results(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, Any],
+    threshold: float | None = None,
+) -> list[str]:
+    """Return one message per benchmark slower than its baseline allows.
+
+    threshold defaults to the one stored in the baseline.
+    """
+    if threshold is None:
+        threshold = baseline.get("threshold", DEFAULT_THRESHOLD)
+    overrides   = baseline.get("thresholds", {})
+    regressions = []
+    for label, benches in results.items():
+        for name, result in benches.items():
+            base = baseline.get("results", {}).get(label, {}).get(name)
+            if not base:
+                continue
+            limit = overrides.get(name, threshold)
+            old, new = base["median_s"], result["median_s"]
+            if new - old > MIN_DELTA_S and new > old * (1 + limit):
+                regressions.append(
+                    f"{label} {name}: {new:.4f}s vs {old:.4f}s "
+                    f"(+{(new / old - 1) * 100:.0f}%, limit {limit * 100:.0f}%)"
+                )
+    return regressions
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Benchmark the EasyType font builder.")
+    p.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                   metavar="N", help="Synthetic font glyph counts.")
+    p.add_argument("--depth", type=int, default=DEFAULT_DEPTH,
+                   help="Maximum composite nesting depth (0 = no composites).")
+    p.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    p.add_argument("--only", nargs="+", choices=list(BENCHMARKS), metavar="NAME")
+    p.add_argument("--save", metavar="PATH", help="Write results as a baseline.")
+    p.add_argument("--compare", metavar="PATH", help="Fail on regressions vs a baseline.")
+    p.add_argument("--threshold", type=float,
+                   help="Allowed slowdown as a fraction (default: the "
+                        "baseline's, else 0.2).")
+    args = p.parse_args()
+    if args.repeat < 1:
+        p.error("--repeat must be at least 1")
+
+    # The builder logs every glyph it touches; keep the table readable.
+    ft.log.setLevel(logging.WARNING)
+    results = run_benchmarks(args.sizes, args.depth, args.repeat, args.only)
+
+    if args.save:
+        threshold = DEFAULT_THRESHOLD if args.threshold is None else args.threshold
+        with open(args.save, "w", encoding="utf-8") as fh:
+            json.dump(
+                {"environment": environment(), "threshold": threshold,
+                 "thresholds": {}, "results": results},
+                fh, indent=2,
+            )
+            fh.write("\n")
+        print(f"✓ Baseline → {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        regressions = compare_results(results, baseline, args.threshold)
+        for line in regressions:
+            print(f"✗ {line}")
+        if regressions:
+            return 1
+        print(f"✓ No regressions vs {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
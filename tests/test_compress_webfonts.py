@@ -0,0 +1,359 @@
+"""
+Unit tests for the webfont subsetting helpers.
+
+Run with:
+    pytest tests/test_compress_webfonts.py -v
+"""
+from __future__ import annotations
+
+import concurrent.futures
+import dataclasses
+import io
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the Generator Tools scripts importable without installing them.
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Generator Tools"))
+import compress_webfonts as cw  # noqa: E402 — must come after sys.path manipulation
+
+
+# ─── Subsetting workers ──────────────────────────────────────────────────────
+
+OPTIONS = cw.SubsetOptions(
+    unicode_range="U+0000-00FF", chars=None, layout_features="*",
+    drop_tables=(), passthrough_tables=(), no_hinting=False, desubroutinize=False,
+)
+
+
+def _output_arg(args: list[str]) -> Path:
+    return Path(next(a for a in args if a.startswith("--output-file=")).split("=", 1)[1])
+
+
+class TestSubsetWorkers:
+    @pytest.fixture
+    def fonts(self, tmp_path):
+        paths = []
+        for name in ("A-Regular.woff2", "B-Regular.woff2", "C-Regular.woff2"):
+            path = tmp_path / name
+            path.write_bytes(b"original")
+            paths.append(path)
+        return paths
+
+    @pytest.fixture
+    def pyftsubset(self, monkeypatch):
+        """Fake pyftsubset: writes the output, or fails for fonts named in fail."""
+        calls = []
+
+        def run(cmd, check=False, **kw):
+            calls.append(cmd)
+            temp = _output_arg(cmd)
+            temp.write_bytes(b"subset")
+            if Path(cmd[1]).name in run.fail:
+                raise subprocess.CalledProcessError(1, cmd)
+            return subprocess.CompletedProcess(cmd, 0)
+
+        run.fail = set()
+        run.calls = calls
+        monkeypatch.setattr(cw.subprocess, "run", run)
+        return run
+
+    def test_temp_names_are_unique_per_font_and_process(self, monkeypatch, tmp_path):
+        a, b = tmp_path / "A.woff2", tmp_path / "B.woff2"
+        assert cw.temp_path(a) != cw.temp_path(b)
+        first = cw.temp_path(a)
+        other_pid = os.getpid() + 1
+        monkeypatch.setattr(cw.os, "getpid", lambda: other_pid)
+        assert cw.temp_path(a) != first
+        assert cw.temp_path(a).parent == tmp_path
+
+    def test_replaces_source_on_success(self, fonts, pyftsubset):
+        assert cw.subset_font(fonts[0], OPTIONS) == fonts[0]
+        assert fonts[0].read_bytes() == b"subset"
+        assert _output_arg(pyftsubset.calls[0]) == cw.temp_path(fonts[0])
+        assert sorted(p.name for p in fonts[0].parent.iterdir()) == [p.name for p in fonts]
+
+    def test_writes_separate_output(self, fonts, pyftsubset, tmp_path):
+        out = tmp_path / "A-Regular.latin.woff2"
+        cw.subset_font(fonts[0], OPTIONS, output=out)
+        assert fonts[0].read_bytes() == b"original"
+        assert out.read_bytes() == b"subset"
+
+    def test_temp_removed_on_failure(self, fonts, pyftsubset):
+        pyftsubset.fail.add(fonts[0].name)
+        with pytest.raises(subprocess.CalledProcessError):
+            cw.subset_font(fonts[0], OPTIONS)
+        assert fonts[0].read_bytes() == b"original"
+        assert not cw.temp_path(fonts[0]).exists()
+
+    def test_one_failure_does_not_stop_the_rest(self, fonts, pyftsubset):
+        pyftsubset.fail.add(fonts[1].name)
+        failures = cw.subset_fonts([(f, f, OPTIONS) for f in fonts], jobs=2)
+        assert [path for path, _ in failures] == [fonts[1]]
+        assert isinstance(failures[0][1], subprocess.CalledProcessError)
+        assert [f.read_bytes() for f in fonts] == [b"subset", b"original", b"subset"]
+        assert not any(p.name.endswith(".subset-temp.woff2") for p in fonts[0].parent.iterdir())
+
+    def test_dry_run_runs_nothing(self, fonts, pyftsubset):
+        assert cw.subset_fonts([(f, f, OPTIONS) for f in fonts], dry_run=True) == []
+        assert pyftsubset.calls == []
+        assert fonts[0].read_bytes() == b"original"
+
+    def test_in_process_calls_fonttools(self, fonts, monkeypatch):
+        from fontTools import subset
+
+        def main(args):
+            _output_arg(args).write_bytes(b"in-process")
+            return 0
+
+        monkeypatch.setattr(subset, "main", main)
+        monkeypatch.setattr(cw.subprocess, "run", lambda *a, **kw: pytest.fail("spawned pyftsubset"))
+        assert cw.subset_fonts([(f, f, OPTIONS) for f in fonts], jobs=1, in_process=True) == []
+        assert {f.read_bytes() for f in fonts} == {b"in-process"}
+
+    def test_in_process_status_is_a_failure(self, fonts, monkeypatch):
+        from fontTools import subset
+
+        monkeypatch.setattr(subset, "main", lambda args: 2)
+        failures = cw.subset_fonts([(fonts[0], fonts[0], OPTIONS)], in_process=True)
+        assert "status 2" in str(failures[0][1])
+        assert not cw.temp_path(fonts[0]).exists()
+
+    @pytest.mark.parametrize("jobs, in_process, pool", [
+        (1, False, "thread"),
+        (4, False, "thread"),
+        (1, True, "thread"),
+        (4, True, "process"),
+    ])
+    def test_pool_dispatch(self, fonts, pyftsubset, monkeypatch, jobs, in_process, pool):
+        made = []
+        real = concurrent.futures.ThreadPoolExecutor
+
+        def recording(kind):
+            def factory(max_workers):
+                made.append((kind, max_workers))
+                return real(max_workers=max_workers)
+            return factory
+
+        monkeypatch.setattr(cw.concurrent.futures, "ThreadPoolExecutor", recording("thread"))
+        monkeypatch.setattr(cw.concurrent.futures, "ProcessPoolExecutor", recording("process"))
+        monkeypatch.setattr(cw, "subset_font", lambda source, options, in_process, output: output)
+        cw.subset_fonts([(f, f, OPTIONS) for f in fonts], jobs=jobs, in_process=in_process)
+        assert made == [(pool, jobs)]
+
+    def test_corpus_subset_logs_glyph_count(self, tmp_path, capsys):
+        source = _make_cmap_font(tmp_path / "Test-Regular.ttf", [0x41, 0x42, 0x43])
+        output = tmp_path / "Test-Regular.woff2"
+        options = dataclasses.replace(OPTIONS, chars="AB")
+        cw.subset_font(source, options, in_process=True, output=output)
+        assert output.exists()
+        assert "Test-Regular.woff2: 2 characters -> 3 glyphs after GSUB closure" in capsys.readouterr().out
+
+    def test_cli_passes_jobs_and_in_process(self, fonts, monkeypatch):
+        seen = {}
+
+        def fake_subset_fonts(tasks, jobs, in_process, dry_run):
+            seen.update(tasks=tasks, jobs=jobs, in_process=in_process, dry_run=dry_run)
+            return []
+
+        monkeypatch.setattr(cw, "subset_fonts", fake_subset_fonts)
+        monkeypatch.setattr(cw, "record_sizes", lambda *a: None)
+        monkeypatch.setattr(sys, "argv", [
+            "compress_webfonts.py", "--fonts-dir", str(fonts[0].parent),
+            "--jobs", "3", "--in-process",
+        ])
+        cw.main()
+        assert seen["jobs"] == 3 and seen["in_process"] and not seen["dry_run"]
+        assert [source for source, _, _ in seen["tasks"]] == fonts
+
+    def test_cli_exits_non_zero_on_failure(self, fonts, monkeypatch):
+        monkeypatch.setattr(cw, "subset_fonts", lambda tasks, **kw: [(fonts[0], RuntimeError("x"))])
+        monkeypatch.setattr(sys, "argv", [
+            "compress_webfonts.py", "--fonts-dir", str(fonts[0].parent), "--in-process",
+        ])
+        with pytest.raises(SystemExit) as exc:
+            cw.main()
+        assert "1 of 3 fonts failed" in str(exc.value)
+
+
+# ─── iter_json_strings ───────────────────────────────────────────────────────
+
+class TestJsonStrings:
+    DOC = (
+        '{"title": "Caf\\u00e9 \\"quoted\\"", "n": 3, "ok": true,\n'
+        ' "items": ["a", {"k\\"ey": "\\ud83d\\ude00"}, null]}\n'
+        '{"type": "feedback", "comment": "zażółć"}\n'
+    )
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 4096])
+    def test_values_only_at_any_chunk_size(self, chunk_size):
+        values = list(cw.iter_json_strings(io.StringIO(self.DOC), chunk_size))
+        assert values == ['Café "quoted"', "a", "😀", "feedback", "zażółć"]
+
+    def test_matches_json_module(self):
+        path = os.path.join(os.path.dirname(__file__), "..", "web v2", "test", "data", "passages.json")
+        with open(path, encoding="utf-8") as fh:
+            expected = []
+
+            def walk(node):
+                if isinstance(node, str):
+                    expected.append(node)
+                elif isinstance(node, list):
+                    for item in node:
+                        walk(item)
+                elif isinstance(node, dict):
+                    for item in node.values():
+                        walk(item)
+
+            walk(json.load(fh))
+        with open(path, encoding="utf-8") as fh:
+            assert list(cw.iter_json_strings(fh, chunk_size=5)) == expected
+
+
+# ─── Character sets ──────────────────────────────────────────────────────────
+
+class TestCharacterSet:
+    def test_json_keys_and_syntax_are_not_counted(self, tmp_path):
+        corpus = tmp_path / "results.jsonl"
+        corpus.write_text('{"ωmega": "ß"}\n{"ωmega": "ßé"}\n', encoding="utf-8")
+        counts = cw.count_characters([corpus])
+        assert counts == {"ß": 2, "é": 1}
+
+    def test_plain_text_counts_everything(self, tmp_path):
+        corpus = tmp_path / "notes.txt"
+        corpus.write_text('{"ω"}', encoding="utf-8")
+        assert cw.count_characters([corpus])["ω"] == 1
+        assert cw.count_characters([corpus])["{"] == 1
+
+    def test_min_count_drops_rare_characters(self, tmp_path):
+        counts = cw.collections.Counter({"ß": 5, "ω": 1, "\x07": 9})
+        chars = cw.build_character_set(counts, min_count=2)
+        assert "ß" in chars
+        assert "ω" not in chars
+        assert "\x07" not in chars
+        assert "a" in chars  # printable ASCII is always kept
+
+
+# ─── Unicode-range slices ────────────────────────────────────────────────────
+
+def _make_cmap_font(path: Path, codepoints: list[int]) -> Path:
+    """Save a tiny TTF mapping each codepoint to its own empty glyph."""
+    from fontTools.fontBuilder import FontBuilder
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+    names = [".notdef", *(f"uni{cp:04X}" for cp in codepoints)]
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder(names)
+    fb.setupCharacterMap({cp: f"uni{cp:04X}" for cp in codepoints})
+    fb.setupGlyf({name: TTGlyphPen(None).glyph() for name in names})
+    fb.setupHorizontalMetrics({name: (500, 0) for name in names})
+    fb.setupHorizontalHeader(ascent=800, descent=-200)
+    fb.setupNameTable({"familyName": "Test", "styleName": "Regular"})
+    fb.setupOS2()
+    fb.setupPost()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fb.save(str(path))
+    return path
+
+
+class TestUnicodeRangeSlices:
+    def test_parse_unicode_range(self):
+        assert cw.parse_unicode_range("U+0041-0043, U+00e9") == {0x41, 0x42, 0x43, 0xE9}
+
+    def test_every_split_subset_has_a_range(self):
+        assert set(cw.COMMON_SUBSETS) <= set(cw.SPLIT_SUBSETS)
+        assert set(cw.SPLIT_SUBSETS) <= set(cw.SUBSET_RANGES)
+
+    def test_format_unicode_range(self):
+        codepoints = {0x41, 0x42, 0x43, 0xE9, 0x2190, 0xE000, 0xE001}
+        text = cw.format_unicode_range(codepoints)
+        assert text == "U+0041-0043, U+00E9, U+2190, U+E000-E001"
+        assert cw.parse_unicode_range(text) == codepoints
+
+    @pytest.fixture
+    def family(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(cw, "FAMILY_DATA", {"EasyType Sans": {}})
+        monkeypatch.setattr(
+            cw, "FAMILY_STYLES", [{"suffix": "Regular", "weight": 400, "style": "normal"}]
+        )
+        # Latin, Greek, Vietnamese, an arrow outside every range and a PUA alternate.
+        cmap = [0x41, 0x3B1, 0x1EA0, 0x2190, 0xE000]
+        _make_cmap_font(tmp_path / "ttf" / "EasyTypeSans-Regular.ttf", cmap)
+        return cmap
+
+    def test_slices_cover_the_whole_cmap(self, family, tmp_path):
+        tasks, faces = cw.split_tasks(tmp_path / "ttf", tmp_path / "web", OPTIONS)
+        assert [face["subset"] for face in faces] == ["latin", "greek", "vietnamese", "other"]
+        assert faces[-1]["unicode_range"] == "U+2190, U+E000"
+        covered = set().union(*(cw.parse_unicode_range(f["unicode_range"]) for f in faces))
+        assert set(family) <= covered
+
+    def test_slices_are_unhinted(self, family, tmp_path):
+        tasks, _ = cw.split_tasks(tmp_path / "ttf", tmp_path / "web", OPTIONS)
+        assert tasks
+        assert all(options.no_hinting and options.chars is None for _, _, options in tasks)
+        assert "--no-hinting" in cw.subset_args(*tasks[0][:2], tasks[0][2])
+
+    def test_uncovered_codepoints(self, tmp_path):
+        source = _make_cmap_font(tmp_path / "Full.ttf", [0x41, 0x3B1, 0x2190])
+        latin = _make_cmap_font(tmp_path / "Full.latin.ttf", [0x41])
+        greek = _make_cmap_font(tmp_path / "Full.greek.ttf", [0x3B1])
+        faces = [{"ttf": source, "woff2": latin}, {"ttf": source, "woff2": greek}]
+        assert cw.uncovered_codepoints(faces) == {source: {0x2190}}
+        arrows = _make_cmap_font(tmp_path / "Full.other.ttf", [0x2190])
+        assert cw.uncovered_codepoints([*faces, {"ttf": source, "woff2": arrows}]) == {}
+
+    def test_css_urls_are_relative_to_the_stylesheet(self, tmp_path):
+        css = tmp_path / "css" / "easytype.css"
+        faces = [{
+            "family": "EasyType Sans",
+            "subset": "greek",
+            "woff2": tmp_path / "fonts" / "web" / "EasyTypeSans-Regular.greek.woff2",
+            "ttf": tmp_path / "fonts" / "ttf" / "EasyTypeSans-Regular.ttf",
+            "weight": 400,
+            "style": "normal",
+            "unicode_range": cw.SUBSET_RANGES["greek"],
+        }]
+        text = cw.font_face_css(faces, css)
+        assert "url('../fonts/web/EasyTypeSans-Regular.greek.woff2') format('woff2')" in text
+        assert "url('../fonts/ttf/EasyTypeSans-Regular.ttf') format('truetype')" in text
+        assert f"unicode-range: {cw.SUBSET_RANGES['greek']};" in text
+
+    def test_cli_exits_non_zero_when_slices_miss_codepoints(self, family, tmp_path, monkeypatch):
+        css = tmp_path / "easytype.css"
+        monkeypatch.setattr(cw, "subset_fonts", lambda tasks, **kw: [])
+        monkeypatch.setattr(cw, "record_sizes", lambda *a: None)
+        monkeypatch.setattr(
+            cw, "uncovered_codepoints", lambda faces: {faces[0]["ttf"]: {0x2190}}
+        )
+        monkeypatch.setattr(sys, "argv", [
+            "compress_webfonts.py", "--split-subsets", "--in-process",
+            "--ttf-dir", str(tmp_path / "ttf"), "--fonts-dir", str(tmp_path / "web"),
+            "--css", str(css),
+        ])
+        with pytest.raises(SystemExit) as exc:
+            cw.main()
+        assert "not fully covered" in str(exc.value)
+        assert not css.exists()
+
+
+# ─── Build report sizes ──────────────────────────────────────────────────────
+
+class TestRecordSizes:
+    def test_updates_only_the_rewritten_entries(self, tmp_path):
+        report = tmp_path / "fonts" / "build_report.json"
+        report.parent.mkdir()
+        report.write_text(json.dumps({
+            "families": {"Test": ["Regular"]},
+            "sizes": {"ttf/Test-Regular.ttf": {"bytes": 1, "tables": {}}},
+        }))
+        font = _make_cmap_font(tmp_path / "fonts" / "web" / "Test-Regular.woff2", [0x41])
+        cw.record_sizes(report, [font])
+        data = json.loads(report.read_text())
+        assert data["families"] == {"Test": ["Regular"]}
+        assert data["sizes"]["ttf/Test-Regular.ttf"] == {"bytes": 1, "tables": {}}
+        assert data["sizes"]["web/Test-Regular.woff2"]["bytes"] == font.stat().st_size
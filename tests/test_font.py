@@ -6,7 +6,10 @@ Run with:
 """
 from __future__ import annotations
 
+import copy
 import io
+import json
+import logging
 import os
 import sys
 import tempfile
@@ -58,6 +61,75 @@ def _make_minimal_ttfont(upm: int = 1000) -> ft.TTFont:
     return ft.TTFont(buf)
 
 
+def _make_outline_ttfont() -> ft.TTFont:
+    """A font with real contours, including a glyph shared by two codepoints."""
+    from fontTools.fontBuilder import FontBuilder
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+    def outline(x0, y0, x1, y1, notch):
+        pen = TTGlyphPen(None)
+        pen.moveTo((x0, y0)); pen.lineTo((x0, y1)); pen.lineTo((x1, y1))
+        pen.lineTo((x1, y0)); pen.closePath()
+        pen.moveTo((x0 + notch, y0 + notch)); pen.qCurveTo((x0 + 3 * notch, y1 - notch), (x1 - notch, y0 + notch))
+        pen.closePath()
+        return pen.glyph()
+
+    cmap = {
+        0x41: "A", 0x61: "a", 0x62: "b", 0x6D: "m", 0x03BC: "m",
+        0x70: "p", 0x71: "q", 0x64: "d", 0x39: "nine", 0x0431: "be",
+    }
+    names = [".notdef", *dict.fromkeys(cmap.values())]
+    glyphs = {".notdef": _empty_glyph()}
+    for i, name in enumerate(names[1:]):
+        glyphs[name] = outline(40 + i, -180 + 7 * i, 530 + 13 * i, 730 - 11 * i, 37 + i)
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder(names)
+    fb.setupCharacterMap(cmap)
+    fb.setupGlyf(glyphs)
+    fb.setupHorizontalMetrics({n: (600, 40) for n in names})
+    fb.setupHorizontalHeader(ascent=800, descent=-200)
+    fb.setupNameTable({"familyName": "Test", "styleName": "Regular"})
+    fb.setupOS2(sTypoAscender=800, sTypoDescender=-200, sTypoLineGap=0,
+                usWinAscent=900, usWinDescent=200,
+                sxHeight=500, sCapHeight=700, fsType=0)
+    fb.setupPost()
+    fb.setupHead(unitsPerEm=1000)
+    buf = io.BytesIO()
+    fb.font.save(buf)
+    buf.seek(0)
+    return ft.TTFont(buf)
+
+
+def _outline_state(tt: ft.TTFont) -> dict[str, list]:
+    glyf = tt["glyf"]
+    return {
+        name: list(glyf[name].getCoordinates(glyf)[0])
+        for name in tt.getGlyphOrder()
+    }
+
+
+# ─── Startup ──────────────────────────────────────────────────────────────────
+
+class TestLazyStartup:
+    def test_import_defers_heavy_modules(self):
+        import subprocess
+        code = (
+            "import sys; sys.path.insert(0, sys.argv[1]); import font; "
+            "print(sorted(m for m in ('numpy', 'requests', 'fontTools') if m in sys.modules))"
+        )
+        tools = os.path.join(os.path.dirname(__file__), "..", "Generator Tools")
+        out = subprocess.run(
+            [sys.executable, "-c", code, tools], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "[]"
+
+    def test_lazy_attributes_resolve(self):
+        from fontTools.ttLib import TTFont
+        assert ft.TTFont is TTFont
+        with pytest.raises(AttributeError):
+            ft.not_a_name
+
+
 # ─── StemPosition Enum ────────────────────────────────────────────────────────
 
 class TestStemPositionEnum:
@@ -130,6 +202,134 @@ class TestInterZipValidation:
             ft.INTER_ZIP_CACHE = original
 
 
+def _zip_bytes() -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("Inter-4.1/Inter-Regular.ttf", b"x" * 50_000)
+    return buf.getvalue()
+
+
+class _FakeResponse:
+    """Just enough of requests.Response for download_inter_zip."""
+
+    def __init__(self, status_code: int, body: bytes = b""):
+        self.status_code, self._body = status_code, body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise ft.requests.HTTPError(str(self.status_code))
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self._body), chunk_size):
+            yield self._body[i:i + chunk_size]
+
+
+class TestInterFetch:
+    @pytest.fixture(autouse=True)
+    def cache(self, tmp_path, monkeypatch):
+        path = tmp_path / "cache" / "Inter-4.1.zip"
+        path.parent.mkdir()
+        monkeypatch.setattr(ft, "INTER_ZIP_CACHE", str(path))
+        monkeypatch.delenv("INTER_MIRROR", raising=False)
+        monkeypatch.delenv("INTER_SHA256", raising=False)
+        return path
+
+    def test_sidecar_skips_reverification(self, cache, monkeypatch):
+        cache.write_bytes(_zip_bytes())
+        assert ft._inter_zip_is_valid()
+        monkeypatch.setattr(ft, "_verify_inter_zip", lambda path: pytest.fail("re-verified"))
+        assert ft._inter_zip_is_valid()
+
+    def test_changed_file_is_reverified(self, cache):
+        cache.write_bytes(_zip_bytes())
+        assert ft._inter_zip_is_valid()
+        cache.write_bytes(b"not a zip")
+        assert not ft._inter_zip_is_valid()
+
+    def test_mirror_directory_and_file_url(self, cache, tmp_path, monkeypatch):
+        mirror = tmp_path / "mirror"
+        mirror.mkdir()
+        (mirror / "Inter-4.1.zip").write_bytes(_zip_bytes())
+        monkeypatch.setattr(ft.requests, "get", lambda *a, **k: pytest.fail("network"))
+        for source in (str(mirror), (mirror / "Inter-4.1.zip").as_uri()):
+            monkeypatch.setenv("INTER_MIRROR", source)
+            cache.unlink(missing_ok=True)
+            assert ft.download_inter_zip() == str(cache)
+            assert cache.read_bytes() == _zip_bytes()
+
+    def test_pinned_hash_mismatch_is_rejected(self, cache, tmp_path, monkeypatch):
+        mirror = tmp_path / "Inter-4.1.zip"
+        mirror.write_bytes(_zip_bytes())
+        monkeypatch.setenv("INTER_MIRROR", str(mirror))
+        monkeypatch.setenv("INTER_SHA256", "0" * 64)
+        with pytest.raises(RuntimeError):
+            ft.download_inter_zip()
+        assert not cache.exists() and not os.path.exists(str(cache) + ".part")
+
+    def test_range_resume_appends_to_part_file(self, cache, monkeypatch):
+        import hashlib
+        data = _zip_bytes()
+        half = len(data) // 2
+        (cache.parent / "Inter-4.1.zip.part").write_bytes(data[:half])
+        monkeypatch.setenv("INTER_SHA256", hashlib.sha256(data).hexdigest())
+        requested = []
+
+        def fake_get(url, stream, headers, timeout):
+            requested.append(headers.get("Range"))
+            return _FakeResponse(206, data[half:])
+
+        monkeypatch.setattr(ft.requests, "get", fake_get)
+        ft.download_inter_zip()
+        assert requested == [f"bytes={half}-"]
+        assert cache.read_bytes() == data
+
+
+class TestExtractBases:
+    @pytest.fixture(autouse=True)
+    def layout(self, tmp_path, monkeypatch):
+        members = {name: name.encode() * 5_000 for name in ft.BASES.values()}
+        zip_path = tmp_path / "Inter-4.1.zip"
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("Inter-4.1/LICENSE.txt", b"OFL")
+            for name, data in members.items():
+                zf.writestr(f"Inter-4.1/extras/ttf/{name}", data)
+        monkeypatch.setattr(ft, "INTER_ZIP_CACHE", str(zip_path))
+        monkeypatch.setattr(ft, "BASECACHE", str(tmp_path))
+        monkeypatch.delenv("INTER_SHA256", raising=False)
+        return members
+
+    def test_extracts_every_style_in_one_pass(self, layout, tmp_path):
+        paths = ft.extract_bases(ft.BASES.values())
+        assert set(paths) == set(layout)
+        for name, data in layout.items():
+            assert paths[name] == str(tmp_path / name)
+            assert (tmp_path / name).read_bytes() == data
+
+    def test_only_mismatched_files_are_replaced(self, layout, tmp_path, monkeypatch):
+        ft.extract_bases(ft.BASES.values())
+        regular = tmp_path / "Inter-Regular.ttf"
+        regular.write_bytes(b"?" * len(layout["Inter-Regular.ttf"]))  # same size, bad CRC
+        extracted = []
+        real = ft._extract_member
+        monkeypatch.setattr(
+            ft, "_extract_member",
+            lambda zf, info, dest: (extracted.append(os.path.basename(dest)), real(zf, info, dest)),
+        )
+        ft.extract_bases(ft.BASES.values())
+        assert extracted == ["Inter-Regular.ttf"]
+        assert regular.read_bytes() == layout["Inter-Regular.ttf"]
+
+    def test_missing_member_is_reported(self):
+        with pytest.raises(FileNotFoundError, match="Inter-Thin.ttf"):
+            ft.extract_bases(["Inter-Regular.ttf", "Inter-Thin.ttf"])
+
+
 # ─── Comfort spacing ──────────────────────────────────────────────────────────
 
 class TestApplyComfortSpacing:
@@ -212,6 +412,20 @@ class TestWoff2BinaryDetection:
         if calls:  # may be skipped if file doesn't exist
             assert calls[0][0] == str(fake_bin)
 
+    def test_in_process_encoder_from_bytes(self, monkeypatch, tmp_path, caplog):
+        pytest.importorskip("brotli")
+        caplog.set_level(logging.INFO)
+        monkeypatch.delenv("WOFF2_BIN", raising=False)
+        monkeypatch.setattr(ft, "OUT_WEB", str(tmp_path))
+        buf = io.BytesIO()
+        _make_minimal_ttfont().save(buf)
+        # The TTF path is never read when its bytes are supplied.
+        ft.compress_to_woff2(str(tmp_path / "missing" / "Fam-Regular.ttf"), buf.getvalue())
+        woff = ft.TTFont(str(tmp_path / "Fam-Regular.woff2"))
+        assert woff.flavor == "woff2"
+        assert woff.getGlyphOrder() == _make_minimal_ttfont().getGlyphOrder()
+        assert not [r for r in caplog.records if r.name == "fontTools.ttLib.woff2"]
+
     def test_no_hardcoded_homebrew_path(self):
         """Ensure no hard-coded /opt/homebrew or /usr/local paths exist in the source."""
         src = os.path.join(os.path.dirname(__file__), "..", "Generator Tools", "font.py")
@@ -238,3 +452,836 @@ class TestFamilyConfig:
             assert getattr(sans, attr) < getattr(focus, attr) < getattr(steady, attr), (
                 f"{attr}: expected Sans < Focus < Steady"
             )
+
+
+# ─── Vertical metrics snapshot ────────────────────────────────────────────────
+
+class TestMetricsSnapshot:
+    def test_apply_metrics_snapshot(self):
+        tt = _make_minimal_ttfont()
+        snap = ft.capture_metrics_snapshot(tt)
+        snap["OS/2"]["usWinAscent"] = 1234
+        snap["hhea"]["lineGap"] = 50
+        ft.apply_metrics_snapshot(tt, snap)
+        assert tt["OS/2"].usWinAscent == 1234
+        assert tt["hhea"].lineGap == 50
+
+
+# ─── Build scheduling ─────────────────────────────────────────────────────────
+
+class TestRunBuildTasks:
+    def test_regular_snapshot_feeds_other_styles(self, monkeypatch):
+        """Non-Regular styles receive their own family's Regular snapshot."""
+        seen: dict[tuple[str, str], object] = {}
+
+        def fake_task(family, style, cfg, src_path, opts, snapshot):
+            seen[(family, style)] = snapshot
+            snap = {"hhea": {"family": family}} if style == "Regular" else None
+            return family, style, {"style": style}, snap, None, []
+
+        monkeypatch.setattr(ft, "_build_style_task", fake_task)
+        import concurrent.futures
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+            reports = ft.run_build_tasks(
+                ft.FAMILIES, {s: s for s in ft.BASES}, ft.BuildOptions(), pool
+            )
+
+        assert set(reports) == set(ft.FAMILIES)
+        for family in ft.FAMILIES:
+            assert list(reports[family]) == list(ft.STYLE_WEIGHTS)
+            assert seen[(family, "Regular")] is None
+            for style in ("Italic", "Bold", "BoldItalic"):
+                assert seen[(family, style)] == {"hhea": {"family": family}}
+
+    def test_woff2_jobs_go_to_encoder_pool(self, monkeypatch):
+        def fake_task(family, style, cfg, src_path, opts, snapshot):
+            job = ft.Woff2Job(f"{family}-{style}.ttf", b"", None, {}, None)
+            return family, style, {"style": style}, None, job, []
+
+        encoded: list[str] = []
+        monkeypatch.setattr(ft, "_build_style_task", fake_task)
+        monkeypatch.setattr(ft, "finish_woff2_job", lambda job: encoded.append(job.out_ttf))
+        import concurrent.futures
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool, \
+             concurrent.futures.ThreadPoolExecutor(max_workers=2) as woff2_pool:
+            ft.run_build_tasks(
+                ft.FAMILIES, {s: s for s in ft.BASES}, ft.BuildOptions(), pool, woff2_pool
+            )
+        assert sorted(encoded) == sorted(
+            f"{family}-{style}.ttf" for family in ft.FAMILIES for style in ft.STYLE_WEIGHTS
+        )
+
+    def test_hint_jobs_flow_through_queue_to_encoder(self, monkeypatch):
+        def fake_task(family, style, cfg, src_path, opts, snapshot):
+            job = ft.HintJob(f"{family}-{style}.ttf", b"raw", None, {}, None)
+            return family, style, {"style": style}, None, job, []
+
+        encoded: list[str] = []
+        monkeypatch.setattr(ft, "_build_style_task", fake_task)
+        monkeypatch.setattr(
+            ft, "run_hint_job",
+            lambda job, samples=None: ft.Woff2Job(job.out_ttf, b"hinted", None, {}, None),
+        )
+        monkeypatch.setattr(ft, "finish_woff2_job", lambda job: encoded.append(job.out_ttf))
+        import concurrent.futures
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool, \
+             ft.HintQueue(2) as hint_queue:
+            ft.run_build_tasks(
+                ft.FAMILIES, {s: s for s in ft.BASES}, ft.BuildOptions(), pool,
+                hint_queue=hint_queue,
+            )
+        expected = {f"{family}-{style}.ttf" for family in ft.FAMILIES for style in ft.STYLE_WEIGHTS}
+        assert set(encoded) == expected and len(encoded) == len(expected)
+        assert set(hint_queue.timings) == expected
+        assert all(t["wait_s"] >= 0 and t["hint_s"] >= 0 for t in hint_queue.timings.values())
+
+    def test_stage_samples_are_tagged_and_collected(self, monkeypatch):
+        def fake_task(family, style, cfg, src_path, opts, snapshot):
+            samples: list[dict] = []
+            with ft.measure_stage(samples, "anchor"):
+                pass
+            job = ft.Woff2Job(f"{family}-{style}.ttf", b"", None, {}, None)
+            return family, style, {"style": style}, None, job, samples
+
+        def fake_finish(job):
+            samples: list[dict] = []
+            with ft.measure_stage(samples, "woff2"):
+                pass
+            return samples
+
+        monkeypatch.setattr(ft, "_build_style_task", fake_task)
+        monkeypatch.setattr(ft, "finish_woff2_job", fake_finish)
+        import concurrent.futures
+        samples: list[dict] = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool, \
+             concurrent.futures.ThreadPoolExecutor(max_workers=2) as woff2_pool:
+            ft.run_build_tasks(
+                ft.FAMILIES, {s: s for s in ft.BASES}, ft.BuildOptions(), pool,
+                woff2_pool, samples=samples,
+            )
+        assert len(samples) == 2 * len(ft.FAMILIES) * len(ft.STYLE_WEIGHTS)
+        timings = ft.summarize_timings(samples)
+        assert set(timings) == set(ft.FAMILIES)
+        for family in timings.values():
+            assert list(family["styles"]) == list(ft.STYLE_WEIGHTS)
+            for style in family["styles"].values():
+                assert set(style["stages"]) == {"anchor", "woff2"}
+                assert style["wall_s"] >= 0 and style["cpu_s"] >= 0
+
+    def test_real_process_pools_with_hint_queue(self, tmp_path, monkeypatch):
+        """Every pool worker is forked before ttfautohint pipes are opened."""
+        import concurrent.futures
+        import multiprocessing
+
+        base = str(tmp_path / "base.ttf")
+        _make_outline_ttfont().save(base)
+        monkeypatch.setattr(ft, "OUT_TTF", str(tmp_path / "ttf"))
+        monkeypatch.setattr(ft, "OUT_WEB", str(tmp_path / "web"))
+        os.makedirs(ft.OUT_TTF)
+        os.makedirs(ft.OUT_WEB)
+
+        class CheckedHintQueue(ft.HintQueue):
+            def submit(self, job):
+                # Fail before the pipe opens rather than hang on it.
+                assert len(multiprocessing.active_children()) == 4
+                return super().submit(job)
+
+        families = {"EasyType Sans": ft.FAMILIES["EasyType Sans"]}
+        opts     = ft.BuildOptions(use_cache=False)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=2) as pool, \
+             concurrent.futures.ProcessPoolExecutor(max_workers=2) as woff2_pool, \
+             CheckedHintQueue(2) as hint_queue:
+            reports = ft.run_build_tasks(
+                families, {s: base for s in ft.BASES}, opts, pool, woff2_pool, hint_queue
+            )
+        assert list(reports["EasyType Sans"]) == list(ft.STYLE_WEIGHTS)
+        assert len(hint_queue.timings) == len(ft.STYLE_WEIGHTS)
+        assert sorted(os.listdir(ft.OUT_WEB)) == sorted(
+            f"EasyTypeSans-{style}.woff2" for style in ft.STYLE_WEIGHTS
+        )
+
+
+# ─── Instrumentation ──────────────────────────────────────────────────────────
+
+class TestStageTimings:
+    def test_measure_stage_records_sample(self):
+        samples: list[dict] = []
+        with ft.measure_stage(samples, "bake"):
+            sum(range(10_000))
+        (sample,) = samples
+        assert sample["stage"] == "bake"
+        assert sample["wall_s"] >= 0 and sample["cpu_s"] >= 0
+        assert sample["pid"] == os.getpid()
+
+    def test_measure_stage_without_samples_is_noop(self):
+        with ft.measure_stage(None, "bake"):
+            pass
+
+    def test_chrome_trace(self, tmp_path):
+        samples: list[dict] = []
+        for stage in ("bake", "anchor"):
+            with ft.measure_stage(samples, stage):
+                pass
+        for sample in samples:
+            sample.update(family="EasyType Sans", style="Regular")
+        path = tmp_path / "trace.json"
+        ft.write_chrome_trace(samples, str(path))
+        events = [
+            e for e in json.loads(path.read_text())["traceEvents"] if e["ph"] == "X"
+        ]
+        assert [e["name"] for e in events] == ["bake", "anchor"]
+        assert events[0]["ts"] == 0
+        assert all(e["args"]["style"] == "Regular" for e in events)
+
+
+# ─── Build cache ──────────────────────────────────────────────────────────────
+
+class TestBuildCache:
+    def _key(self, src, cfg, **kw):
+        return ft.build_cache_key(
+            str(src), "EasyType Sans", "Regular", cfg, ft.BuildOptions(), None, **kw
+        )
+
+    def test_key_tracks_config_and_params(self, tmp_path, monkeypatch):
+        src = tmp_path / "base.ttf"
+        src.write_bytes(b"base")
+        cfg = ft.FAMILIES["EasyType Sans"]
+        key = self._key(src, cfg)
+        assert key == self._key(src, cfg)
+
+        tweaked = ft.FamilyConfig(**{**ft.asdict(cfg), "letter_spacing": 1.07})
+        assert self._key(src, tweaked) != key
+
+        micro = dict(ft.FONT_PARAMS["micro_spacing_em"], m=0.02)
+        monkeypatch.setitem(ft.FONT_PARAMS, "micro_spacing_em", micro)
+        assert self._key(src, cfg) != key
+
+    def test_store_and_restore_round_trip(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(ft, "BUILD_CACHE", str(tmp_path / "cache"))
+        monkeypatch.setattr(ft, "OUT_WEB", str(tmp_path))
+        out_ttf = tmp_path / "Fam-Regular.ttf"
+        out_ttf.write_bytes(b"ttf-bytes")
+        (tmp_path / "Fam-Regular.woff2").write_bytes(b"woff2-bytes")
+
+        assert ft.restore_cached_outputs("k", str(out_ttf)) is None
+        ft.store_cached_outputs("k", str(out_ttf), {"glyph_count": 4}, {"hhea": {}})
+        out_ttf.write_bytes(b"stale")
+        (tmp_path / "Fam-Regular.woff2").unlink()
+
+        report, snapshot = ft.restore_cached_outputs("k", str(out_ttf))
+        assert report == {"glyph_count": 4}
+        assert snapshot == {"hhea": {}}
+        assert out_ttf.read_bytes() == b"ttf-bytes"
+        assert (tmp_path / "Fam-Regular.woff2").read_bytes() == b"woff2-bytes"
+
+
+# ─── Stage cache ──────────────────────────────────────────────────────────────
+
+class TestStageCache:
+    def _job(self, **cfg_changes):
+        cfg = ft.FamilyConfig(**{**ft.asdict(ft.FAMILIES["EasyType Sans"]), **cfg_changes})
+        return ft.StyleJob("EasyType Sans", "Regular", "Regular", 400, cfg)
+
+    def _src(self, tmp_path):
+        src = tmp_path / "base.ttf"
+        _make_minimal_ttfont().save(str(src))
+        return str(src)
+
+    def test_keys_change_from_first_affected_stage(self, tmp_path):
+        src = self._src(tmp_path)
+        names = [stage.name for stage in ft.BUILD_STAGES]
+        before = ft.stage_keys(src, self._job())
+        after  = ft.stage_keys(src, self._job(letter_spacing=1.5))
+        first  = names.index("spacing")
+        assert before[:first] == after[:first]
+        assert all(a != b for a, b in zip(before[first:], after[first:]))
+
+    def test_resume_after_last_checkpoint(self, tmp_path):
+        src  = self._src(tmp_path)
+        job  = self._job()
+        keys = ft.stage_keys(src, job)
+        idx  = [s.name for s in ft.BUILD_STAGES].index("x-height")
+        assert ft.BUILD_STAGES[idx].checkpoint
+
+        tt = ft.TTFont(src)
+        tt["hmtx"].metrics["A"] = (777, 50)
+        cache = str(tmp_path / "stages")
+        ft.save_stage_snapshot(tt, ft._stage_snapshot_path(cache, job, idx, keys[idx]))
+
+        resumed, start = ft.resume_from_stage_cache(src, job, keys, cache)
+        assert start == idx + 1
+        assert resumed["hmtx"].metrics["A"] == (777, 50)
+        assert resumed["OS/2"].sxHeight == 500  # untouched table from the base
+
+        other = ft.stage_keys(src, self._job(xheight_factor=1.2))
+        _, start = ft.resume_from_stage_cache(src, job, other, cache)
+        assert start == 0
+
+
+# ─── Base font pool ───────────────────────────────────────────────────────────
+
+class TestBaseFontPool:
+    def test_copies_are_independent(self, tmp_path):
+        src = str(tmp_path / "base.ttf")
+        _make_minimal_ttfont().save(src)
+        pool = ft.BaseFontPool()
+        first, second = pool.get(src), pool.get(src)
+        first["hmtx"].metrics["A"] = (999, 0)
+        first["OS/2"].sxHeight = 1
+        assert second["hmtx"].metrics["A"] == (600, 50)
+        assert pool.get(src)["OS/2"].sxHeight == 500
+
+    def test_file_parsed_once(self, tmp_path, monkeypatch):
+        src = str(tmp_path / "base.ttf")
+        _make_minimal_ttfont().save(src)
+        pool  = ft.BaseFontPool()
+        calls = []
+        real  = ft.TTFont
+        monkeypatch.setattr(
+            "fontTools.ttLib.TTFont", lambda *a, **kw: calls.append(a) or real(*a, **kw)
+        )
+        pool.preload([src])
+        parsed = len(calls)
+        for _ in range(3):
+            tt = pool.get(src)
+            assert tt.getBestCmap()[65] == "A"
+        assert parsed == 1
+        # Each copy only opens a table-directory reader over cached bytes.
+        assert len(calls) == parsed + 3
+
+
+# ─── In-memory save path ──────────────────────────────────────────────────────
+
+class TestWriteFont:
+    def test_single_write_with_fixups(self, tmp_path, monkeypatch):
+        out = tmp_path / "Out-Regular.ttf"
+        saves = []
+        real_save = ft.TTFont.save
+        monkeypatch.setattr(
+            ft.TTFont, "save",
+            lambda self, f, *a, **kw: saves.append(f) or real_save(self, f, *a, **kw),
+        )
+        final = ft.write_font(_make_minimal_ttfont(), str(out), hinting_enabled=False)
+
+        # Compile and re-serialise happen in memory; only the final bytes hit disk.
+        assert saves and all(isinstance(f, ft.io.BytesIO) for f in saves)
+        assert [p.name for p in tmp_path.iterdir()] == [out.name]
+        assert final["head"].flags & (1 << 3)
+        assert final["OS/2"].usWinAscent >= ft.FONT_PARAMS["win_ascent_min"]
+        on_disk = ft.TTFont(str(out))
+        assert on_disk["OS/2"].xAvgCharWidth == final["OS/2"].xAvgCharWidth
+
+    def test_auto_hint_disabled_returns_none(self):
+        assert ft.auto_hint(b"font", "x.ttf", enabled=False) is None
+
+
+class TestHintCache:
+    @staticmethod
+    def _data(tt: ft.TTFont) -> bytes:
+        buf = io.BytesIO()
+        tt.save(buf)
+        return buf.getvalue()
+
+    @staticmethod
+    def _fake_hint(calls):
+        def hint(data, label, enabled=True):
+            from fontTools.ttLib import newTable
+            from fontTools.ttLib.tables.ttProgram import Program
+            calls.append(label)
+            tt = ft.TTFont(io.BytesIO(data))
+            tt["prep"] = newTable("prep")
+            tt["prep"].program = Program()
+            tt["prep"].program.fromBytecode(b"\xb0\x01")
+            return TestHintCache._data(tt)
+        return hint
+
+    def test_key_ignores_naming_but_tracks_outlines(self):
+        tt  = _make_outline_ttfont()
+        key = ft.hint_cache_key(self._data(tt))
+        tt["head"].fontRevision = 2.5
+        tt["name"].setName("Renamed", 1, 3, 1, 0x409)
+        assert ft.hint_cache_key(self._data(tt)) == key
+        ft.apply_optical_anchor(tt, 0.18, 0.5)
+        assert ft.hint_cache_key(self._data(tt)) != key
+
+    def test_cached_hints_grafted_onto_renamed_font(self, tmp_path, monkeypatch):
+        calls: list[str] = []
+        monkeypatch.setattr(ft, "auto_hint", self._fake_hint(calls))
+        tt    = _make_outline_ttfont()
+        original = self._data(tt)
+        hinted   = ft.hint_font_data(original, "a.ttf", str(tmp_path))
+        _, first = ft.finish_font_data(original, hinted)
+        tt["name"].setName("Renamed", 1, 3, 1, 0x409)
+        renamed   = self._data(tt)
+        _, second = ft.finish_font_data(
+            renamed, ft.hint_font_data(renamed, "b.ttf", str(tmp_path))
+        )
+
+        assert calls == ["a.ttf"]
+        out = ft.TTFont(io.BytesIO(second))
+        assert out["prep"].program.getBytecode() == b"\xb0\x01"
+        assert out["name"].getName(1, 3, 1, 0x409).toUnicode() == "Renamed"
+        # A hit matches what a cold run on the renamed font produces.
+        _, cold = ft.finish_font_data(
+            renamed, ft.hint_font_data(renamed, "c.ttf", None)
+        )
+        assert second == cold and first != second
+
+
+# ─── Vectorized transforms ────────────────────────────────────────────────────
+
+class TestVectorizedTransforms:
+    @pytest.fixture(autouse=True)
+    def _needs_numpy(self):
+        pytest.importorskip("numpy")
+
+    def _both(self, monkeypatch, transform):
+        fast = _make_outline_ttfont()
+        transform(fast)
+        slow = _make_outline_ttfont()
+        with monkeypatch.context() as m:
+            m.setattr(ft, "np", None)
+            transform(slow)
+        return fast, slow
+
+    def test_anchor_bit_identical(self, monkeypatch):
+        fast, slow = self._both(
+            monkeypatch, lambda tt: ft.apply_optical_anchor(tt, 0.18, 0.55)
+        )
+        assert _outline_state(fast) == _outline_state(slow)
+        assert _outline_state(fast) != _outline_state(_make_outline_ttfont())
+
+    def test_xheight_bit_identical(self, monkeypatch):
+        fast, slow = self._both(monkeypatch, lambda tt: ft.raise_xheight(tt, 1.1))
+        assert _outline_state(fast) == _outline_state(slow)
+        assert fast["OS/2"].sxHeight == slow["OS/2"].sxHeight == 550
+
+    def test_shared_glyph_transformed_per_codepoint(self, monkeypatch):
+        """'m' is mapped from U+006D and U+03BC, so it is anchored twice."""
+        fast, slow = self._both(
+            monkeypatch, lambda tt: ft.apply_optical_anchor(tt, 0.18, 1.0)
+        )
+        once = _make_outline_ttfont()
+        for table in once["cmap"].tables:
+            table.cmap.pop(0x03BC, None)
+        ft.apply_optical_anchor(once, 0.18, 1.0)
+        assert _outline_state(fast)["m"] == _outline_state(slow)["m"]
+        assert _outline_state(fast)["m"] != _outline_state(once)["m"]
+
+
+class TestCodepointIndex:
+    def test_classification(self):
+        index = ft.codepoint_index({0x00E1: "aacute", 0x03B2: "beta", 0x2192: "arrow"})
+        aacute, beta, arrow = index[0x00E1], index[0x03B2], index[0x2192]
+        assert (aacute.block, aacute.base, aacute.lower) == ("latin", "a", True)
+        assert aacute.anchor_strength == ft.FONT_PARAMS["anchor_lc"]["a"]
+        assert beta.block == "greek"
+        assert beta.anchor_strength == ft.FONT_PARAMS["anchor_lc"]["b"]
+        assert arrow.block is None and arrow.anchor_strength is None
+
+    def test_reused_across_cmaps_and_tracks_params(self, monkeypatch):
+        cmap = {0x6D: "m", 0x41: "A"}
+        assert ft.codepoint_index(cmap) is ft.codepoint_index(dict(cmap))
+        micro = dict(ft.FONT_PARAMS["micro_spacing_em"], m=0.02)
+        monkeypatch.setitem(ft.FONT_PARAMS, "micro_spacing_em", micro)
+        assert ft.codepoint_index(cmap)[0x6D].micro_spacing == 0.02
+
+
+class TestCloneGlyphs:
+    def test_case_pairs_cloned_in_one_batch(self):
+        tt     = _make_outline_ttfont()
+        before = list(tt.getGlyphOrder())
+        ft.ensure_case_pairs(tt)
+        added  = tt.getGlyphOrder()[len(before):]
+        assert sorted(added) == ["uni0042", "uni0044", "uni004D", "uni0050",
+                                 "uni0051", "uni039C", "uni0411"]
+        assert tt["glyf"].glyphOrder == tt.getGlyphOrder()
+        for table in tt["cmap"].tables:
+            assert table.cmap[0x0411] == "uni0411"
+        assert tt["hmtx"].metrics["uni0042"] == tt["hmtx"].metrics["b"]
+        assert _outline_state(tt)["uni0042"] == _outline_state(tt)["b"]
+
+    def test_first_clone_per_codepoint_wins(self):
+        tt = _make_outline_ttfont()
+        n  = ft.clone_glyphs(tt, [
+            ("b", "uni0042", 0x42), ("d", "B.alt", 0x42),
+            ("missing", "uni0043", 0x43), ("p", "a", 0x45),
+        ])
+        assert n == 1
+        assert tt.getBestCmap()[0x42] == "uni0042"
+        assert 0x43 not in tt.getBestCmap() and 0x45 not in tt.getBestCmap()
+
+
+class TestFlattenComposites:
+    def _composite_font(self) -> ft.TTFont:
+        """'outer' (first in glyph order) nests 'inner', which nests 'b'.
+
+        'loop' repeats its start point at the end, which the pen drops.
+        """
+        from fontTools.ttLib.tables._g_l_y_f import Glyph, GlyphComponent
+
+        def composite(*parts):
+            g = Glyph()
+            g.numberOfContours = -1
+            g.components = []
+            for name, (xx, xy, yx, yy, dx, dy) in parts:
+                c = GlyphComponent()
+                c.glyphName, c.flags, c.x, c.y = name, 0x4, dx, dy
+                if (xx, xy, yx, yy) != (1, 0, 0, 1):
+                    c.transform = [[xx, xy], [yx, yy]]
+                g.components.append(c)
+            return g
+
+        tt   = _make_outline_ttfont()
+        glyf = tt["glyf"]
+        glyf.glyphs["inner"] = composite(
+            ("b", (0.7, 0, 0, 0.7, 13, -7)), ("a", (1, 0, 0, 1, 300, 40)),
+        )
+        glyf.glyphs["outer"] = composite(
+            ("inner", (0.866, 0.5, -0.5, 0.866, 57, 33)), ("m", (-1, 0, 0, 1, 600, 0)),
+        )
+        loop = Glyph()
+        loop.numberOfContours = 1
+        ft.set_coords(loop, [(0, 0), (0, 300), (200, 300), (0, 0)], [3], [1, 1, 1, 1])
+        glyf.glyphs["loop"] = loop
+        glyf.glyphs["shifted"] = composite(
+            ("d", (1, 0, 0, 1, 120, -15)), ("loop", (1, 0, 0, 1, 5, 5)),
+        )
+        order = tt.getGlyphOrder()
+        tt.setGlyphOrder([order[0], "outer", *order[1:], "inner", "loop", "shifted"])
+        return tt
+
+    def _reference(self, tt: ft.TTFont, gname: str) -> list:
+        from fontTools.pens.transformPen import TransformPen
+        from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+        def draw(name, pen, transform):
+            glyph = tt["glyf"][name]
+            if glyph.isComposite():
+                for comp in glyph.components:
+                    cname, ctrans = comp.getComponentInfo()
+                    draw(cname, pen, ft._compose_transforms(transform, ctrans))
+                return
+            glyph.draw(TransformPen(pen, transform), tt["glyf"])
+
+        pen = TTGlyphPen(None)
+        draw(gname, pen, ft.IDENTITY_TRANSFORM)
+        g = pen.glyph()
+        return [list(g.coordinates), list(g.flags), list(g.endPtsOfContours)]
+
+    def test_matches_pen_decomposition(self):
+        tt       = self._composite_font()
+        expected = {n: self._reference(tt, n) for n in ("outer", "inner", "shifted")}
+        ft.flatten_composites(tt)
+        glyf = tt["glyf"]
+        for name, ref in expected.items():
+            g = glyf[name]
+            assert not g.isComposite()
+            assert [list(g.coordinates), list(g.flags), list(g.endPtsOfContours)] == ref
+
+
+class TestFusedOutlinePass:
+    def _separate(self) -> ft.TTFont:
+        tt = _make_outline_ttfont()
+        ft.apply_optical_anchor(tt, 0.18, 0.55)
+        ft.apply_stem_shift_disambiguation(tt)
+        ft.raise_xheight(tt, 1.1)
+        return tt
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_matches_separate_passes(self, monkeypatch, use_numpy):
+        if use_numpy:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(ft, "np", None)
+        fused = _make_outline_ttfont()
+        ft.apply_outline_transforms(fused, 0.18, 0.55, 1.1)
+        separate = self._separate()
+        assert _outline_state(fused) == _outline_state(separate)
+        assert fused["OS/2"].sxHeight == separate["OS/2"].sxHeight
+
+
+    def test_fused_job_skips_the_separate_stages(self):
+        cfg   = ft.FAMILIES["EasyType Sans"]
+        job   = ft.StyleJob("EasyType Sans", "Regular", "Regular", 400, cfg, fused_glyph_pass=True)
+        tt    = _make_outline_ttfont()
+        state = _outline_state(tt)
+        stages = {stage.name: stage for stage in ft.BUILD_STAGES}
+        for name in ("stem-shift", "x-height"):
+            assert stages[name].run(tt, job) is None
+        assert _outline_state(tt) == state
+        job = ft.StyleJob("EasyType Sans", "Regular", "Regular", 400, cfg)
+        stages["x-height"].run(tt, job)
+        assert _outline_state(tt) != state
+
+
+# ─── Dry run ──────────────────────────────────────────────────────────────────
+
+class TestDryRun:
+    @pytest.fixture
+    def bases(self, tmp_path):
+        """The outline font plus an ss02 that bakes nine and offers a
+        d alternate taller than anything else, which pruning drops."""
+        from fontTools.feaLib.builder import addOpenTypeFeaturesFromString
+        from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+        tt  = _make_outline_ttfont()
+        pen = TTGlyphPen(None)
+        pen.moveTo((60, 0)); pen.lineTo((60, 1400)); pen.lineTo((500, 1400))
+        pen.lineTo((500, 0)); pen.closePath()
+        glyf = tt["glyf"]
+        extra = {"nine.ss02": copy.deepcopy(glyf["nine"]), "d.tall": pen.glyph()}
+        tt.setGlyphOrder(tt.getGlyphOrder() + list(extra))
+        for name, glyph in extra.items():
+            glyf[name] = glyph
+            tt["hmtx"][name] = (600, 40)
+        addOpenTypeFeaturesFromString(
+            tt, "feature ss02 { sub nine by nine.ss02; sub d from [d.tall]; } ss02;"
+        )
+        path = str(tmp_path / "base.ttf")
+        tt.save(path)
+        return {style: path for style in ft.STYLE_WEIGHTS}
+
+    def test_predicted_bounds_match_build(self, bases):
+        """Lowercase ascenders above the x-height set yMax once raised;
+        alternates only the baked features reached do not."""
+        facts = ft.read_base_facts(bases["Regular"])
+        tt = ft.TTFont(bases["Regular"])
+        ft.bake_disambiguation_defaults(tt)
+        ft.raise_xheight(tt, 1.1)
+        ft.flatten_composites(tt)
+        ft.prune_baked_layout(tt)
+        built = ft.TTFont(io.BytesIO(ft.compile_font(tt)))
+        assert "d.tall" not in built.getGlyphOrder()
+        assert facts.kept == frozenset(built.getGlyphOrder())
+        assert ft.predict_y_bounds(facts, 1.1) == (built["head"].yMin, built["head"].yMax)
+        assert ft.predict_y_bounds(facts, 1.1)[1] > facts.simple["A"][1]
+
+    def test_reports_snapshot_and_missing_stems(self, bases):
+        results = ft.dry_run({"EasyType Sans": ft.FAMILIES["EasyType Sans"]}, bases)
+        family  = results["EasyType Sans"]
+        assert family["metrics_snapshot"]["OS/2"]["usWinAscent"] >= 900
+        regular = family["styles"]["Regular"]
+        assert regular["xHeight"] == round(500 * ft.FAMILIES["EasyType Sans"].xheight_factor)
+        assert "U+0062" not in regular["stem_shift_missing"]
+        assert "U+03C1" in regular["stem_shift_missing"]
+
+    def test_proportion_failure_raises(self, bases):
+        import dataclasses
+        cfg = dataclasses.replace(ft.FAMILIES["EasyType Sans"], xheight_factor=1.4)
+        with pytest.raises(ValueError, match="Proportion fail"):
+            ft.dry_run({"Broken": cfg}, bases)
+
+
+# ─── Benchmark harness ────────────────────────────────────────────────────────
+
+class TestBenchmarkHarness:
+    @pytest.fixture
+    def bench(self, monkeypatch):
+        monkeypatch.syspath_prepend(os.path.join(os.path.dirname(__file__), "..", "bench"))
+        import bench_font
+        return bench_font
+
+    def test_synthetic_font_nests_composites(self, bench, tmp_path):
+        path = bench.make_synthetic_font(str(tmp_path / "s.ttf"), 400, composite_depth=2)
+        tt   = ft.TTFont(path)
+        glyf = tt["glyf"]
+        assert len(tt.getGlyphOrder()) == 400
+        nested = [
+            name for name in tt.getGlyphOrder()
+            if glyf[name].isComposite()
+            and any(glyf[c.glyphName].isComposite() for c in glyf[name].components)
+        ]
+        assert nested
+        ft.flatten_composites(tt)
+        assert not any(glyf[name].isComposite() for name in tt.getGlyphOrder())
+
+    def test_compare_flags_only_real_regressions(self, bench):
+        baseline = {
+            "results": {"1000g-d2": {
+                "flatten_composites": {"median_s": 0.10},
+                "raise_xheight":      {"median_s": 0.001},
+                "build_one":          {"median_s": 1.00},
+            }},
+            "thresholds": {"build_one": 0.5},
+        }
+        results = {"1000g-d2": {
+            "flatten_composites": {"median_s": 0.13},   # +30%: regression
+            "raise_xheight":      {"median_s": 0.003},  # +200%, but under MIN_DELTA_S
+            "build_one":          {"median_s": 1.40},   # +40%, within its override
+        }}
+        regressions = bench.compare_results(results, baseline, threshold=0.2)
+        assert len(regressions) == 1 and "flatten_composites" in regressions[0]
+
+    def test_compare_uses_the_stored_threshold(self, bench):
+        baseline = {"threshold": 0.5,
+                    "results": {"1000g-d2": {"flatten_composites": {"median_s": 0.10}}}}
+        results  = {"1000g-d2": {"flatten_composites": {"median_s": 0.13}}}  # +30%
+        assert bench.compare_results(results, baseline) == []
+        assert len(bench.compare_results(results, baseline, threshold=0.2)) == 1
+        del baseline["threshold"]
+        assert len(bench.compare_results(results, baseline)) == 1
+
+
+# ─── Output sizes ─────────────────────────────────────────────────────────────
+
+class TestOutputSizes:
+    def _entry(self, size, **tables):
+        return {"bytes": size, "tables": {"glyf": size // 2, **tables}}
+
+    def test_compare_reports_exit_code(self, tmp_path):
+        old, new = tmp_path / "old.json", tmp_path / "new.json"
+        old.write_text(json.dumps({"sizes": {"a.ttf": self._entry(10_000)}}))
+        new.write_text(json.dumps({"sizes": {"a.ttf": self._entry(12_000)}}))
+        assert ft.compare_reports(str(old), str(new), 2.0) == 1
+        assert ft.compare_reports(str(old), str(new), 25.0) == 0
+        assert ft.compare_reports(str(tmp_path / "nope.json"), str(new), 2.0) == 1
+
+    def test_only_full_builds_rotate_the_report(self, tmp_path, monkeypatch):
+        report, prev = tmp_path / "build_report.json", tmp_path / "build_report.prev.json"
+        monkeypatch.setattr(ft, "BUILD_REPORT_PATH", str(report))
+        monkeypatch.setattr(ft, "PREV_REPORT_PATH", str(prev))
+        ft.write_build_report({"run": 1}, rotate=True)
+        ft.write_build_report({"run": 2}, rotate=True)
+        ft.write_build_report({"run": 3}, rotate=False)
+        assert json.loads(prev.read_text()) == {"run": 1}
+        assert json.loads(report.read_text()) == {"run": 3}
+
+
+# ─── Web profile ──────────────────────────────────────────────────────────────
+
+class TestWebProfile:
+    def _font_bytes(self) -> bytes:
+        from fontTools.fontBuilder import FontBuilder
+        from fontTools.ttLib import newTable
+        from fontTools.ttLib.tables import ttProgram
+
+        names = [".notdef", "I", "I.ss02", "l", "l.salt"]
+        fb = FontBuilder(1000, isTTF=True)
+        fb.setupGlyphOrder(names)
+        fb.setupCharacterMap({0x49: "I", 0x6C: "l"})
+        fb.setupGlyf({name: _empty_glyph() for name in names})
+        fb.setupHorizontalMetrics({name: (500, 0) for name in names})
+        fb.setupHorizontalHeader(ascent=800, descent=-200)
+        fb.setupNameTable({"familyName": "Test", "styleName": "Regular"})
+        fb.setupOS2(sTypoAscender=800, sTypoDescender=-200, usWinAscent=900, usWinDescent=200)
+        fb.setupPost()
+        fb.addOpenTypeFeatures(
+            "feature ss02 { sub I by I.ss02; } ss02;\n"
+            "feature salt { sub l by l.salt; } salt;\n"
+        )
+        fpgm = newTable("fpgm")
+        fpgm.program = ttProgram.Program()
+        fpgm.program.fromBytecode(b"\xb0\x00")  # PUSHB[0] 0
+        fb.font["fpgm"] = fpgm
+        buf = io.BytesIO()
+        fb.font.save(buf)
+        return buf.getvalue()
+
+    def test_drops_hints_and_baked_alternates(self):
+        web = ft.TTFont(io.BytesIO(ft.web_font_data(self._font_bytes())))
+        assert "fpgm" not in web
+        # I.ss02 is only reachable through ss02; l.salt still is through salt.
+        assert len(web.getGlyphOrder()) == 4
+        features = {fr.FeatureTag for fr in web["GSUB"].table.FeatureList.FeatureRecord}
+        assert features == {"salt"}
+        assert set(web.getBestCmap()) == {0x49, 0x6C}
+        assert str(web["name"].getName(1, 3, 1, 0x409)) == "Test"
+
+    def test_keeps_what_the_layout_closure_keeps(self):
+        data = self._font_bytes()
+        web  = ft.TTFont(io.BytesIO(ft.web_font_data(data)))
+        kept = ft.layout_retained_glyphs(ft.TTFont(io.BytesIO(data)), ft.WEB_DROP_FEATURES)
+        assert len(web.getGlyphOrder()) == len(kept)
+
+    def test_woff2_job_encodes_web_data(self, monkeypatch):
+        encoded = []
+        monkeypatch.setattr(ft, "web_font_data", lambda data: b"web:" + data)
+        monkeypatch.setattr(ft, "compress_to_woff2", lambda path, data: encoded.append(data))
+        ft.finish_woff2_job(ft.Woff2Job("X-Regular.ttf", b"hinted", None, {}, None, b"raw"))
+        ft.finish_woff2_job(ft.Woff2Job("X-Regular.ttf", b"hinted", None, {}, None))
+        assert encoded == [b"web:raw", b"hinted"]
+
+
+# ─── Layout pruning ───────────────────────────────────────────────────────────
+
+class TestLayoutPruning:
+    def _font(self) -> ft.TTFont:
+        from fontTools.fontBuilder import FontBuilder
+
+        names = [".notdef", "I", "I.1", "l", "l.salt", "zero", "zero.1", "zero.ss07"]
+        fb = FontBuilder(1000, isTTF=True)
+        fb.setupGlyphOrder(names)
+        fb.setupCharacterMap({0x49: "I", 0x6C: "l", 0x30: "zero", 0xE00C: "I.1"})
+        fb.setupGlyf({name: _empty_glyph() for name in names})
+        fb.setupHorizontalMetrics({name: (500, 0) for name in names})
+        fb.setupHorizontalHeader(ascent=800, descent=-200)
+        fb.setupNameTable({"familyName": "Test", "styleName": "Regular"})
+        fb.setupOS2(sTypoAscender=800, sTypoDescender=-200, usWinAscent=900, usWinDescent=200)
+        fb.setupPost()
+        fb.addOpenTypeFeatures(
+            "feature ss02 { sub I by I.1; sub zero by zero.1; } ss02;\n"
+            "feature salt { sub I by I.1; sub l by l.salt; } salt;\n"
+            "feature ss07 { sub zero.1 by zero.ss07; } ss07;\n"
+            "feature aalt { sub I from [I.1]; } aalt;\n"
+        )
+        buf = io.BytesIO()
+        fb.font.save(buf)
+        buf.seek(0)
+        return ft.TTFont(buf)
+
+    def test_baked_features_and_orphans_are_dropped(self):
+        tt = self._font()
+        ft.prune_baked_layout(tt, frozenset({"ss02"}))
+        order = tt.getGlyphOrder()
+        # I.1 was only reachable through ss02, salt's I → I.1 and the PUA.
+        assert "I.1" not in order
+        assert tt.getBestCmap()[0xE00C] == "I"
+        # zero.1 was only reachable through ss02, so ss07's zero.1 →
+        # zero.ss07 goes with it; salt's l → l.salt stays.
+        assert "l.salt" in order
+        assert "zero.1" not in order and "zero.ss07" not in order
+        assert ft.layout_feature_tags(tt) == {"salt"}
+
+    def test_other_substitutions_are_kept(self):
+        tt = self._font()
+        ft.prune_baked_layout(tt, frozenset({"ss02"}))
+        gsub = tt["GSUB"].table
+        mappings = {}
+        for lookup in gsub.LookupList.Lookup:
+            for sub in lookup.SubTable:
+                mappings.update(getattr(sub, "mapping", {}))
+        assert mappings == {"l": "l.salt"}
+
+    def test_retained_glyphs_predict_the_pruned_font(self):
+        """Relies on fontTools.subset only through Subsetter's public API."""
+        pruned = self._font()
+        ft.prune_baked_layout(pruned, frozenset({"ss02"}))
+        kept = ft.layout_retained_glyphs(self._font(), frozenset({"ss02"}))
+        assert kept == frozenset(pruned.getGlyphOrder())
+        assert ft.layout_retained_glyphs(_make_minimal_ttfont()) is None
+
+    def test_failed_subset_keeps_the_name_table(self, monkeypatch):
+        from fontTools import subset
+
+        def fail(self, font):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(subset.Subsetter, "subset", fail)
+        tt = self._font()
+        with pytest.raises(RuntimeError):
+            ft.prune_baked_layout(tt, frozenset({"ss02"}))
+        assert tt["name"].getDebugName(1) == "Test"
+
+    def test_no_private_subsetter_api(self):
+        """A fontTools upgrade must not silently break the layout closure."""
+        import re
+        src = os.path.join(os.path.dirname(__file__), "..", "Generator Tools", "font.py")
+        with open(src, encoding="utf-8") as fh:
+            source = fh.read()
+        assert not re.findall(r"[Ss]ubsetter\._\w+", source)
+
+    def test_no_gsub_is_a_no_op(self):
+        tt = _make_minimal_ttfont()
+        ft.prune_baked_layout(tt)
+        assert tt.getGlyphOrder() == [".notdef", "A", "a", "zero"]
@@ -0,0 +1,59 @@
+"""
+Unit tests for the shared output-size accounting.
+
+Run with:
+    pytest tests/test_output_sizes.py -v
+"""
+from __future__ import annotations
+
+import os
+import sys
+
+# Make the Generator Tools modules importable without installing them.
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Generator Tools"))
+import output_sizes as osz  # noqa: E402 — must come after sys.path manipulation
+
+
+def _entry(size, **tables):
+    return {"bytes": size, "tables": {"glyf": size // 2, **tables}}
+
+
+def _save_font(path):
+    from fontTools.fontBuilder import FontBuilder
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+    pen = TTGlyphPen(None)
+    pen.moveTo((0, 0)); pen.lineTo((0, 500)); pen.lineTo((400, 0)); pen.closePath()
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder([".notdef", "A"])
+    fb.setupCharacterMap({0x41: "A"})
+    fb.setupGlyf({".notdef": TTGlyphPen(None).glyph(), "A": pen.glyph()})
+    fb.setupHorizontalMetrics({".notdef": (500, 0), "A": (500, 0)})
+    fb.setupHorizontalHeader(ascent=800, descent=-200)
+    fb.setupNameTable({"familyName": "Sizes", "styleName": "Regular"})
+    fb.setupOS2()
+    fb.setupPost()
+    fb.save(str(path))
+
+
+class TestOutputSizes:
+    def test_entry_breaks_out_tables(self, tmp_path):
+        path = tmp_path / "s.ttf"
+        _save_font(path)
+        entry = osz.output_size_entry(str(path))
+        assert entry["bytes"] == path.stat().st_size
+        assert entry["tables"]["glyf"] > 0 and entry["tables"]["other"] > 0
+        sizes = osz.collect_output_sizes([str(path), str(tmp_path / "missing.ttf")], str(tmp_path))
+        assert list(sizes) == ["s.ttf"]
+
+    def test_growth_past_budget_fails(self):
+        old = {"web/a.woff2": _entry(100_000),
+               "web/b.woff2": _entry(100_000),
+               "web/c.woff2": _entry(1_000)}
+        new = {"web/a.woff2": _entry(103_000, fpgm=4_000),  # +3%: over 2%
+               "web/b.woff2": _entry(101_000),              # +1%: within
+               "web/c.woff2": _entry(1_200),                # +20%, but tiny
+               "web/d.woff2": _entry(500_000)}              # new file
+        failures = osz.size_regressions(old, new, budget_pct=2.0)
+        assert len(failures) == 1
+        assert failures[0].startswith("web/a.woff2") and "fpgm +4000" in failures[0]